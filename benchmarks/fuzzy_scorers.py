@@ -0,0 +1,151 @@
+"""Benchmark the `fxgui.fxcore` scorers against each other.
+
+The dataset is 100k asset names of the kind a VFX pipeline lists: shot
+renders, published assets and their textures. It is generated from a fixed
+seed rather than shipped as a file, so every run scores the same names.
+
+Usage:
+    python benchmarks/fuzzy_scorers.py [--rows 100000] [--repeat 3]
+"""
+
+# Metadata
+__author__ = "Valentin Beaumont"
+__email__ = "valentin.onze@gmail.com"
+
+# Built-in
+import argparse
+import random
+import sys
+import time
+from typing import Callable, List
+
+# Third-party
+from qtpy.QtCore import QCoreApplication, QStringListModel
+
+# Internal
+from fxgui.fxcore import (
+    FXQuickRatioScorer,
+    FXSortFilterProxyModel,
+    FXSubsequenceScorer,
+    FXSubstringScorer,
+)
+
+
+SEED = 20_241
+QUERIES = ("hero", "hro_bdy", "comp_v012", "swrd", "0040_lgt", "diffuse")
+
+_SHOWS = ("abc", "nyx", "orb", "tlr", "vex")
+_DEPARTMENTS = ("anim", "comp", "fx", "lgt", "lay", "mm", "paint", "roto")
+_ELEMENTS = ("beauty", "bg", "crowd", "dust", "fg", "fire", "smoke", "water")
+_CATEGORIES = {
+    "character": ("hero", "villain", "sidekick", "soldier", "creature"),
+    "prop": ("sword", "shield", "chair", "lantern", "barrel", "rifle"),
+    "vehicle": ("car", "truck", "motorcycle", "spaceship", "boat"),
+    "environment": ("tree_oak", "tree_pine", "rock", "grass", "ruins"),
+}
+_PARTS = ("body", "head", "hands", "cloth", "hair", "base", "detail")
+_VARIANTS = ("default", "damaged", "wet", "dirty", "hero", "bg")
+_CHANNELS = ("diffuse", "specular", "roughness", "normal", "displacement")
+
+
+def asset_names(rows: int = 100_000, seed: int = SEED) -> List[str]:
+    """Return realistic VFX asset names, the same ones for the same seed.
+
+    Args:
+        rows: How many names to generate.
+        seed: The random seed.
+
+    Returns:
+        The names.
+    """
+
+    rng = random.Random(seed)
+    names = []
+    for _ in range(rows):
+        kind = rng.random()
+        if kind < 0.45:
+            names.append(
+                f"{rng.choice(_SHOWS)}_{rng.randrange(10, 400, 10):03d}"
+                f"_{rng.randrange(10, 3000, 10):04d}"
+                f"_{rng.choice(_DEPARTMENTS)}_{rng.choice(_ELEMENTS)}"
+                f"_v{rng.randint(1, 60):03d}"
+            )
+            continue
+
+        category = rng.choice(tuple(_CATEGORIES))
+        asset = (
+            f"{category}_{rng.choice(_CATEGORIES[category])}"
+            f"_{rng.choice(_PARTS)}"
+        )
+        if kind < 0.75:
+            names.append(
+                f"{asset}_{rng.choice(_VARIANTS)}_lod{rng.randint(0, 3)}"
+            )
+        else:
+            names.append(
+                f"{asset}_{rng.choice(_CHANNELS)}"
+                f"_{1001 + rng.randint(0, 20)}.exr"
+            )
+    return names
+
+
+def _best_of(repeat: int, function: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--ratio", type=float, default=0.5)
+    arguments = parser.parse_args(argv)
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    names = asset_names(arguments.rows)
+    lowered = [name.lower() for name in names]
+    model = QStringListModel(names)
+    scorers = (FXSubstringScorer(), FXQuickRatioScorer(), FXSubsequenceScorer())
+
+    print(f"{len(names)} names, ratio {arguments.ratio}")
+    print(
+        f"{'scorer':<22}{'query':<12}{'score all':>11}"
+        f"{'spans all':>11}{'proxy':>9}{'shown':>8}"
+    )
+    for scorer in scorers:
+        proxy = FXSortFilterProxyModel(ratio=arguments.ratio)
+        proxy.setSourceModel(model)
+        proxy.set_scorer(scorer)
+        for query in QUERIES:
+            score_time = _best_of(
+                arguments.repeat,
+                lambda: [scorer.score(text, query) for text in lowered],
+            )
+            spans_time = _best_of(
+                arguments.repeat,
+                lambda: [scorer.match(text, query) for text in lowered],
+            )
+
+            def filter_rows():
+                # A fresh filter text each time, so nothing is reused
+                proxy.set_filter_text("")
+                proxy.set_scorer(scorer)
+                proxy.set_filter_text(query)
+                return proxy.rowCount()
+
+            proxy_time = _best_of(arguments.repeat, filter_rows)
+            print(
+                f"{type(scorer).__name__:<22}{query:<12}"
+                f"{score_time:>10.3f}s{spans_time:>10.3f}s"
+                f"{proxy_time:>8.3f}s{proxy.rowCount():>8}"
+            )
+
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""Command line for `fxgui`.
+
+Usage:
+    python -m fxgui pack-icons path/to/library [...]
+"""
+
+# Metadata
+__author__ = "Valentin Beaumont"
+__email__ = "valentin.onze@gmail.com"
+
+# Built-in
+import sys
+
+# Internal
+from fxgui import fxicons
+
+
+if __name__ == "__main__":
+    sys.exit(fxicons._main())
@@ -0,0 +1,207 @@
+"""Pixel operations on raw `QImage` buffers for `fxicons`.
+
+Recoloring an icon used to go through `QImage.pixelIndex` once per pixel
+from Python to find out whether it had any transparency, which costs
+tens of thousands of calls for a 96x96 icon at a device pixel ratio of 2.
+The helpers here read `QImage.constBits()` once and work on the whole
+buffer with `bytes` searches, which run in C, and recolor with NumPy
+when it is installed.
+
+Images are handled as `QImage.Format_ARGB32_Premultiplied`, the format
+icons are rendered in, so no conversion is needed on the way in or out.
+Its pixels are native-endian 32-bit ``0xAARRGGBB`` words and its rows are
+never padded. Recoloring a pixel only depends on its alpha, so each color
+becomes a 256-entry table of output pixels indexed by alpha.
+"""
+
+# Metadata
+__author__ = "Valentin Beaumont"
+__email__ = "valentin.onze@gmail.com"
+
+__all__ = ["has_clear_pixels", "has_index", "tint", "tint_variants"]
+
+# Built-in
+from functools import lru_cache
+import sys
+from typing import Iterable, List, Tuple, Union
+
+# Third-party
+try:
+    import numpy as np
+except ImportError:
+    # Tinting falls back to one `QPainter` fill per color
+    np = None
+from qtpy.QtGui import QColor, QImage, QPainter
+
+
+_FORMAT = QImage.Format_ARGB32_Premultiplied
+
+# Byte offsets of the B, G, R and A channels in a native-endian pixel
+_CHANNELS = (0, 1, 2, 3) if sys.byteorder == "little" else (3, 2, 1, 0)
+
+ColorLike = Union[str, QColor]
+
+
+def _argb(image: QImage) -> QImage:
+    """Return ``image`` as premultiplied ARGB32 (shared when it already is)."""
+    if image.format() == _FORMAT:
+        return image
+    return image.convertToFormat(_FORMAT)
+
+
+def _bits(image: QImage) -> memoryview:
+    """Return a read-only view of ``image``'s pixel buffer.
+
+    PySide answers `constBits()` with a `memoryview`; PyQt answers with a
+    `sip.voidptr` whose size has to be set before it can be viewed.
+    """
+    bits = image.constBits()
+    if hasattr(bits, "setsize"):
+        size = (
+            image.sizeInBytes()
+            if hasattr(image, "sizeInBytes")
+            else image.byteCount()
+        )
+        bits.setsize(size)
+    return memoryview(bits)
+
+
+def _pixels(image: QImage, depth: int) -> bytes:
+    """Return the visible pixels of ``image``, without row padding.
+
+    Args:
+        image: The image to read.
+        depth: The number of bytes per pixel in ``image``'s format.
+    """
+    data = _bits(image).tobytes()
+    row = image.width() * depth
+    stride = image.bytesPerLine()
+    if stride == row:
+        return data
+    return b"".join(
+        data[start : start + row]
+        for start in range(0, stride * image.height(), stride)
+    )
+
+
+def _multiply(value, alpha):
+    """Return ``value * alpha / 255``, rounded the way Qt's raster engine
+    rounds premultiplication and SourceIn fills.
+
+    Works on ints and on NumPy arrays alike.
+    """
+    product = value * alpha
+    return (product + (product >> 8) + 0x80) >> 8
+
+
+def _premultiplied(color: ColorLike) -> Tuple[int, int, int, int]:
+    """Return ``color`` as premultiplied ``(b, g, r, a)`` in 0-255."""
+    r, g, b, a = QColor(color).getRgb()
+    return (_multiply(b, a), _multiply(g, a), _multiply(r, a), a)
+
+
+@lru_cache(maxsize=64)
+def _table(color: Tuple[int, int, int, int]):
+    """Return the 256 output pixels of ``color``, indexed by alpha."""
+    alpha = np.arange(256, dtype=np.uint32)
+    table = np.zeros((256, 4), dtype=np.uint8)
+    for channel, value in zip(_CHANNELS, color):
+        table[:, channel] = _multiply(value, alpha)
+    return table.view(np.uint32).ravel()
+
+
+def _painted(image: QImage, color: ColorLike) -> QImage:
+    """Recolor ``image`` with a `QPainter` fill, for when NumPy is missing."""
+    result = image.copy()
+    painter = QPainter(result)
+    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+    painter.fillRect(result.rect(), QColor(color))
+    painter.end()
+    return result
+
+
+def _image(data: bytes, image: QImage) -> QImage:
+    """Wrap ``data`` as an image the size of ``image``, owning its buffer."""
+    result = QImage(
+        data, image.width(), image.height(), image.width() * 4, _FORMAT
+    ).copy()
+    result.setDevicePixelRatio(image.devicePixelRatio())
+    return result
+
+
+def has_clear_pixels(image: QImage) -> bool:
+    """Check whether any pixel of ``image`` is fully transparent.
+
+    Args:
+        image: The image to check.
+
+    Returns:
+        bool: `True` if at least one pixel has an alpha of zero.
+    """
+    if image.isNull():
+        return False
+    if not image.hasAlphaChannel():
+        return False
+    alpha = _pixels(_argb(image), 4)[_CHANNELS[3] :: 4]
+    return b"\x00" in alpha
+
+
+def has_index(image: QImage, index: int) -> bool:
+    """Check whether any pixel of an indexed image uses color ``index``.
+
+    Args:
+        image: The image to check, in any format that converts to
+            `QImage.Format_Indexed8` with its color table (masks and
+            other 1-bit images do).
+        index: The color table index to look for.
+
+    Returns:
+        bool: `True` if at least one pixel uses ``index``.
+    """
+    if image.isNull():
+        return False
+    if image.format() != QImage.Format_Indexed8:
+        image = image.convertToFormat(QImage.Format_Indexed8)
+    return bytes((index,)) in _pixels(image, 1)
+
+
+def tint_variants(image: QImage, colors: Iterable[ColorLike]) -> List[QImage]:
+    """Recolor ``image`` once per color, keeping its alpha channel.
+
+    This matches painting each color over the image with
+    `QPainter.CompositionMode_SourceIn`, which is what happens when NumPy
+    is not installed. With NumPy, the alpha channel is read once for all
+    the colors and each color is looked up by alpha.
+
+    Args:
+        image: The image whose shape to keep.
+        colors: The colors to fill the shape with.
+
+    Returns:
+        List[QImage]: One premultiplied ARGB32 image per color.
+    """
+    colors = list(colors)
+    if image.isNull() or not colors:
+        return [QImage(image) for _ in colors]
+    image = _argb(image)
+    if np is None:
+        return [_painted(image, color) for color in colors]
+
+    alpha = np.frombuffer(_pixels(image, 4), dtype=np.uint32) >> 24
+    return [
+        _image(_table(_premultiplied(color)).take(alpha).tobytes(), image)
+        for color in colors
+    ]
+
+
+def tint(image: QImage, color: ColorLike) -> QImage:
+    """Recolor ``image`` with ``color``, keeping its alpha channel.
+
+    Args:
+        image: The image whose shape to keep.
+        color: The color to fill the shape with.
+
+    Returns:
+        QImage: The recolored image, premultiplied ARGB32.
+    """
+    return tint_variants(image, [color])[0]
@@ -8,17 +8,22 @@ The module supports:
     - Multiple icon libraries with configurable defaults
     - Icon color customization
     - Automatic caching using LRU cache for performance
+    - A manifest of each library's files, so looking icons up does not
+      touch the filesystem
+    - Packed libraries: one memory-mapped file instead of a folder of icons
     - Icon superposition for composite icons
     - Pixmap and QIcon conversion utilities
 
 Functions:
     get_icon: Get a QIcon from an icon library.
     get_pixmap: Get a QPixmap from an icon library.
+    prewarm: Render icons on a thread pool ahead of when they are asked for.
     get_icon_path: Get the file path of an icon.
     clear_icon_cache: Clear the icon LRU cache.
     set_default_icon_library: Set the default icon library.
     set_icon_defaults: Configure default icon parameters.
     add_library: Add a custom icon library.
+    pack_library: Pack a library folder into a single file.
 
 Examples:
     Basic icon usage:
@@ -38,25 +43,48 @@ __author__ = "Valentin Beaumont"
 __email__ = "valentin.onze@gmail.com"
 
 # Built-in
+from collections import OrderedDict
 from functools import lru_cache
+import hashlib
+import json
+import mmap
+import os
 from pathlib import Path
 import re
+import threading
 import weakref
-from typing import Any, Dict, List, Optional, Union
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 # Third-party
 from qtpy.QtGui import (
     QIcon,
+    QIconEngine,
     QColor,
     QImage,
     QPainter,
     QPixmap,
     QBitmap,
 )
-from qtpy.QtCore import Qt, QRectF, QSize
+from qtpy.QtCore import (
+    QByteArray,
+    QCoreApplication,
+    QEvent,
+    QObject,
+    QRect,
+    QRectF,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 
 # Internal
-from fxgui import fxconstants
+from fxgui import _pixel_ops, fxconfig, fxconstants
+from fxgui._compat import is_valid
 
 
 # Public API
@@ -64,12 +92,15 @@ __all__ = [
     "set_default_icon_library",
     "set_icon_defaults",
     "add_library",
+    "pack_library",
     "get_available_libraries",
     "get_available_icons_in_library",
     "get_icon_path",
     "get_icon",
     "get_icon_color",
     "get_pixmap",
+    "prewarm",
+    "FXIconPrewarm",
     "change_pixmap_color",
     "convert_icon_to_pixmap",
     "superpose_icons",
@@ -139,6 +170,406 @@ _default_library = "material"
 # Uses WeakSet to avoid preventing garbage collection of widgets
 _icon_widgets = weakref.WeakSet()
 
+# The manifest of each library's files, by library name
+_manifests: Dict[str, "_FXIconManifest"] = {}
+
+# Images rendered by `prewarm`, by pixmap cache key, while they are seeded
+_prewarmed: Dict[Tuple, QImage] = {}
+
+# Running prewarms, kept alive until they finish
+_prewarms: Set["FXIconPrewarm"] = set()
+
+
+class _FXIconManifest:
+    """The files of an icon library, listed once and kept on disk.
+
+    Looking an icon up by formatting its path and probing the filesystem
+    costs a `stat` per icon, and listing a library a recursive walk; on a
+    network mount either dominates startup. The manifest walks the
+    library's folder once, and is saved under `fxconfig.get_config_dir()`
+    for the next session. It is trusted while the modification times of
+    the folder and of its direct subfolders are unchanged, which are the
+    only ones read at startup.
+
+    An icon the manifest does not list is still probed for on disk, and
+    remembered when found, so an icon added to a deeper folder during the
+    session still resolves.
+
+    Args:
+        base: The folder holding the library's files.
+    """
+
+    VERSION = 1
+
+    def __init__(self, base: Path):
+        self.base = Path(base)
+        self._prefix = str(self.base).replace("\\", "/").rstrip("/") + "/"
+        self._files: Optional[Set[str]] = None
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Return whether the library has a folder to read icons from."""
+
+        return self.base.is_dir()
+
+    def data(self, relative: str) -> Optional[bytes]:
+        """Return the contents of a file, when they are held in memory.
+
+        Args:
+            relative: The file's path relative to the library's folder.
+
+        Returns:
+            None: the files of a folder are read from disk.
+        """
+
+        return None
+
+    def close(self) -> None:
+        """Release the files the manifest holds open, when it holds any."""
+
+    def relative(self, path: str) -> Optional[str]:
+        """Return a path relative to the library's folder.
+
+        Args:
+            path: A path with forward slashes.
+
+        Returns:
+            The relative path, or None when the path is outside the folder.
+        """
+
+        if path.startswith(self._prefix):
+            return path[len(self._prefix) :]
+        return None
+
+    def files(self) -> Set[str]:
+        """Return the library's files, relative to its folder.
+
+        Returns:
+            The relative paths, with forward slashes.
+        """
+
+        with self._lock:
+            if self._files is None:
+                self._files = self._load()
+            return self._files
+
+    def add(self, relative: str) -> None:
+        """Remember a file found on disk since the manifest was made.
+
+        Args:
+            relative: The file's path relative to the library's folder.
+        """
+
+        self.files().add(relative)
+
+    def _stamps(self) -> Dict[str, int]:
+        """Return the modification times the manifest is checked against."""
+
+        stamps = {}
+        try:
+            stamps["."] = os.stat(self.base).st_mtime_ns
+            with os.scandir(self.base) as scan:
+                for entry in scan:
+                    if entry.is_dir():
+                        stamps[entry.name] = entry.stat().st_mtime_ns
+        except OSError:
+            pass
+        return stamps
+
+    def _cache_file(self) -> Path:
+        token = hashlib.sha1(self._prefix.encode("utf-8")).hexdigest()
+        return fxconfig.get_config_dir() / "icon_manifests" / f"{token}.json"
+
+    def _load(self) -> Set[str]:
+        """Read the saved manifest, or walk the folder and save one."""
+
+        stamps = self._stamps()
+        if not stamps:
+            return set()
+
+        cache_file = self._cache_file()
+        try:
+            with open(cache_file, "r", encoding="utf-8") as stream:
+                saved = json.load(stream)
+            if (
+                saved.get("version") == self.VERSION
+                and saved.get("base") == self._prefix
+                and saved.get("stamps") == stamps
+            ):
+                return set(saved["files"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        files = set()
+        for directory, _, names in os.walk(self.base):
+            relative = os.path.relpath(directory, self.base).replace("\\", "/")
+            prefix = "" if relative == "." else relative + "/"
+            files.update(prefix + name for name in names)
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temporary = cache_file.with_name(
+                f"{cache_file.name}.{threading.get_ident()}.tmp"
+            )
+            with open(temporary, "w", encoding="utf-8") as stream:
+                json.dump(
+                    {
+                        "version": self.VERSION,
+                        "base": self._prefix,
+                        "stamps": stamps,
+                        "files": sorted(files),
+                    },
+                    stream,
+                )
+            os.replace(temporary, cache_file)
+        except OSError:
+            pass
+        return files
+
+
+# A packed library: the magic, the length of the JSON index, the index,
+# then the files back to back. The index maps each file's path, relative
+# to the library's folder, to its offset past the index and its size
+_PACK_MAGIC = b"FXPACK\x00\x01"
+_PACK_HEADER = struct.Struct("<8sQ")
+_PACK_SUFFIX = ".fxpack"
+
+
+class _FXIconPack(_FXIconManifest):
+    """A library packed into a single file, read through `mmap`.
+
+    Thousands of tiny SVG files cost an open and a stat each on a cold
+    cache or a shared filesystem. A pack is one file: its index is read
+    once, and an icon is a slice of the mapped file, so loading one is a
+    page fault rather than a file open. The index is the manifest, and
+    needs no checking since a pack is rebuilt as a whole.
+
+    Args:
+        base: The folder the library's files were packed from. Paths are
+            still formatted under it, whether or not it exists.
+        pack: The packed file.
+    """
+
+    def __init__(self, base: Path, pack: Path):
+        super().__init__(base)
+        self.pack = Path(pack)
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._map: Optional[mmap.mmap] = None
+        self._payload = 0
+
+    def exists(self) -> bool:
+        return True
+
+    def data(self, relative: str) -> Optional[bytes]:
+        """Return the contents of a packed file.
+
+        Args:
+            relative: The file's path relative to the library's folder.
+
+        Returns:
+            The file's bytes, or None when it is not in the pack.
+        """
+
+        self.files()
+        entry = self._index.get(relative)
+        if entry is None:
+            return None
+        offset, size = entry
+        start = self._payload + offset
+        with self._lock:
+            if self._map is None:
+                return None
+            return self._map[start : start + size]
+
+    def close(self) -> None:
+        """Unmap the pack, so the file can be replaced or removed.
+
+        Icons are read from the library's folder from then on.
+        """
+
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+    def _load(self) -> Set[str]:
+        try:
+            with open(self.pack, "rb") as stream:
+                self._map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, length = _PACK_HEADER.unpack_from(self._map, 0)
+            if magic != _PACK_MAGIC:
+                raise ValueError(f"'{self.pack}' is not an icon pack.")
+            start = _PACK_HEADER.size
+            index = json.loads(self._map[start : start + length])
+        except (OSError, ValueError, struct.error):
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            return set()
+        self._payload = _PACK_HEADER.size + length
+        self._index = {
+            relative: (offset, size)
+            for relative, (offset, size) in index.items()
+        }
+        return set(self._index)
+
+
+def pack_library(
+    folder: Union[str, Path], output: Optional[Union[str, Path]] = None
+) -> Path:
+    """Pack a library folder into a single file.
+
+    A pack named after the folder, next to it (`icons/dcc.fxpack` for
+    `icons/dcc`), is read instead of the folder. Icons are then read from
+    one memory-mapped file rather than opened one by one. The folder is
+    still needed: `get_icon_path()` answers paths inside it.
+
+    The `stylesheet_*` folders are not packed, since the stylesheets'
+    `~icons` token points Qt at their files on disk.
+
+    The same is available from a shell:
+    `python -m fxgui pack-icons path/to/library [...]`.
+
+    Args:
+        folder: The library folder, the part of the library's pattern
+            before `{style}`, `{icon_name}` or `{extension}`.
+        output: Where to write the pack. Defaults to the folder's path
+            with a `.fxpack` suffix.
+
+    Returns:
+        The path of the pack.
+
+    Raises:
+        FileNotFoundError: If the folder does not exist.
+        ValueError: If the folder holds the stylesheets' icons.
+
+    Examples:
+        >>> pack_library(fxconstants.ICONS_ROOT / "dcc")
+    """
+
+    folder = Path(folder)
+    if not folder.is_dir():
+        raise FileNotFoundError(f"Library folder '{folder}' does not exist.")
+    if _is_stylesheet_folder(folder):
+        raise ValueError(
+            f"'{folder}' holds stylesheet icons, which are read from disk."
+        )
+    output = Path(output) if output else folder.with_name(
+        folder.name + _PACK_SUFFIX
+    )
+
+    files = []
+    for directory, _, names in os.walk(folder):
+        for name in names:
+            path = Path(directory) / name
+            files.append((path.relative_to(folder).as_posix(), path))
+    files.sort()
+
+    index = {}
+    payload = []
+    offset = 0
+    for relative, path in files:
+        data = path.read_bytes()
+        index[relative] = [offset, len(data)]
+        payload.append(data)
+        offset += len(data)
+    encoded = json.dumps(index, separators=(",", ":")).encode("utf-8")
+
+    temporary = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as stream:
+        stream.write(_PACK_HEADER.pack(_PACK_MAGIC, len(encoded)))
+        stream.write(encoded)
+        for data in payload:
+            stream.write(data)
+
+    # Read the new pack from now on, whichever way the library names its
+    # folder (relative, or through a link). The old pack is unmapped first,
+    # since a mapped file cannot be replaced on Windows
+    resolved = folder.resolve()
+    for library in [
+        name
+        for name, manifest in _manifests.items()
+        if manifest.base.resolve() == resolved
+    ]:
+        _drop_manifest(library)
+    os.replace(temporary, output)
+    return output
+
+
+def _drop_manifest(library: str) -> None:
+    """Forget a library's manifest, releasing what it holds open.
+
+    Args:
+        library: The name of the library.
+    """
+
+    manifest = _manifests.pop(library, None)
+    if manifest is not None:
+        manifest.close()
+
+
+def _is_stylesheet_folder(folder: Path) -> bool:
+    """Check whether a folder holds the icons the stylesheets point at.
+
+    Args:
+        folder: The folder to check.
+
+    Returns:
+        True for the `stylesheet_light` and `stylesheet_dark` folders.
+    """
+
+    return folder.name.startswith("stylesheet_")
+
+
+def _library_base(library: str) -> Optional[Path]:
+    """Return the folder holding a library's files.
+
+    That is the part of the library's pattern before its first placeholder
+    other than `{root}` and `{library}`.
+
+    Args:
+        library: The name of the library.
+
+    Returns:
+        The folder, or None when the pattern starts with a placeholder.
+    """
+
+    info = _libraries_info[library]
+    root = str(info.get("root", fxconstants.ICONS_ROOT))
+    pattern = (
+        info["pattern"]
+        .replace("{root}", root)
+        .replace("{library}", library)
+        .replace("\\", "/")
+    )
+    head = pattern.split("{", 1)[0]
+    base = head.rsplit("/", 1)[0] if "/" in head else ""
+    return Path(base) if base else None
+
+
+def _get_manifest(library: str) -> Optional[_FXIconManifest]:
+    """Return the manifest of a library's files.
+
+    Args:
+        library: The name of the library.
+
+    Returns:
+        The manifest, or None when the library has no folder to list.
+    """
+
+    base = _library_base(library)
+    if base is None:
+        return None
+    manifest = _manifests.get(library)
+    if manifest is None or manifest.base != base:
+        pack = base.with_name(base.name + _PACK_SUFFIX)
+        if pack.is_file() and not _is_stylesheet_folder(base):
+            manifest = _FXIconPack(base, pack)
+        else:
+            manifest = _FXIconManifest(base)
+        _manifests[library] = manifest
+    return manifest
+
 
 def set_default_icon_library(library: str):
     """Set the default icon library.
@@ -246,6 +677,7 @@ def add_library(
         "defaults": defaults,
         "root": root,
     }
+    _drop_manifest(library)
 
 
 def get_available_libraries() -> List[str]:
@@ -279,12 +711,17 @@ def get_available_icons_in_library(library: str) -> List[str]:
         ["3d_equalizer", "adobe_photoshop", "blender", "hiero"]
     """
 
-    library_path = fxconstants.ICONS_ROOT / library
-    if not library_path.exists():
+    manifest = _get_manifest(library) if library in _libraries_info else None
+    if manifest is None or not manifest.exists():
         raise ValueError(f"Library '{library}' does not exist.")
 
-    icon_files = library_path.glob("**/*.*")
-    icon_names = sorted(icon_file.stem for icon_file in icon_files)
+    icon_names = sorted(
+        Path(name).stem
+        for name in (
+            relative.rsplit("/", 1)[-1] for relative in manifest.files()
+        )
+        if "." in name
+    )
 
     if not icon_names:
         raise FileNotFoundError(f"No icons found in library '{library}'.")
@@ -334,9 +771,17 @@ def get_icon_path(
         root=root,
     ).replace("\\", "/")
 
+    # Listed in the library's manifest: no need to ask the filesystem
+    manifest = _get_manifest(library)
+    relative = manifest.relative(path) if manifest is not None else None
+    if relative is not None and relative in manifest.files():
+        return path
+
     if not Path(path).exists():
         raise FileNotFoundError(f"Icon path '{path}' does not exist.")
 
+    if relative is not None:
+        manifest.add(relative)
     return path
 
 
@@ -349,23 +794,15 @@ def has_transparency(mask: QBitmap) -> bool:
     Returns:
         bool: `True` if the mask has transparency, `False` otherwise.
     """
-    image = mask.toImage()
-    width = mask.width()
-    height = mask.height()
-
-    # Early exit: scan row by row for better cache locality
-    for y in range(height):
-        for x in range(width):
-            if image.pixelIndex(x, y) == 0:
-                return True
-    return False
+    return _pixel_ops.has_index(mask.toImage(), 0)
 
 
 def change_pixmap_color(pixmap: QPixmap, color: str) -> QPixmap:
     """Change the color of a pixmap.
 
-    Uses QPainter with composition mode for efficient colorization
-    while preserving the original alpha channel.
+    Fills the pixmap's shape with ``color`` while preserving its alpha
+    channel. A pixmap without any fully transparent pixel is returned
+    as is.
 
     Args:
         pixmap (QPixmap): The pixmap to change the color of.
@@ -374,20 +811,10 @@ def change_pixmap_color(pixmap: QPixmap, color: str) -> QPixmap:
     Returns:
         QPixmap: The pixmap with the new color applied.
     """
-    mask = pixmap.createMaskFromColor(Qt.transparent)
-    if not has_transparency(mask):
+    image = pixmap.toImage()
+    if not _pixel_ops.has_clear_pixels(image):
         return pixmap
-
-    # Create a copy to avoid modifying the original
-    colored_pixmap = pixmap.copy()
-
-    # Use QPainter with SourceIn composition to colorize while preserving alpha
-    painter = QPainter(colored_pixmap)
-    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-    painter.fillRect(colored_pixmap.rect(), QColor(color))
-    painter.end()
-
-    return colored_pixmap
+    return _colored_copies(image, [color])[0]
 
 
 def _screen_dpr() -> float:
@@ -407,8 +834,10 @@ def _screen_dpr() -> float:
     return 1.0
 
 
-def _render_svg_to_pixmap(path: str, width: int, height: int) -> QPixmap:
-    """Rasterize an SVG to a QPixmap using ``QSvgRenderer``.
+def _render_svg_to_image(
+    path: Union[str, bytes], width: int, height: int
+) -> QImage:
+    """Rasterize an SVG to a QImage using ``QSvgRenderer``.
 
     This deliberately bypasses ``QIcon(path).pixmap()`` / the ``qsvg``
     imageformat plugin: that plugin fails to load inside some embedded DCC
@@ -419,17 +848,23 @@ def _render_svg_to_pixmap(path: str, width: int, height: int) -> QPixmap:
     Aspect ratio is preserved and the result centered, mirroring ``QIcon``.
 
     Args:
-        path: Path to the SVG file.
+        path: Path to the SVG file, or its contents when read from a pack.
         width: Target pixmap width.
         height: Target pixmap height.
 
+    Only `QImage` is painted, which is safe off the GUI thread (see
+    `prewarm`).
+
     Returns:
-        QPixmap: The rasterized icon.
+        QImage: The rasterized icon.
     """
     # Lazy import so environments without QtSvg only fail when an SVG is needed.
     from qtpy.QtSvg import QSvgRenderer
 
-    renderer = QSvgRenderer(path)
+    if isinstance(path, bytes):
+        renderer = QSvgRenderer(QByteArray(path))
+    else:
+        renderer = QSvgRenderer(path)
     image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
     image.fill(Qt.transparent)
 
@@ -450,7 +885,35 @@ def _render_svg_to_pixmap(path: str, width: int, height: int) -> QPixmap:
         renderer.render(painter)
     painter.end()
 
-    return QPixmap.fromImage(image)
+    return image
+
+
+def _render_svg_to_pixmap(
+    path: Union[str, bytes], width: int, height: int
+) -> QPixmap:
+    """Rasterize an SVG to a QPixmap (see `_render_svg_to_image`)."""
+    return QPixmap.fromImage(_render_svg_to_image(path, width, height))
+
+
+def _icon_source(library: str, path: str) -> Union[str, bytes]:
+    """Return an icon's contents when its library is packed, else its path.
+
+    Args:
+        library: The library of the icon.
+        path: The icon's path, from `get_icon_path`.
+
+    Returns:
+        The bytes read from the pack, or the path to open.
+    """
+
+    manifest = _get_manifest(library)
+    if manifest is not None:
+        relative = manifest.relative(path)
+        if relative is not None:
+            data = manifest.data(relative)
+            if data is not None:
+                return data
+    return path
 
 
 def _get_pixmap_internal(
@@ -477,8 +940,22 @@ def _get_pixmap_internal(
     )
     physical_width = max(1, int(round(width * dpr)))
     physical_height = max(1, int(round(height * dpr)))
+    image = _prewarmed.get(
+        (icon_name, width, height, color, library, style, extension, dpr)
+    )
+    if image is not None:
+        # Rendered and colored on a `prewarm` thread already
+        return QPixmap.fromImage(image)
+
+    source = _icon_source(library, path)
     if path.lower().endswith(".svg"):
-        qpixmap = _render_svg_to_pixmap(path, physical_width, physical_height)
+        qpixmap = _render_svg_to_pixmap(
+            source, physical_width, physical_height
+        )
+    elif isinstance(source, bytes):
+        qpixmap = QPixmap()
+        qpixmap.loadFromData(source)
+        qpixmap = QIcon(qpixmap).pixmap(physical_width, physical_height)
     else:
         qpixmap = QIcon(path).pixmap(physical_width, physical_height)
     if dpr != 1.0:
@@ -539,14 +1016,254 @@ def get_pixmap(
     )
 
 
+def _colored_copies(
+    image: Union[QPixmap, QImage], colors: List[str]
+) -> List[QPixmap]:
+    """Return ``image`` recolored to each of ``colors`` (alpha preserved)."""
+    if isinstance(image, QPixmap):
+        dpr = image.devicePixelRatio()
+        image = image.toImage()
+    else:
+        dpr = image.devicePixelRatio()
+    pixmaps = []
+    for tinted in _pixel_ops.tint_variants(image, colors):
+        pixmap = QPixmap.fromImage(tinted)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmaps.append(pixmap)
+    return pixmaps
+
+
 def _colored_copy(qpixmap: QPixmap, color: str) -> QPixmap:
     """Return a copy of ``qpixmap`` recolored to ``color`` (alpha preserved)."""
-    pixmap = qpixmap.copy()
-    painter = QPainter(pixmap)
-    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-    painter.fillRect(pixmap.rect(), QColor(color))
-    painter.end()
-    return pixmap
+    return _colored_copies(qpixmap, [color])[0]
+
+
+@lru_cache(maxsize=1)
+def _scaled_pixmap_size_is_logical() -> bool:
+    """Return whether Qt asks `QIconEngine.scaledPixmap` for logical sizes.
+
+    Recent Qt 6 releases pass the logical size along with the scale;
+    earlier ones passed the size already multiplied by the scale. Asking
+    an engine for a 1x1 icon at scale 2 tells the two apart.
+    """
+
+    sizes = []
+
+    class _Probe(QIconEngine):
+        def pixmap(self, size, mode, state):
+            sizes.append(size.width())
+            return QPixmap()
+
+        def scaledPixmap(self, size, mode, state, scale):
+            sizes.append(size.width())
+            return QPixmap()
+
+        def clone(self):
+            return _Probe()
+
+    try:
+        QIcon(_Probe()).pixmap(QSize(1, 1), 2.0)
+    except TypeError:
+        # Qt 5: no scaled pixmaps, sizes are in device pixels
+        return False
+    return sizes[:1] == [1]
+
+
+# The engines Qt cloned, kept alive for as long as Qt uses them
+_engine_clones: Set["_FXIconEngine"] = set()
+
+
+class _FXIconEngine(QIconEngine):
+    """Render an `fxicons` icon only in the modes and at the sizes asked for.
+
+    Baking a pixmap for every mode up front paid for three recolored
+    copies most icons never show, at a single size Qt then had to scale.
+    This engine keeps what it needs to render the icon instead, and
+    rasterizes each mode at the size and device pixel ratio Qt actually
+    asks for, keeping the last few it rendered.
+
+    The Normal pixmap comes from `_get_pixmap_cached`, shared with
+    `get_pixmap` and seeded by `prewarm`. The other modes recolor it.
+    Pixmaps added to the icon, such as the On pixmap of a checkable
+    button, are shown for their mode and state instead.
+    """
+
+    MAX_PIXMAPS = 8
+
+    def __init__(
+        self,
+        icon: Tuple,
+        size: QSize,
+        colors: Dict[QIcon.Mode, str],
+    ):
+        """Initialize the engine.
+
+        Args:
+            icon: The ``(icon_name, color, library, style, extension)`` to
+                render with `_get_pixmap_cached`.
+            size: The icon's size when nothing asks for another one.
+            colors: The color of each mode the Normal pixmap is recolored
+                for. Other modes show the Normal pixmap.
+        """
+
+        super().__init__()
+        self._icon = icon
+        self._size = QSize(size)
+        self._colors = colors
+        self._pixmaps: "OrderedDict[Tuple, QPixmap]" = OrderedDict()
+        self._added: Dict[Tuple[QIcon.Mode, QIcon.State], List[QPixmap]] = {}
+
+    def key(self) -> str:
+        return "fxicons"
+
+    def clone(self) -> QIconEngine:
+        engine = _FXIconEngine(self._icon, self._size, self._colors)
+        engine._added = {
+            key: list(pixmaps) for key, pixmaps in self._added.items()
+        }
+
+        # Qt owns the clone, which it makes when an icon is copied before
+        # being changed, but PySide frees it along with its Python object.
+        # Keep it alive until Qt deletes it.
+        _engine_clones.difference_update(
+            [clone for clone in _engine_clones if not is_valid(clone)]
+        )
+        _engine_clones.add(engine)
+        return engine
+
+    def addPixmap(
+        self, pixmap: QPixmap, mode: QIcon.Mode, state: QIcon.State
+    ) -> None:
+        if not pixmap.isNull():
+            self._added.setdefault((mode, state), []).append(QPixmap(pixmap))
+
+    def addFile(
+        self,
+        file_name: str,
+        size: QSize,
+        mode: QIcon.Mode,
+        state: QIcon.State,
+    ) -> None:
+        self.addPixmap(QPixmap(file_name), mode, state)
+
+    def availableSizes(
+        self, mode: QIcon.Mode = QIcon.Normal, state: QIcon.State = QIcon.Off
+    ) -> List[QSize]:
+        added = self._added.get((mode, state), [])
+        if added:
+            return [pixmap.size() for pixmap in added]
+        return [QSize(self._size)]
+
+    def actualSize(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State
+    ) -> QSize:
+        return QSize(size)
+
+    def pixmap(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State
+    ) -> QPixmap:
+        added = self._added_pixmap(size.width(), size.height(), mode, state)
+        if added is not None:
+            return added.scaled(
+                size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        return self._render(size.width(), size.height(), mode, 1.0)
+
+    def scaledPixmap(
+        self,
+        size: QSize,
+        mode: QIcon.Mode,
+        state: QIcon.State,
+        scale: float,
+    ) -> QPixmap:
+        width, height = size.width(), size.height()
+        if scale > 0 and not _scaled_pixmap_size_is_logical():
+            width = max(1, int(round(width / scale)))
+            height = max(1, int(round(height / scale)))
+        added = self._added_pixmap(width, height, mode, state)
+        if added is not None:
+            scale = scale if scale > 0 else 1.0
+            added = added.scaled(
+                QSize(int(round(width * scale)), int(round(height * scale))),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            )
+            added.setDevicePixelRatio(scale)
+            return added
+        return self._render(width, height, mode, scale)
+
+    def paint(
+        self,
+        painter: QPainter,
+        rect: QRect,
+        mode: QIcon.Mode,
+        state: QIcon.State,
+    ) -> None:
+        pixmap = self._added_pixmap(rect.width(), rect.height(), mode, state)
+        if pixmap is None:
+            scale = painter.device().devicePixelRatioF()
+            pixmap = self._render(rect.width(), rect.height(), mode, scale)
+        painter.drawPixmap(rect, pixmap)
+
+    def _added_pixmap(
+        self, width: int, height: int, mode: QIcon.Mode, state: QIcon.State
+    ) -> Optional[QPixmap]:
+        """Return the added pixmap closest to a size, if any was added.
+
+        Pixmaps added for the mode and state come first, then those added
+        for the Normal mode of the state.
+        """
+
+        added = self._added.get((mode, state)) or self._added.get(
+            (QIcon.Normal, state)
+        )
+        if not added:
+            return None
+        larger = [
+            pixmap
+            for pixmap in added
+            if pixmap.width() >= width and pixmap.height() >= height
+        ]
+        if larger:
+            return min(larger, key=lambda pixmap: pixmap.width())
+        return max(added, key=lambda pixmap: pixmap.width())
+
+    def _render(
+        self, width: int, height: int, mode: QIcon.Mode, scale: float
+    ) -> QPixmap:
+        """Return the pixmap of ``mode`` at a logical size and scale."""
+
+        if width <= 0 or height <= 0:
+            return QPixmap()
+        color = self._colors.get(mode)
+        key = (color, width, height, scale)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        icon_name, normal_color, library, style, extension = self._icon
+        try:
+            pixmap = _get_pixmap_cached(
+                icon_name,
+                width,
+                height,
+                normal_color,
+                library,
+                style,
+                extension,
+                scale,
+            )
+        except FileNotFoundError:
+            # The icon went away since the engine was made
+            return QPixmap()
+        if color:
+            pixmap = _colored_copy(pixmap, color)
+
+        self._pixmaps[key] = pixmap
+        while len(self._pixmaps) > self.MAX_PIXMAPS:
+            self._pixmaps.popitem(last=False)
+        return pixmap
 
 
 def _get_icon_internal(
@@ -560,41 +1277,42 @@ def _get_icon_internal(
     library: str,
     style: Optional[str],
     extension: Optional[str],
-    dpr: float = 1.0,
 ) -> QIcon:
     """Internal function to get a QIcon with resolved parameters.
 
     This is the cached version that takes fully resolved parameters.
+    Nothing is rendered here: the icon's `_FXIconEngine` rasterizes each
+    mode at the size and device pixel ratio it is drawn at.
 
     The Selected and Active pixmaps are colored for *accent* backgrounds
-    (selected/hovered item rows, highlighted menu items). They are only added
-    when ``active_color``/``selected_color`` are set; pass ``active_color=""``
-    to build a button-safe icon, since Qt renders a focused button's icon in
-    Active mode over a non-accent surface (see `set_icon`).
-    """
-    # Get the `QPixmap` of the icon
-    qpixmap = _get_pixmap_cached(
-        icon_name, width, height, color, library, style, extension, dpr
-    )
-
-    # Create a `QIcon` and add the normal state pixmap
-    icon = QIcon(qpixmap)
-
-    # `QPixmap` for disabled state - use derived muted color
-    icon.addPixmap(_colored_copy(qpixmap, disabled_color), QIcon.Disabled)
-
-    # Only add selected/active pixmaps if there's a color (monochrome icons)
+    (selected/hovered item rows, highlighted menu items). They are only
+    recolored when ``active_color``/``selected_color`` are set; pass
+    ``active_color=""`` to build a button-safe icon, since Qt renders a
+    focused button's icon in Active mode over a non-accent surface (see
+    `set_icon`).
+    """
+    # Fail now rather than on first paint for a name the library lacks
+    get_icon_path(icon_name, library=library, style=style, extension=extension)
+
+    # Disabled state uses the derived muted color. Selected and Active
+    # pixmaps are only recolored if there's a color (monochrome icons):
+    # Selected (selected item rows) uses icon_on_accent_primary, Active
+    # (hovered rows, highlighted menu items) icon_on_accent_secondary and
+    # is omitted for button widgets.
+    colors = {QIcon.Disabled: disabled_color}
     if color:
-        # Selected state (selected item rows) - icon_on_accent_primary color
         if selected_color:
-            icon.addPixmap(_colored_copy(qpixmap, selected_color), QIcon.Selected)
-
-        # Active state (hovered rows, highlighted menu items) -
-        # icon_on_accent_secondary color. Omitted for button widgets.
+            colors[QIcon.Selected] = selected_color
         if active_color:
-            icon.addPixmap(_colored_copy(qpixmap, active_color), QIcon.Active)
+            colors[QIcon.Active] = active_color
 
-    return icon
+    return QIcon(
+        _FXIconEngine(
+            (icon_name, color, library, style, extension),
+            QSize(width, height),
+            colors,
+        )
+    )
 
 
 # Apply LRU cache to the internal function
@@ -711,10 +1429,284 @@ def get_icon(
         library,
         style,
         extension,
-        _screen_dpr(),
     )
 
 
+def _render_icon_image(
+    source: Union[str, bytes],
+    width: int,
+    height: int,
+    color: Optional[str],
+    dpr: float,
+) -> QImage:
+    """Render and color an SVG icon the way `_get_pixmap_internal` does.
+
+    Only `QImage` is touched, so this runs on `prewarm`'s threads.
+    """
+
+    image = _render_svg_to_image(source, width, height)
+    if color is not None and _pixel_ops.has_clear_pixels(image):
+        image = _pixel_ops.tint(image, color)
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class _FXIconRenderSignals(QObject):
+    """Carries a rendered icon from a worker back to the GUI thread.
+
+    Deliberately parentless: the running tasks hold it, so a worker that
+    finishes after its prewarm is gone still has a live object to emit on.
+    """
+
+    rendered = Signal(object, QImage)
+
+
+class _FXIconRenderTask(QRunnable):
+    """Render one icon on a pool thread."""
+
+    def __init__(
+        self,
+        key: Tuple,
+        source: Union[str, bytes],
+        signals: _FXIconRenderSignals,
+    ):
+        super().__init__()
+        self._key = key
+        self._source = source
+        self._signals = signals
+
+    def run(self) -> None:
+        _, width, height, color, _, _, _, dpr = self._key
+        image = _render_icon_image(
+            self._source,
+            max(1, int(round(width * dpr))),
+            max(1, int(round(height * dpr))),
+            color,
+            dpr,
+        )
+        try:
+            self._signals.rendered.emit(self._key, image)
+        except RuntimeError:
+            # The application is tearing down under the worker
+            pass
+
+
+class FXIconPrewarm(QObject):
+    """Icons being rendered in the background by `prewarm`.
+
+    Each icon is seeded into the `get_pixmap` and `get_icon` caches on the
+    GUI thread as soon as it is rendered, so asking for it afterwards costs
+    a cache lookup.
+
+    Signals:
+        progress: Emitted with the number of icons ready so far.
+        finished: Emitted with the number of icons once all are ready.
+    """
+
+    progress = Signal(int)
+    finished = Signal(int)
+
+    def __init__(
+        self,
+        icons: List[Tuple[Tuple, Tuple, Optional[Union[str, bytes]]]],
+        max_threads: Optional[int] = None,
+    ):
+        super().__init__()
+        self._icons = {pixmap_key: icon_key for pixmap_key, icon_key, _ in icons}
+        self._ready = 0
+
+        self._pool = QThreadPool(self)
+        if max_threads is not None:
+            self._pool.setMaxThreadCount(max_threads)
+        # Queued even for the GUI thread's own emits, so no signal fires
+        # before the caller had a chance to connect to it
+        self._signals = _FXIconRenderSignals()
+        self._signals.rendered.connect(self._on_rendered, Qt.QueuedConnection)
+
+        _prewarms.add(self)
+        for pixmap_key, _, source in icons:
+            if source is None:
+                # Not an SVG: rendered on the GUI thread when seeded
+                self._signals.rendered.emit(pixmap_key, QImage())
+            else:
+                self._pool.start(
+                    _FXIconRenderTask(pixmap_key, source, self._signals)
+                )
+        if not icons:
+            QTimer.singleShot(0, self._finish)
+
+    def count(self) -> int:
+        """Return the number of icons being prewarmed."""
+        return len(self._icons)
+
+    def is_finished(self) -> bool:
+        """Return whether every icon has been rendered and seeded."""
+        return self not in _prewarms
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until every icon is rendered, then seed the caches.
+
+        Args:
+            msecs: How long to wait for the renders, or -1 to wait for as
+                long as it takes.
+
+        Returns:
+            True when every icon is ready.
+        """
+
+        self._pool.waitForDone(msecs)
+        QCoreApplication.sendPostedEvents(self, QEvent.MetaCall)
+        if self._ready == len(self._icons):
+            self._finish()
+        return self.is_finished()
+
+    @Slot(object, QImage)
+    def _on_rendered(self, pixmap_key: Tuple, image: QImage) -> None:
+        """Seed the caches with an icon rendered by a worker."""
+
+        icon_key = self._icons.get(pixmap_key)
+        if icon_key is None or self.is_finished():
+            return
+        if not image.isNull():
+            _prewarmed[pixmap_key] = image
+        try:
+            _get_pixmap_cached(*pixmap_key)
+            _get_icon_cached(*icon_key)
+        except FileNotFoundError:
+            # The icon went away since it was looked up
+            pass
+        finally:
+            _prewarmed.pop(pixmap_key, None)
+
+        self._ready += 1
+        self.progress.emit(self._ready)
+        if self._ready == len(self._icons):
+            self._finish()
+
+    def _finish(self) -> None:
+        if self.is_finished():
+            return
+        _prewarms.discard(self)
+        self.finished.emit(len(self._icons))
+
+
+# The sizes icons are drawn at in item views and toolbars
+_PREWARM_SIZES = (16, 24)
+
+
+def prewarm(
+    names: Iterable[str],
+    sizes: Optional[Iterable[Union[int, Tuple[int, int]]]] = None,
+    colors: Optional[Iterable[Optional[str]]] = None,
+    library: Optional[str] = None,
+    style: Optional[str] = None,
+    extension: Optional[str] = None,
+    max_threads: Optional[int] = None,
+) -> FXIconPrewarm:
+    """Render icons on a thread pool ahead of when they are asked for.
+
+    Tools typically ask for a few hundred icons while their first window is
+    built, each rasterized in turn on the GUI thread. `prewarm` renders the
+    SVG ones as `QImage`s in parallel instead, and seeds the `get_pixmap`
+    and `get_icon` caches on the GUI thread as each one is ready. Icons in
+    other formats are seeded on the GUI thread.
+
+    Names that are not in the library are skipped, and `get_icon` raises
+    for them as usual.
+
+    Args:
+        names: The names of the icons.
+        sizes: The sizes to render each icon at, as a side or as a
+            ``(width, height)`` pair. Icons are rendered at the size they
+            are drawn at, not at the library's size, so pass the sizes
+            the widgets draw them at. Defaults to 16 and 24, the sizes
+            item views and toolbars draw icons at.
+        colors: The colors to render each icon in, `None` for the
+            library's color, as with `get_icon`. Defaults to the
+            library's color.
+        library: The library of the icons. Defaults to `None`.
+        style: The style of the icons. Defaults to `None`.
+        extension: The extension of the icons. Defaults to `None`.
+        max_threads: The most threads to render on. Defaults to the
+            number of processors.
+
+    Returns:
+        FXIconPrewarm: The running prewarm. Connect to its `finished`
+        signal, or call its `wait()` method, to know when it is done.
+
+    Examples:
+        >>> warm = prewarm(["home", "settings", "save"], sizes=[16, 24])
+        >>> warm.finished.connect(splash.close)
+    """
+
+    if library is None:
+        library = _default_library
+    defaults = _libraries_info[library]["defaults"]
+
+    if sizes is None:
+        sizes = _PREWARM_SIZES
+    sizes = [
+        (size, size) if isinstance(size, int) else tuple(size)
+        for size in sizes
+    ]
+    # Resolved as `get_icon` resolves them, so the keys seeded are the
+    # keys it looks up
+    colors = [
+        defaults["color"] if color is None else color
+        for color in ([None] if colors is None else colors)
+    ]
+
+    disabled_color = _get_disabled_icon_color()
+    selected_color = _get_selected_icon_color()
+    active_color = _get_active_icon_color()
+    dpr = _screen_dpr()
+
+    icons = []
+    seen = set()
+    for icon_name in names:
+        try:
+            path = get_icon_path(
+                icon_name, library=library, style=style, extension=extension
+            )
+        except FileNotFoundError:
+            continue
+        source = (
+            _icon_source(library, path)
+            if path.lower().endswith(".svg")
+            else None
+        )
+        for width, height in sizes:
+            for color in colors:
+                pixmap_key = (
+                    icon_name,
+                    width,
+                    height,
+                    color,
+                    library,
+                    style,
+                    extension,
+                    dpr,
+                )
+                if pixmap_key in seen:
+                    continue
+                seen.add(pixmap_key)
+                icon_key = (
+                    icon_name,
+                    width,
+                    height,
+                    color,
+                    disabled_color,
+                    selected_color,
+                    active_color,
+                    library,
+                    style,
+                    extension,
+                )
+                icons.append((pixmap_key, icon_key, source))
+
+    return FXIconPrewarm(icons, max_threads)
+
+
 def convert_icon_to_pixmap(
     icon: QIcon, desired_size: Optional[QSize] = None
 ) -> Optional[QPixmap]:
@@ -954,8 +1946,6 @@ def refresh_all_icons() -> None:
     """
     from qtpy.QtWidgets import QWidget
 
-    from fxgui._compat import is_valid
-
     for widget in list(_icon_widgets):
         # Skip widgets whose C++ object has been deleted
         if not is_valid(widget):
@@ -998,3 +1988,32 @@ def _icon_for_widget(widget: Any, icon_name: str, kwargs: Dict) -> QIcon:
 
     include_active = not isinstance(widget, QAbstractButton)
     return get_icon(icon_name, include_active=include_active, **kwargs)
+
+
+def _main(arguments: Optional[List[str]] = None) -> int:
+    """Run the `fxgui` command line.
+
+    Args:
+        arguments: The command line arguments. Defaults to `sys.argv`.
+
+    Returns:
+        The exit code.
+    """
+
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m fxgui")
+    commands = parser.add_subparsers(dest="command", required=True)
+    pack = commands.add_parser(
+        "pack-icons", help="Pack icon library folders into single files."
+    )
+    pack.add_argument("folders", nargs="+", type=Path)
+    options = parser.parse_args(arguments)
+
+    for folder in options.folders:
+        try:
+            output = pack_library(folder)
+        except (FileNotFoundError, ValueError) as error:
+            parser.error(str(error))
+        print(f"{folder} -> {output}")
+    return 0
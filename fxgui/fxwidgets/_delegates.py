@@ -2,11 +2,25 @@
 
 # Built-in
 import os
+import heapq
+from collections import OrderedDict
+from functools import lru_cache
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Third-party
-from qtpy.QtCore import QMargins, QModelIndex, QRect, QRectF, QSize, Qt
+from qtpy.QtCore import (
+    QAbstractItemModel,
+    QMargins,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+)
 from qtpy.QtGui import (
     QBrush,
     QColor,
@@ -28,6 +42,72 @@ from qtpy.QtWidgets import (
 
 # Internal
 from fxgui import fxicons, fxstyle
+from fxgui._compat import is_valid
+from fxgui.fxcore import FXSortFilterProxyModel
+from fxgui.fxwidgets._thumbnail_loader import (
+    _FXThumbnailLoader,
+    _get_disk_cache,
+)
+
+
+class _HTMLStripper(HTMLParser):
+    """Collect the text of an HTML fragment, dropping its tags."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = []
+
+    def handle_data(self, d):
+        self.text.append(d)
+
+    def get_data(self):
+        return "".join(self.text)
+
+
+@lru_cache(maxsize=1)
+def _markdown_converter():
+    """Return the shared Markdown converter, or None without `markdown`.
+
+    Building a converter loads its extensions, which costs more than the
+    conversion itself, so one is kept and reset between documents.
+    """
+
+    try:
+        import markdown
+    except ImportError:
+        return None
+    return markdown.Markdown(extensions=["extra", "nl2br"])
+
+
+@lru_cache(maxsize=4096)
+def _markdown_to_plain_text(text: str) -> str:
+    """Convert Markdown to whitespace-collapsed plain text.
+
+    Descriptions are converted from `paint()` and `sizeHint()` for every
+    visible row on every repaint, and a view shows the same few thousand
+    strings over and over, so the result is memoized.
+
+    Args:
+        text: Markdown-formatted text.
+
+    Returns:
+        The plain text, or `text` unchanged when `markdown` is not installed.
+    """
+
+    converter = _markdown_converter()
+    if converter is None:
+        return text
+
+    # Convert Markdown to HTML first
+    html = converter.reset().convert(text)
+
+    # Remove HTML tags to get plain text
+    stripper = _HTMLStripper()
+    stripper.feed(html)
+    stripper.close()
+
+    # Clean up extra whitespace
+    return " ".join(stripper.get_data().split())
 
 
 class FXItemDelegate(QStyledItemDelegate):
@@ -348,6 +428,14 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         show_thumbnail: Whether to show thumbnails globally.
         show_status_dot: Whether to show the status dot indicator globally.
         show_status_label: Whether to show the status label globally.
+        load_thumbnails_async: Whether thumbnails are decoded on a thread
+            pool rather than inside `paint()`.
+        thumbnail_cache_bytes: How much pixel memory the decoded
+            thumbnails may hold.
+        use_disk_cache: Whether downscaled thumbnails are kept on disk
+            across sessions.
+        uniform_row_height: The height every row reports, or None to size
+            each row by its content.
 
     Note:
         Global properties and per-item roles work together:
@@ -371,6 +459,34 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         indicator space the rows actually show. `sizeHint` reports the same
         floor, so a view that sizes to contents already has the room.
 
+    Note:
+        Thumbnails are decoded and downscaled on a thread pool, never inside
+        `paint()`. A row whose thumbnail is still loading paints the empty
+        bordered frame, and only that row is repainted when the image
+        arrives. Decoded thumbnails are kept in an LRU bounded by
+        `thumbnail_cache_bytes` and keyed by path, size and device pixel
+        ratio. Set `load_thumbnails_async` to False to decode on the GUI
+        thread instead, e.g. to grab a view that must show its images on
+        the first paint.
+
+    Note:
+        Downscaled thumbnails are also written to a `thumbnails` directory
+        under `fxconfig.get_config_dir()`, keyed by source path, source
+        modification time and target size, so a relaunched tool does not
+        open a single full-resolution plate it has already shrunk. The
+        directory is bounded by `set_thumbnail_disk_cache_limit` with LRU
+        eviction, `purge_thumbnail_disk_cache` empties it, and
+        `thumbnail_disk_cache_stats` reports its hits and misses.
+
+    Note:
+        Rows are `ROW_HEIGHT_THUMBNAIL` (50px) with a thumbnail,
+        `ROW_HEIGHT_DESCRIPTION` (40px) with only a description and
+        `ROW_HEIGHT_SIMPLE` (30px) otherwise. Size hints are cached per
+        index and dropped as the model reports changes. A view of mixed
+        rows cannot use `QTreeView.setUniformRowHeights(True)`, which takes
+        the first row's height for all of them, unless `uniform_row_height`
+        makes every row report the same one.
+
     Note:
         When using custom backgrounds (Qt.BackgroundRole), call
         `FXThumbnailDelegate.apply_transparent_selection(view)` to disable the
@@ -429,6 +545,16 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
     # a consumer that derived from it is moved along with it.
     FIRST_FREE_ROLE = Qt.UserRole + 13
 
+    # The row heights sizeHint reports, by what the row shows
+    ROW_HEIGHT_SIMPLE = 30  # Title only
+    ROW_HEIGHT_DESCRIPTION = 40  # Title and description
+    ROW_HEIGHT_THUMBNAIL = 50  # Thumbnail, title and description
+    _ROW_HEIGHTS = (
+        ROW_HEIGHT_SIMPLE,
+        ROW_HEIGHT_DESCRIPTION,
+        ROW_HEIGHT_THUMBNAIL,
+    )
+
     # Layout geometry, shared by the paint and sizeHint paths so that the
     # space reserved for an element and the space it paints in cannot drift
     _THUMBNAIL_WIDTH = 68  # 16:9 against _THUMBNAIL_HEIGHT
@@ -438,6 +564,7 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
     _THUMBNAIL_SPAN = (
         _THUMBNAIL_WIDTH + _THUMBNAIL_BORDER + _THUMBNAIL_MARGIN * 2
     )
+    _THUMBNAIL_TILE_CACHE_SIZE = 512  # Finished bordered tiles kept
     _CONTENT_SPACING = 5  # Gap between the thumbnail and what follows it
     _ICON_SIZE = 16
     _ICON_MARGIN = 6
@@ -480,9 +607,19 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         self._show_status_label = True
         self._show_child_count = True
         self._show_starred = True
+        self._load_thumbnails_async = True
+        self._thumbnail_loader = _FXThumbnailLoader(self)
+        self._thumbnail_tiles: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._uniform_row_height: Optional[int] = None
+        self._size_hints: Dict[tuple, Tuple[str, QSize]] = {}
+        self._size_hint_model: Optional[QAbstractItemModel] = None
+        self._size_hint_handlers: Tuple = ()
 
     def _on_theme_changed(self, _theme_name: str = None) -> None:
         """Handle theme change by triggering a repaint of the parent view."""
+        # The tiles have the old theme's background baked in
+        self._thumbnail_tiles.clear()
+        self.clear_size_hint_cache()
         parent = self.parent()
         if parent and hasattr(parent, "viewport"):
             parent.viewport().update()
@@ -501,6 +638,7 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
     def show_thumbnail(self, value: bool) -> None:
         """Set whether thumbnails are shown globally."""
         self._show_thumbnail = value
+        self.clear_size_hint_cache()
 
     @property
     def show_status_dot(self) -> bool:
@@ -511,6 +649,7 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
     def show_status_dot(self, value: bool) -> None:
         """Set whether the status dot is shown."""
         self._show_status_dot = value
+        self.clear_size_hint_cache()
 
     @property
     def show_status_label(self) -> bool:
@@ -521,6 +660,7 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
     def show_status_label(self, value: bool) -> None:
         """Set whether the status label is shown."""
         self._show_status_label = value
+        self.clear_size_hint_cache()
 
     @property
     def show_child_count(self) -> bool:
@@ -531,6 +671,7 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
     def show_child_count(self, value: bool) -> None:
         """Set whether child count badges are shown."""
         self._show_child_count = value
+        self.clear_size_hint_cache()
 
     @property
     def show_starred(self) -> bool:
@@ -541,6 +682,93 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
     def show_starred(self, value: bool) -> None:
         """Set whether starred indicators are shown."""
         self._show_starred = value
+        self.clear_size_hint_cache()
+
+    @property
+    def uniform_row_height(self) -> Optional[int]:
+        """The height every row reports, or None to size rows by content.
+
+        One of `ROW_HEIGHT_SIMPLE`, `ROW_HEIGHT_DESCRIPTION` or
+        `ROW_HEIGHT_THUMBNAIL`. Pair it with
+        `QTreeView.setUniformRowHeights(True)`.
+        """
+        return self._uniform_row_height
+
+    @uniform_row_height.setter
+    def uniform_row_height(self, value: Optional[int]) -> None:
+        """Set the height every row reports, or None to size by content."""
+        if value is not None and value not in self._ROW_HEIGHTS:
+            raise ValueError(
+                f"uniform_row_height must be None or one of "
+                f"{sorted(self._ROW_HEIGHTS)}, not {value!r}"
+            )
+        self._uniform_row_height = value
+
+    @property
+    def load_thumbnails_async(self) -> bool:
+        """Whether thumbnails are decoded in the background."""
+        return self._load_thumbnails_async
+
+    @load_thumbnails_async.setter
+    def load_thumbnails_async(self, value: bool) -> None:
+        """Set whether thumbnails are decoded in the background."""
+        self._load_thumbnails_async = value
+
+    @property
+    def thumbnail_cache_bytes(self) -> int:
+        """The most pixel memory decoded thumbnails may hold."""
+        return self._thumbnail_loader.max_bytes
+
+    @thumbnail_cache_bytes.setter
+    def thumbnail_cache_bytes(self, value: int) -> None:
+        """Set the most pixel memory decoded thumbnails may hold."""
+        self._thumbnail_loader.max_bytes = value
+
+    @property
+    def use_disk_cache(self) -> bool:
+        """Whether downscaled thumbnails are kept on disk across sessions."""
+        return self._thumbnail_loader.use_disk_cache
+
+    @use_disk_cache.setter
+    def use_disk_cache(self, value: bool) -> None:
+        """Set whether downscaled thumbnails are kept on disk."""
+        self._thumbnail_loader.use_disk_cache = value
+
+    @staticmethod
+    def set_thumbnail_disk_cache_limit(max_bytes: int) -> None:
+        """Bound the on-disk thumbnail cache, evicting what no longer fits.
+
+        The cache is shared by every delegate of the application, so the
+        bound is too.
+
+        Args:
+            max_bytes: The most disk space the cached thumbnails may take.
+        """
+        _get_disk_cache().max_bytes = max_bytes
+
+    @staticmethod
+    def purge_thumbnail_disk_cache() -> int:
+        """Delete every thumbnail cached on disk.
+
+        Returns:
+            The number of bytes freed.
+        """
+        return _get_disk_cache().purge()
+
+    @staticmethod
+    def thumbnail_disk_cache_stats() -> Dict[str, int]:
+        """Report the on-disk thumbnail cache's counters and footprint.
+
+        Returns:
+            A dictionary with `hits`, `misses`, `files`, `bytes` and
+            `max_bytes`. Hits and misses count from the start of the
+            session.
+
+        Examples:
+            >>> stats = FXThumbnailDelegate.thumbnail_disk_cache_stats()
+            >>> print(f"{stats['hits']} hits, {stats['misses']} misses")
+        """
+        return _get_disk_cache().stats()
 
     # Stylesheet to disable default QTreeWidget selection (delegate handles it)
     TRANSPARENT_SELECTION_STYLE = """
@@ -634,9 +862,12 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         either: it applies to every section, so the wide floor column 0 needs
         would also be forced on the narrow columns beside it.
 
-        The floor is measured from the model each time a resize would breach
-        it, walking the rows that are laid out (expanded branches only), so it
-        follows the widest pill the view currently shows.
+        The floor is the widest among the rows that are laid out (expanded
+        branches only), so it follows the widest pill the view currently
+        shows. Each row's floor is measured once and kept up to date as rows
+        are inserted, removed, edited, expanded and collapsed, so a resize
+        does not walk the tree. `expandAll()` and friends expand without
+        emitting `expanded`; call this again after them to measure afresh.
 
         Args:
             view: The tree view whose header should be constrained.
@@ -656,6 +887,21 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         if header is None:
             return
 
+        # The row floors are tracked as the model and the expansion change,
+        # so a resize reads the widest of them rather than walking the tree.
+        # A second call measures afresh, which is also the way to pick up an
+        # `expandAll()`, since that expands without emitting `expanded`
+        trackers = getattr(view, "_fxgui_minimum_width_trackers", None)
+        if trackers is None:
+            trackers = {}
+            view._fxgui_minimum_width_trackers = trackers
+        tracker = trackers.get(column)
+        if tracker is None:
+            tracker = _FXMinimumWidthTracker(view, column)
+            trackers[column] = tracker
+        else:
+            tracker.invalidate()
+
         # A resize of our own re-enters sectionResized, so the enforcement
         # has to be able to tell its own resize from the user's
         guard = {"busy": False}
@@ -663,7 +909,7 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         def _enforce(index: int, _old_size: int, new_size: int) -> None:
             if index != column or guard["busy"]:
                 return
-            floor = cls._measure_minimum_width(view, column)
+            floor = tracker.floor()
             if new_size >= floor:
                 return
             guard["busy"] = True
@@ -687,7 +933,7 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         header.sectionResized.connect(_enforce)
         installed[column] = _enforce
 
-        floor = cls._measure_minimum_width(view, column)
+        floor = tracker.floor()
         if floor and header.sectionSize(column) < floor:
             header.resizeSection(column, floor)
 
@@ -709,9 +955,38 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         """
 
         model = view.model()
-        if model is None:
+        delegate = cls._delegate_for_column(view, column)
+        if model is None or delegate is None:
             return 0
 
+        # A null rect starts at x 0, so the row floors come out as offsets
+        option = QStyleOptionViewItem()
+        return max(
+            (
+                delegate._row_minimum_width(
+                    option, index, delegate._has_thumbnail(index)
+                )
+                for index in cls._laid_out_indexes(
+                    view, column, QModelIndex()
+                )
+            ),
+            default=0,
+        )
+
+    @staticmethod
+    def _delegate_for_column(
+        view: QWidget, column: int
+    ) -> Optional["FXThumbnailDelegate"]:
+        """Return the thumbnail delegate painting a view's column.
+
+        Args:
+            view: The view to look in.
+            column: The column.
+
+        Returns:
+            The delegate, or None when the column is not painted by one.
+        """
+
         delegate = None
         if hasattr(view, "itemDelegateForColumn"):
             delegate = view.itemDelegateForColumn(column)
@@ -720,24 +995,35 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         ):
             delegate = view.itemDelegate()
         if not isinstance(delegate, FXThumbnailDelegate):
-            return 0
+            return None
+        return delegate
 
-        # A null rect starts at x 0, so the row floors come out as offsets
-        option = QStyleOptionViewItem()
-        can_expand = hasattr(view, "isExpanded")
+    @staticmethod
+    def _laid_out_indexes(
+        view: QWidget, column: int, parent: QModelIndex
+    ) -> Iterator[QModelIndex]:
+        """Yield the laid-out indexes under a parent, depth first.
+
+        A row is laid out when every one of its ancestors is expanded, so
+        the walk descends only into expanded branches.
+
+        Args:
+            view: The view whose expansion state to follow.
+            column: The column to yield indexes in.
+            parent: The index to start under, itself not yielded.
 
-        floor = 0
-        parents = [QModelIndex()]
+        Yields:
+            The laid-out indexes below `parent`.
+        """
+
+        model = view.model()
+        can_expand = hasattr(view, "isExpanded")
+        parents = [parent]
         while parents:
             parent = parents.pop()
             for row in range(model.rowCount(parent)):
                 index = model.index(row, column, parent)
-                floor = max(
-                    floor,
-                    delegate._row_minimum_width(
-                        option, index, delegate._has_thumbnail(index)
-                    ),
-                )
+                yield index
                 if (
                     model.hasChildren(index)
                     and can_expand
@@ -745,12 +1031,14 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
                 ):
                     parents.append(index)
 
-        return floor
-
     @staticmethod
     def markdown_to_plain_text(text: str) -> str:
         """Convert Markdown text to plain text by removing formatting.
 
+        Conversions are kept in a process-wide LRU of 4096 strings, so a
+        description is parsed once however often its row is repainted.
+        `precompute_descriptions` fills it as a model's descriptions are set.
+
         Args:
             text: Markdown-formatted text.
 
@@ -761,41 +1049,67 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         if not text or text == "-":
             return text
 
-        try:
-            import markdown
-            from html.parser import HTMLParser
+        return _markdown_to_plain_text(text)
 
-            class _HTMLStripper(HTMLParser):
-                """Simple HTML tag stripper."""
+    @classmethod
+    def precompute_descriptions(cls, model: QAbstractItemModel) -> None:
+        """Convert a model's descriptions to plain text as they are set.
 
-                def __init__(self):
-                    super().__init__()
-                    self.reset()
-                    self.strict = False
-                    self.convert_charrefs = True
-                    self.text = []
+        `markdown_to_plain_text` is memoized, so a description is converted
+        once and every later paint is a lookup. This moves that one
+        conversion off the first paint: the descriptions already in the
+        model are converted now, and any set afterwards are converted when
+        `DESCRIPTION_ROLE` changes or a row is inserted, so scrolling or
+        hovering over freshly filled rows never runs the Markdown parser.
 
-                def handle_data(self, d):
-                    self.text.append(d)
+        Args:
+            model: The model holding the descriptions, e.g. `view.model()`.
 
-                def get_data(self):
-                    return "".join(self.text)
+        Examples:
+            >>> from fxgui import fxwidgets
+            >>> from qtpy.QtWidgets import QTreeWidget
+            >>> tree = QTreeWidget()
+            >>> fxwidgets.FXThumbnailDelegate.precompute_descriptions(
+            ...     tree.model()
+            ... )
+        """
 
-            # Convert Markdown to HTML first
-            html = markdown.markdown(text, extensions=["extra", "nl2br"])
+        def _convert(parent: QModelIndex, first: int, last: int) -> None:
+            for row in range(first, last + 1):
+                index = model.index(row, 0, parent)
+                description = index.data(cls.DESCRIPTION_ROLE)
+                if isinstance(description, str):
+                    cls.markdown_to_plain_text(description)
+                if model.hasChildren(index):
+                    _convert(index, 0, model.rowCount(index) - 1)
+
+        def _on_data_changed(
+            top_left: QModelIndex, bottom_right: QModelIndex, roles=()
+        ) -> None:
+            if roles and cls.DESCRIPTION_ROLE not in roles:
+                return
+            if top_left.column() != 0:
+                return
+            parent = top_left.parent()
+            for row in range(top_left.row(), bottom_right.row() + 1):
+                description = model.index(row, 0, parent).data(
+                    cls.DESCRIPTION_ROLE
+                )
+                if isinstance(description, str):
+                    cls.markdown_to_plain_text(description)
 
-            # Remove HTML tags to get plain text
-            stripper = _HTMLStripper()
-            stripper.feed(html)
-            plain_text = stripper.get_data()
+        # The model holds the only reference to the handlers, and a second
+        # call replaces them rather than converting everything twice
+        previous = getattr(model, "_fxgui_description_handlers", None)
+        if previous is not None:
+            model.rowsInserted.disconnect(previous[0])
+            model.dataChanged.disconnect(previous[1])
 
-            # Clean up extra whitespace
-            plain_text = " ".join(plain_text.split())
+        model.rowsInserted.connect(_convert)
+        model.dataChanged.connect(_on_data_changed)
+        model._fxgui_description_handlers = (_convert, _on_data_changed)
 
-            return plain_text
-        except ImportError:
-            # Fallback if markdown is not installed
-            return text
+        _convert(QModelIndex(), 0, model.rowCount() - 1)
 
     @staticmethod
     def _as_color(value) -> QColor:
@@ -1938,57 +2252,166 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         painter.setFont(font)
         painter.drawText(badge_rect, Qt.AlignCenter, text)
 
-    def _draw_thumbnail_content(
+    @staticmethod
+    def _device_pixel_ratio(painter: QPainter) -> float:
+        """Return the pixel ratio of the device being painted on.
+
+        Args:
+            painter: The painter in use.
+
+        Returns:
+            The device's pixel ratio, 1.0 when it cannot be told.
+        """
+
+        device = painter.device()
+        if device is None:
+            return 1.0
+        return float(device.devicePixelRatioF()) or 1.0
+
+    def _thumbnail_pixmap(
         self,
         painter: QPainter,
         option: QStyleOptionViewItem,
         index: QModelIndex,
-    ) -> None:
-        """Draw thumbnail, title, and description for column 0.
+    ) -> Optional[QPixmap]:
+        """Return the row's thumbnail, scaled to the thumbnail box.
+
+        The image is decoded by the thumbnail loader, in the background
+        unless `load_thumbnails_async` is off. A row without a path, or
+        whose file cannot be read, gets the missing-image placeholder.
 
         Args:
-            painter: The painter to use for drawing.
+            painter: The painter in use, for the device pixel ratio.
             option: The style options for the item.
             index: The model index of the item.
+
+        Returns:
+            The scaled thumbnail, or None while it is still loading.
         """
 
+        dpr = self._device_pixel_ratio(painter)
         thumbnail_path = index.data(self.THUMBNAIL_PATH_ROLE)
-        thumbnail = QPixmap(thumbnail_path) if thumbnail_path else QPixmap()
+
+        thumbnail = None
+        if thumbnail_path:
+            key = (
+                str(thumbnail_path),
+                self._THUMBNAIL_WIDTH,
+                self._THUMBNAIL_HEIGHT,
+                dpr,
+            )
+            if self._load_thumbnails_async:
+                thumbnail = self._thumbnail_loader.request(
+                    key, option.widget, index
+                )
+                if thumbnail is None:
+                    return None
+            else:
+                thumbnail = self._thumbnail_loader.load(key)
 
         # Use fallback if thumbnail is null/invalid
-        if thumbnail.isNull():
+        if thumbnail is None or thumbnail.isNull():
             fallback_path = (
                 Path(__file__).parent.parent / "images" / "missing_image.png"
             )
             if fallback_path.exists():
-                thumbnail = QPixmap(str(fallback_path))
-            else:
+                thumbnail = self._thumbnail_loader.load(
+                    (
+                        str(fallback_path),
+                        self._THUMBNAIL_WIDTH,
+                        self._THUMBNAIL_HEIGHT,
+                        dpr,
+                    )
+                )
+            if thumbnail is None or thumbnail.isNull():
                 # Create a simple placeholder pixmap
-                thumbnail = QPixmap(70, 70)
+                thumbnail = QPixmap(
+                    self._THUMBNAIL_HEIGHT, self._THUMBNAIL_HEIGHT
+                )
                 thumbnail.fill(QColor(80, 80, 80))
 
+        return thumbnail
+
+    def _bordered_thumbnail(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> QPixmap:
+        """Return the row's finished thumbnail tile.
+
+        The tile is the rounded `surface_sunken` frame with the scaled image
+        centered in it and the white border on top. Composing one takes an
+        off-screen pixmap and painter, so finished tiles are kept per
+        (thumbnail, device pixel ratio, theme background) and a repaint for
+        hover, selection or scrolling is a single `drawPixmap`. The tiles
+        are dropped when the theme changes.
+
+        A row whose thumbnail is still loading gets the empty frame, which
+        is shared by every such row and never stands in for the real tile.
+
+        Args:
+            painter: The painter in use, for the device pixel ratio.
+            option: The style options for the item.
+            index: The model index of the item.
+
+        Returns:
+            The tile, at the device's pixel ratio.
+        """
+
+        dpr = self._device_pixel_ratio(painter)
+        surface = self.theme.surface_sunken
+        thumbnail_path = index.data(self.THUMBNAIL_PATH_ROLE)
+        key = (str(thumbnail_path) if thumbnail_path else "", dpr, surface)
+
+        tile = self._thumbnail_tiles.get(key)
+        if tile is not None:
+            self._thumbnail_tiles.move_to_end(key)
+            return tile
+
+        thumbnail = self._thumbnail_pixmap(painter, option, index)
+        if thumbnail is None:
+            key = (None, dpr, surface)
+            tile = self._thumbnail_tiles.get(key)
+            if tile is not None:
+                return tile
+
+        tile = self._compose_thumbnail_tile(thumbnail, dpr)
+        self._thumbnail_tiles[key] = tile
+        while len(self._thumbnail_tiles) > self._THUMBNAIL_TILE_CACHE_SIZE:
+            self._thumbnail_tiles.popitem(last=False)
+        return tile
+
+    def _compose_thumbnail_tile(
+        self, thumbnail: Optional[QPixmap], dpr: float
+    ) -> QPixmap:
+        """Paint the bordered thumbnail tile.
+
+        Args:
+            thumbnail: The scaled image to center in the frame, or None for
+                the empty frame.
+            dpr: The device pixel ratio to compose at.
+
+        Returns:
+            The tile, tagged with `dpr`.
+        """
+
         # Fixed thumbnail container size - 16:9 aspect ratio to match missing_image.png
         # Row height is 50px, with 5px margin top/bottom = 40px for bordered thumbnail
         # Bordered thumbnail adds 2px, so inner thumbnail is 38px height
         thumbnail_height = self._THUMBNAIL_HEIGHT
         thumbnail_width = self._THUMBNAIL_WIDTH
-        x_offset = self._THUMBNAIL_MARGIN  # Consistent margin on all sides
-
-        # Scale image to fit within container while keeping aspect ratio
-        if not thumbnail.isNull():
-            thumbnail = thumbnail.scaled(
-                thumbnail_width,
-                thumbnail_height,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
 
-        # Create fixed-size bordered thumbnail container with background
+        # Create fixed-size bordered thumbnail container with background,
+        # at the device's pixel ratio so a HiDPI thumbnail stays sharp
+        tile_width = thumbnail_width + self._THUMBNAIL_BORDER
+        tile_height = thumbnail_height + self._THUMBNAIL_BORDER
         bordered_thumbnail = QPixmap(
-            thumbnail_width + self._THUMBNAIL_BORDER,
-            thumbnail_height + self._THUMBNAIL_BORDER,
+            max(1, round(tile_width * dpr)), max(1, round(tile_height * dpr))
         )
+        bordered_thumbnail.setDevicePixelRatio(dpr)
         bordered_thumbnail.fill(Qt.transparent)
+        tile_rect = QRect(0, 0, tile_width, tile_height)
 
         painter_with_border = QPainter(bordered_thumbnail)
         painter_with_border.setRenderHint(QPainter.Antialiasing)
@@ -1998,28 +2421,52 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         painter_with_border.setBrush(QBrush(bg_color))
         painter_with_border.setPen(Qt.NoPen)
         painter_with_border.drawRoundedRect(
-            bordered_thumbnail.rect().marginsRemoved(QMargins(1, 1, 1, 1)), 2, 2
+            tile_rect.marginsRemoved(QMargins(1, 1, 1, 1)), 2, 2
         )
 
-        # Center the scaled image within the fixed-size container
-        img_x = 1 + (thumbnail_width - thumbnail.width()) // 2
-        img_y = 1 + (thumbnail_height - thumbnail.height()) // 2
-        painter_with_border.drawPixmap(img_x, img_y, thumbnail)
+        # Center the scaled image within the fixed-size container. A
+        # thumbnail still loading leaves the frame empty until it arrives
+        if thumbnail is not None:
+            ratio = thumbnail.devicePixelRatio() or 1.0
+            img_x = 1 + (thumbnail_width - round(thumbnail.width() / ratio)) // 2
+            img_y = 1 + (
+                thumbnail_height - round(thumbnail.height() / ratio)
+            ) // 2
+            painter_with_border.drawPixmap(img_x, img_y, thumbnail)
 
         # Draw border around the full container
         painter_with_border.setPen(QPen(Qt.white, 1))
         painter_with_border.setBrush(Qt.NoBrush)
         painter_with_border.drawRoundedRect(
-            bordered_thumbnail.rect().marginsRemoved(QMargins(1, 1, 1, 1)), 2, 2
+            tile_rect.marginsRemoved(QMargins(1, 1, 1, 1)), 2, 2
         )
         painter_with_border.end()
 
+        return bordered_thumbnail
+
+    def _draw_thumbnail_content(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> None:
+        """Draw thumbnail, title, and description for column 0.
+
+        Args:
+            painter: The painter to use for drawing.
+            option: The style options for the item.
+            index: The model index of the item.
+        """
+
+        bordered_thumbnail = self._bordered_thumbnail(painter, option, index)
+        tile_width = self._THUMBNAIL_WIDTH + self._THUMBNAIL_BORDER
+        tile_height = self._THUMBNAIL_HEIGHT + self._THUMBNAIL_BORDER
+
         # Draw the thumbnail
         thumbnail_y = (
-            option.rect.top()
-            + (option.rect.height() - bordered_thumbnail.height()) // 2
+            option.rect.top() + (option.rect.height() - tile_height) // 2
         )
-        thumbnail_x = option.rect.left() + x_offset
+        thumbnail_x = option.rect.left() + self._THUMBNAIL_MARGIN
         painter.drawPixmap(thumbnail_x, thumbnail_y, bordered_thumbnail)
 
         # Draw decoration icon overlay on bottom-right corner of thumbnail
@@ -2028,16 +2475,10 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
             overlay_size = 15
             overlay_margin = 6
             overlay_x = (
-                thumbnail_x
-                + bordered_thumbnail.width()
-                - overlay_size
-                - overlay_margin
+                thumbnail_x + tile_width - overlay_size - overlay_margin
             )
             overlay_y = (
-                thumbnail_y
-                + bordered_thumbnail.height()
-                - overlay_size
-                - overlay_margin
+                thumbnail_y + tile_height - overlay_size - overlay_margin
             )
 
             # Draw a background circle for the icon
@@ -2091,9 +2532,15 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
 
         # Draw title, clipped to its rect rather than elided: a narrowing
         # column reveals less of it instead of collapsing to an ellipsis
-        painter.setFont(title_font)
         title_rect = QRect(text_x, text_y, text_width, title_height)
-        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignTop, str(title))
+        self._draw_title(
+            painter,
+            title_rect,
+            Qt.AlignLeft | Qt.AlignTop,
+            str(title),
+            title_font,
+            index,
+        )
 
         # Draw description
         if description:
@@ -2180,9 +2627,13 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
                 text_x, option.rect.top() + 4, content_width, title_height
             )
             painter.setPen(text_color)
-            painter.setFont(title_font)
-            painter.drawText(
-                title_rect, Qt.AlignLeft | Qt.AlignVCenter, str(title)
+            self._draw_title(
+                painter,
+                title_rect,
+                Qt.AlignLeft | Qt.AlignVCenter,
+                str(title),
+                title_font,
+                index,
             )
 
             # Draw description
@@ -2203,16 +2654,78 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         else:
             # Single-line layout
             painter.setPen(text_color)
-            painter.setFont(option.font)
             text_rect = QRect(
                 text_x,
                 option.rect.top(),
                 content_width,
                 option.rect.height(),
             )
+            self._draw_title(
+                painter,
+                text_rect,
+                Qt.AlignLeft | Qt.AlignVCenter,
+                str(title),
+                option.font,
+                index,
+            )
+
+    def _draw_title(
+        self,
+        painter: QPainter,
+        rect: QRect,
+        alignment: Qt.AlignmentFlag,
+        title: str,
+        font: QFont,
+        index: QModelIndex,
+    ) -> None:
+        """Draw a row's title, its matched characters in bold.
+
+        Under an `FXSortFilterProxyModel` with a filter text, the row's
+        `MATCH_SPANS_ROLE` gives the characters the filter matched. Those
+        are drawn bold and the rest at regular weight, whatever the weight
+        of `font`, so the highlight also shows on a bold title.
+
+        Args:
+            painter: The painter to use for drawing.
+            rect: The rect the title is clipped to.
+            alignment: The alignment of the title within `rect`.
+            title: The title.
+            font: The font the title is drawn in without a filter.
+            index: The model index of the item.
+        """
+
+        spans = index.data(FXSortFilterProxyModel.MATCH_SPANS_ROLE)
+        if not spans:
+            painter.setFont(font)
+            painter.drawText(rect, alignment, title)
+            return
+
+        regular = QFont(font)
+        regular.setBold(False)
+        bold = QFont(font)
+        bold.setBold(True)
+
+        runs = []
+        position = 0
+        for start, length in spans:
+            runs.append((title[position:start], regular))
+            runs.append((title[start : start + length], bold))
+            position = start + length
+        runs.append((title[position:], regular))
+
+        left = rect.left()
+        for text, run_font in runs:
+            if not text:
+                continue
+            if left > rect.right():
+                break
+            painter.setFont(run_font)
             painter.drawText(
-                text_rect, Qt.AlignLeft | Qt.AlignVCenter, str(title)
+                QRect(left, rect.top(), rect.right() - left + 1, rect.height()),
+                alignment,
+                text,
             )
+            left += QFontMetrics(run_font).horizontalAdvance(text)
 
     def _draw_text(
         self,
@@ -2280,6 +2793,115 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
     ) -> QSize:
         """Return the size hint for the item at the given index.
 
+        Measuring a row takes font metrics for its text and indicators, so
+        the hints are cached per index and font. The cache follows the
+        model: `dataChanged` drops the changed rows, and a layout change,
+        reset, insertion, removal or move drops everything, as do a theme
+        change and the `show_*` setters. A model changed behind the
+        delegate's back needs `clear_size_hint_cache()`.
+
+        Args:
+            option: The style options for the item.
+            index: The model index of the item.
+
+        Returns:
+            The size hint for the item.
+        """
+
+        model = index.model()
+        if model is None:
+            size = self._measure_size_hint(option, index)
+        else:
+            if model is not self._size_hint_model:
+                self._watch_size_hint_model(model)
+            # One entry per index, holding the font it was measured with
+            key = (index.row(), index.column(), index.internalId())
+            font_key = option.font.key()
+            cached = self._size_hints.get(key)
+            if cached is not None and cached[0] == font_key:
+                size = cached[1]
+            else:
+                size = self._measure_size_hint(option, index)
+                self._size_hints[key] = (font_key, size)
+
+        if self._uniform_row_height is not None:
+            return QSize(size.width(), self._uniform_row_height)
+        return QSize(size)
+
+    def clear_size_hint_cache(self) -> None:
+        """Forget every cached size hint, so rows are measured again."""
+        self._size_hints.clear()
+
+    def _watch_size_hint_model(self, model: QAbstractItemModel) -> None:
+        """Keep the size hint cache in step with the given model.
+
+        Args:
+            model: The model the view now asks about.
+        """
+
+        previous = self._size_hint_model
+        if previous is not None and is_valid(previous):
+            for signal, handler in zip(
+                self._size_hint_signals(previous), self._size_hint_handlers
+            ):
+                signal.disconnect(handler)
+
+        self._size_hints.clear()
+        self._size_hint_model = model
+
+        def _on_data_changed(
+            top_left: QModelIndex, bottom_right: QModelIndex, _roles=()
+        ) -> None:
+            parent = top_left.parent()
+            # Column 0's data sets the height of the whole row
+            columns = range(model.columnCount(parent))
+            for row in range(top_left.row(), bottom_right.row() + 1):
+                for column in columns:
+                    internal_id = model.index(row, column, parent).internalId()
+                    self._size_hints.pop((row, column, internal_id), None)
+
+        def _on_structure_changed(*_args) -> None:
+            self._size_hints.clear()
+
+        signals = self._size_hint_signals(model)
+        handlers = (_on_data_changed,) + (_on_structure_changed,) * (
+            len(signals) - 1
+        )
+        for signal, handler in zip(signals, handlers):
+            signal.connect(handler)
+        self._size_hint_handlers = handlers
+
+    @staticmethod
+    def _size_hint_signals(model: QAbstractItemModel) -> Tuple:
+        """Return the model signals that invalidate size hints.
+
+        `dataChanged` comes first, as it is the only one handled per row.
+
+        Args:
+            model: The model to read the signals from.
+
+        Returns:
+            The bound signals.
+        """
+
+        return (
+            model.dataChanged,
+            model.layoutChanged,
+            model.modelReset,
+            model.rowsInserted,
+            model.rowsRemoved,
+            model.rowsMoved,
+            model.columnsInserted,
+            model.columnsRemoved,
+        )
+
+    def _measure_size_hint(
+        self,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> QSize:
+        """Measure the size hint for the item at the given index.
+
         Args:
             option: The style options for the item.
             index: The model index of the item.
@@ -2313,11 +2935,11 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         # - Non-thumbnail with description: 40px (title + description)
         # - Simple items: 30px (title only)
         if has_thumbnail:
-            fixed_height = 50
+            fixed_height = self.ROW_HEIGHT_THUMBNAIL
         elif has_description:
-            fixed_height = 40
+            fixed_height = self.ROW_HEIGHT_DESCRIPTION
         else:
-            fixed_height = 30
+            fixed_height = self.ROW_HEIGHT_SIMPLE
 
         # Only column 0 lays out a thumbnail, indicators and a description
         if not is_col0:
@@ -2486,6 +3108,222 @@ class FXThumbnailDelegate(fxstyle.FXThemeAware, QStyledItemDelegate):
         painter.restore()
 
 
+class _FXMinimumWidthTracker(QObject):
+    """Keep the widest row floor of one view column up to date.
+
+    `apply_minimum_thumbnail_width` needs the widest floor among the laid-out
+    rows on every resize that could breach it. Walking the tree for that is
+    O(n) in Python per resize, so the floors are kept per row instead, in a
+    counted multiset with a lazy max-heap over its widths, and updated from
+    the model's and the view's signals:
+
+    - `rowsInserted` and `expanded` add the rows they lay out.
+    - `rowsAboutToBeRemoved` and `collapsed` drop the rows they hide.
+    - `dataChanged` re-measures the changed rows.
+    - A layout change, reset, move, a new model or a change to the
+      delegate's `show_*` settings measures everything again.
+
+    Reading the floor is then O(log n), amortized.
+
+    Args:
+        view: The tree view whose column to track.
+        column: The column.
+    """
+
+    def __init__(self, view: QWidget, column: int):
+        super().__init__(view)
+        self._view = view
+        self._column = column
+        self._model: Optional[QAbstractItemModel] = None
+        self._model_handlers: List[Tuple] = []
+        self._delegate_state: Optional[Tuple] = None
+        self._floors: Dict[QPersistentModelIndex, int] = {}
+        self._counts: Dict[int, int] = {}
+        self._heap: List[int] = []
+        self._stale = True
+
+        view.expanded.connect(self._on_expanded)
+        view.collapsed.connect(self._on_collapsed)
+
+    def invalidate(self) -> None:
+        """Measure every row again on the next `floor()`."""
+        self._stale = True
+
+    def floor(self) -> int:
+        """Return the widest floor among the laid-out rows.
+
+        Returns:
+            The floor in pixels, or 0 when the view has no model or the
+            column is not painted by a `FXThumbnailDelegate`.
+        """
+
+        if self._view.model() is not self._model:
+            self._watch(self._view.model())
+        delegate = FXThumbnailDelegate._delegate_for_column(
+            self._view, self._column
+        )
+        if self._model is None or delegate is None:
+            return 0
+
+        # The floors depend on which elements the delegate shows
+        delegate_state = (
+            id(delegate),
+            delegate._show_thumbnail,
+            delegate._show_status_dot,
+            delegate._show_status_label,
+        )
+        if self._stale or delegate_state != self._delegate_state:
+            self._delegate_state = delegate_state
+            self._rebuild()
+
+        heap, counts = self._heap, self._counts
+        while heap and not counts.get(-heap[0]):
+            heapq.heappop(heap)
+        return -heap[0] if heap else 0
+
+    def _watch(self, model: Optional[QAbstractItemModel]) -> None:
+        if self._model is not None and is_valid(self._model):
+            for signal, handler in self._model_handlers:
+                signal.disconnect(handler)
+        self._model_handlers = []
+        self._model = model
+        self._stale = True
+        if model is None:
+            return
+
+        self._model_handlers = [
+            (model.rowsInserted, self._on_rows_inserted),
+            (model.rowsAboutToBeRemoved, self._on_rows_about_to_be_removed),
+            (model.dataChanged, self._on_data_changed),
+            (model.layoutChanged, self.invalidate),
+            (model.modelReset, self.invalidate),
+            (model.rowsMoved, self.invalidate),
+        ]
+        for signal, handler in self._model_handlers:
+            signal.connect(handler)
+
+    def _rebuild(self) -> None:
+        self._floors.clear()
+        self._counts.clear()
+        self._heap = []
+        self._stale = False
+        self._add_below(QModelIndex())
+
+    def _measure(self, index: QModelIndex) -> int:
+        delegate = FXThumbnailDelegate._delegate_for_column(
+            self._view, self._column
+        )
+        if delegate is None:
+            return 0
+        # A null rect starts at x 0, so the row floors come out as offsets
+        return delegate._row_minimum_width(
+            QStyleOptionViewItem(), index, delegate._has_thumbnail(index)
+        )
+
+    def _add(self, index: QModelIndex) -> None:
+        key = QPersistentModelIndex(index)
+        if key in self._floors:
+            self._discard(key)
+        width = self._measure(index)
+        self._floors[key] = width
+        count = self._counts.get(width, 0)
+        self._counts[width] = count + 1
+        if not count:
+            heapq.heappush(self._heap, -width)
+
+        # Widths that came and went leave stale heap entries behind
+        if len(self._heap) > 2 * len(self._counts) + 64:
+            self._heap = [-width for width in self._counts]
+            heapq.heapify(self._heap)
+
+    def _discard(self, key: QPersistentModelIndex) -> None:
+        width = self._floors.pop(key)
+        count = self._counts[width] - 1
+        if count:
+            self._counts[width] = count
+        else:
+            del self._counts[width]
+
+    def _add_below(self, parent: QModelIndex) -> None:
+        for index in FXThumbnailDelegate._laid_out_indexes(
+            self._view, self._column, parent
+        ):
+            self._add(index)
+
+    def _discard_below(self, parent: QModelIndex) -> None:
+        # Only tracked rows can have tracked children, so the walk stops at
+        # the first row that is not laid out
+        model = self._model
+        parents = [parent]
+        while parents:
+            parent = parents.pop()
+            for row in range(model.rowCount(parent)):
+                key = QPersistentModelIndex(
+                    model.index(row, self._column, parent)
+                )
+                if key in self._floors:
+                    self._discard(key)
+                    parents.append(model.index(row, self._column, parent))
+
+    def _is_laid_out(self, parent: QModelIndex) -> bool:
+        """Whether the children of `parent` are laid out."""
+        if not parent.isValid():
+            return True
+        parent = parent.sibling(parent.row(), self._column)
+        return QPersistentModelIndex(parent) in self._floors and (
+            self._view.isExpanded(parent)
+        )
+
+    def _on_rows_inserted(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        if self._stale or not self._is_laid_out(parent):
+            return
+        model = self._model
+        for row in range(first, last + 1):
+            index = model.index(row, self._column, parent)
+            self._add(index)
+            if model.hasChildren(index) and self._view.isExpanded(index):
+                self._add_below(index)
+
+    def _on_rows_about_to_be_removed(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        if self._stale or not self._is_laid_out(parent):
+            return
+        model = self._model
+        for row in range(first, last + 1):
+            index = model.index(row, self._column, parent)
+            key = QPersistentModelIndex(index)
+            if key in self._floors:
+                self._discard(key)
+                self._discard_below(index)
+
+    def _on_data_changed(
+        self, top_left: QModelIndex, bottom_right: QModelIndex, _roles=()
+    ) -> None:
+        if self._stale:
+            return
+        model = self._model
+        parent = top_left.parent()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            index = model.index(row, self._column, parent)
+            if QPersistentModelIndex(index) in self._floors:
+                self._add(index)
+
+    def _on_expanded(self, index: QModelIndex) -> None:
+        if self._stale or self._model is None:
+            return
+        index = index.sibling(index.row(), self._column)
+        if QPersistentModelIndex(index) in self._floors:
+            self._add_below(index)
+
+    def _on_collapsed(self, index: QModelIndex) -> None:
+        if self._stale or self._model is None:
+            return
+        self._discard_below(index.sibling(index.row(), self._column))
+
+
 def example() -> None:
     import sys
     from qtpy.QtWidgets import (
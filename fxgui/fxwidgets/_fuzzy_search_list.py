@@ -5,10 +5,11 @@ __author__ = "Valentin Beaumont"
 __email__ = "valentin.onze@gmail.com"
 
 # Built-in
-from typing import List, Optional, Union
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Union
 
 # Third-party
-from qtpy.QtCore import Qt, Signal, Slot, QModelIndex
+from qtpy.QtCore import QAbstractItemModel, Qt, Signal, Slot, QModelIndex
 from qtpy.QtGui import QStandardItemModel, QStandardItem
 from qtpy.QtWidgets import (
     QAbstractItemView,
@@ -24,7 +25,11 @@ from qtpy.QtWidgets import (
 
 # Internal
 from fxgui import fxicons, fxstyle
-from fxgui.fxcore import FXSortFilterProxyModel
+from fxgui.fxcore import (
+    FXSortFilterProxyModel,
+    FXStringListModel,
+    _FXChunkFeeder,
+)
 from fxgui.fxwidgets._search_bar import FXSearchBar
 from fxgui.fxwidgets._tips import apply_tip
 
@@ -42,6 +47,12 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         ratio: Initial similarity ratio threshold (0.0 to 1.0).
         show_ratio_slider: Whether to show the ratio adjustment slider.
         color_match: Whether to color items based on match quality.
+        max_results: The most matches to show while searching, best first,
+            or 0 to show every match.
+        lightweight_model: Whether to keep the items in an
+            `FXStringListModel` rather than a `QStandardItemModel`. Loading
+            hundreds of thousands of items is then much faster and lighter,
+            but rows carry their text only: no icons or custom roles.
 
     Signals:
         item_selected: Emitted when an item is clicked. Passes the item text.
@@ -51,6 +62,13 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
             Passes the item text.
         selection_changed: Emitted when the selection changes.
             Passes a list of selected item texts.
+        loading_progress: Emitted as `add_items()` inserts a chunk.
+            Passes the number of items inserted so far.
+        loading_finished: Emitted once `add_items()` has inserted every
+            item. Passes the number of items inserted.
+        filter_stats: Emitted after each filter pass. Passes an
+            `FXFilterStats` with the rows scored and accepted, and the
+            time spent scoring and sorting them.
 
     Examples:
         Basic usage with a list of strings:
@@ -69,6 +87,9 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
     item_double_clicked = Signal(str)
     item_activated = Signal(str)
     selection_changed = Signal(list)
+    loading_progress = Signal(int)
+    loading_finished = Signal(int)
+    filter_stats = Signal(object)
 
     def __init__(
         self,
@@ -77,11 +98,14 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         ratio: float = 0.5,
         show_ratio_slider: bool = False,
         color_match: bool = True,
+        max_results: int = 0,
+        lightweight_model: bool = False,
     ):
         super().__init__(parent)
 
         self._ratio = ratio
         self._color_match = color_match
+        self._max_results = max(0, max_results)
 
         # Main layout
         layout = QVBoxLayout(self)
@@ -134,13 +158,21 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         layout.addWidget(self._slider_container)
 
         # Model setup
-        self._source_model = QStandardItemModel(self)
+        if lightweight_model:
+            self._source_model = FXStringListModel(parent=self)
+        else:
+            self._source_model = QStandardItemModel(self)
         self._proxy_model = FXSortFilterProxyModel(
             ratio=ratio,
             color_match=color_match,
             parent=self,
         )
+        self._proxy_model.set_max_results(self._max_results)
         self._proxy_model.setSourceModel(self._source_model)
+        self._rows = _FXTextRows(self._source_model)
+        self._feeder = _FXChunkFeeder(self._insert_chunk, parent=self)
+        self._feeder.progress.connect(self.loading_progress)
+        self._feeder.finished.connect(self.loading_finished)
 
         # List view
         self._list_view = QListView()
@@ -162,6 +194,7 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
             self._proxy_model.set_filter_text
         )
         self._search_bar.search_submitted.connect(self._on_search_submitted)
+        self._proxy_model.filter_stats.connect(self.filter_stats)
 
         # Slider -> proxy model
         self._ratio_slider.valueChanged.connect(self._on_ratio_changed)
@@ -225,6 +258,10 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         Args:
             items: List of strings to display.
         """
+        self._feeder.stop()
+        if isinstance(self._source_model, FXStringListModel):
+            self._source_model.set_strings(items)
+            return
         self._source_model.clear()
         for item in items:
             self._source_model.appendRow(QStandardItem(item))
@@ -232,11 +269,50 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
     def add_item(self, text: str) -> None:
         """Add a single item to the list.
 
+        With `lightweight_model`, items added in a row are inserted
+        together once the event loop is back.
+
         Args:
             text: The item text to add.
         """
+        if isinstance(self._source_model, FXStringListModel):
+            self._source_model.append_string(text)
+            return
         self._source_model.appendRow(QStandardItem(text))
 
+    def add_items(self, items: Iterable[str], chunk_size: int = 1000) -> None:
+        """Add items from an iterable, a chunk at a time.
+
+        The iterable is read from the event loop, `chunk_size` items per
+        turn, so a slow generator (a database cursor, a directory walk)
+        does not freeze the widget. Each chunk is inserted as one block of
+        rows, and filtered as it arrives with the current search text.
+        Items added while a previous iterable is still being read follow
+        it. `set_items()` and `clear()` drop the items not read yet.
+
+        Args:
+            items: The item texts to add.
+            chunk_size: How many items to read and insert per turn.
+        """
+        self._feeder.feed(items, chunk_size)
+
+    def is_loading(self) -> bool:
+        """Return whether `add_items()` still has items to read.
+
+        Returns:
+            True while an iterable passed to `add_items()` has not run out.
+        """
+        return self._feeder.is_running()
+
+    def _insert_chunk(self, texts: List[str]) -> None:
+        """Insert texts as one block of rows."""
+        if isinstance(self._source_model, FXStringListModel):
+            self._source_model.append_strings(texts)
+            return
+        self._source_model.invisibleRootItem().appendRows(
+            [QStandardItem(text) for text in texts]
+        )
+
     def remove_item(self, text: str) -> bool:
         """Remove an item from the list by its text.
 
@@ -246,15 +322,30 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         Returns:
             True if the item was found and removed, False otherwise.
         """
-        for row in range(self._source_model.rowCount()):
-            item = self._source_model.item(row)
-            if item and item.text() == text:
-                self._source_model.removeRow(row)
-                return True
-        return False
+        rows = self._rows.rows(text)
+        if not rows:
+            return False
+        return self._source_model.removeRow(rows[0])
+
+    def remove_items(self, texts: Iterable[str]) -> int:
+        """Remove every item whose text is one of `texts`.
+
+        Adjacent rows are removed together, in one model call per run.
+
+        Args:
+            texts: The item texts to remove.
+
+        Returns:
+            The number of items removed.
+        """
+        rows = sorted(
+            {row for text in set(texts) for row in self._rows.rows(text)}
+        )
+        return self._rows.remove(rows)
 
     def clear(self) -> None:
         """Clear all items from the list."""
+        self._feeder.stop()
         self._source_model.clear()
 
     def clear_search(self) -> None:
@@ -268,6 +359,8 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         Returns:
             List of all item texts.
         """
+        if isinstance(self._source_model, FXStringListModel):
+            return self._source_model.strings()
         return [
             self._source_model.item(row).text()
             for row in range(self._source_model.rowCount())
@@ -281,6 +374,15 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         Returns:
             List of visible item texts.
         """
+        if isinstance(self._source_model, FXStringListModel):
+            self._source_model.flush()
+            proxy = self._proxy_model
+            return [
+                self._source_model.string(
+                    proxy.mapToSource(proxy.index(row, 0)).row()
+                )
+                for row in range(proxy.rowCount())
+            ]
         return [
             self._proxy_model.index(row, 0).data(Qt.DisplayRole)
             for row in range(self._proxy_model.rowCount())
@@ -346,6 +448,28 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         self._ratio_slider.setValue(int(self._ratio * 100))
         self._proxy_model.set_ratio(self._ratio)
 
+    @property
+    def max_results(self) -> int:
+        """Return the most matches shown while searching.
+
+        Returns:
+            The number of matches, or 0 when every match is shown.
+        """
+        return self._max_results
+
+    @max_results.setter
+    def max_results(self, value: int) -> None:
+        """Set the most matches shown while searching.
+
+        Only the best matches are ranked and laid out, which keeps
+        searching a very large list fast.
+
+        Args:
+            value: The number of matches, or 0 to show every match.
+        """
+        self._max_results = max(0, int(value))
+        self._proxy_model.set_max_results(self._max_results)
+
     def show_ratio_slider(self, visible: bool = True) -> None:
         """Show or hide the ratio adjustment slider.
 
@@ -388,9 +512,11 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         Returns:
             True if the item was found and selected, False otherwise.
         """
-        for row in range(self._proxy_model.rowCount()):
-            index = self._proxy_model.index(row, 0)
-            if index.data(Qt.DisplayRole) == text:
+        for row in self._rows.rows(text):
+            index = self._proxy_model.mapFromSource(
+                self._source_model.index(row, 0)
+            )
+            if index.isValid():
                 self._list_view.setCurrentIndex(index)
                 return True
         return False
@@ -400,11 +526,12 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         self._search_bar.setFocus()
 
     @property
-    def source_model(self) -> QStandardItemModel:
+    def source_model(self) -> Union[QStandardItemModel, FXStringListModel]:
         """Return the source model for advanced customization.
 
         Returns:
-            The underlying QStandardItemModel.
+            The underlying QStandardItemModel, or FXStringListModel with
+            `lightweight_model`.
         """
         return self._source_model
 
@@ -427,6 +554,222 @@ class FXFuzzySearchList(fxstyle.FXThemeAware, QWidget):
         return self._list_view
 
 
+class _FXTextRows:
+    """The rows of a flat model by display text, duplicates included.
+
+    The index follows the model in place. Each row indexed takes a slot,
+    numbered in the order rows were indexed, and a Fenwick tree counts
+    the slots still in the model: a row's number is the count of those
+    up to its slot, so removing or editing a row, or finding the rows of
+    a text, costs O(log n) per row and renumbers nothing. Appended rows
+    take new slots. Rows inserted elsewhere or moved are reindexed from
+    the texts kept in the slots, without reading the model again, and so
+    are the slots once more of them are removed than kept. A reset or a
+    layout change marks the index stale, and the next lookup reads the
+    model in one walk.
+
+    Args:
+        model: The flat model to index.
+    """
+
+    def __init__(self, model: QAbstractItemModel):
+        self._model = model
+        # The slots of each text, ascending, and the text of each slot,
+        # None once its row is removed
+        self._slots: Dict[str, List[int]] = {}
+        self._texts: List[Optional[str]] = []
+        # Fenwick tree over the slots, 1-based, counting the kept ones
+        self._tree: List[int] = [0]
+        self._count = 0
+        self._stale = True
+        self._rebuilds = 0
+
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.rowsMoved.connect(self._on_rows_moved)
+        model.dataChanged.connect(self._on_data_changed)
+        model.modelReset.connect(self._mark_stale)
+        model.layoutChanged.connect(self._mark_stale)
+
+    def rows(self, text: str) -> List[int]:
+        """Return the rows showing a text.
+
+        Args:
+            text: The display text.
+
+        Returns:
+            The rows, in ascending order.
+        """
+        if isinstance(self._model, FXStringListModel):
+            self._model.flush()
+        if self._stale:
+            self._stale = False
+            self._rebuilds += 1
+            self._reindex(self._read(0, self._model.rowCount() - 1))
+        return [self._row(slot) for slot in self._slots.get(text, ())]
+
+    def remove(self, rows: List[int]) -> int:
+        """Remove rows, one model call per run of adjacent rows.
+
+        Args:
+            rows: The rows to remove, in ascending order.
+
+        Returns:
+            The number of rows removed.
+        """
+        runs = []
+        for row in rows:
+            if runs and runs[-1][1] == row - 1:
+                runs[-1][1] = row
+            else:
+                runs.append([row, row])
+        # Last run first, so the earlier rows keep their numbers
+        removed = 0
+        for first, last in reversed(runs):
+            if self._model.removeRows(first, last - first + 1):
+                removed += last - first + 1
+        return removed
+
+    def _read(self, first: int, last: int) -> List[str]:
+        model = self._model
+        return [
+            model.index(row, 0).data(Qt.DisplayRole)
+            for row in range(first, last + 1)
+        ]
+
+    def _reindex(self, texts: List[str]) -> None:
+        """Give the rows showing ``texts``, in order, one slot each."""
+        self._texts = list(texts)
+        self._count = len(texts)
+        self._slots = {}
+        for slot, text in enumerate(texts):
+            self._slots.setdefault(text, []).append(slot)
+        # Every slot is kept: build the tree of ones in one pass
+        size = len(texts)
+        tree = [0] + [1] * size
+        for position in range(1, size + 1):
+            parent = position + (position & -position)
+            if parent <= size:
+                tree[parent] += tree[position]
+        self._tree = tree
+
+    def _kept_texts(self) -> List[str]:
+        return [text for text in self._texts if text is not None]
+
+    def _prefix(self, position: int) -> int:
+        """Count the kept slots among the first ``position`` slots."""
+        tree = self._tree
+        count = 0
+        while position > 0:
+            count += tree[position]
+            position -= position & -position
+        return count
+
+    def _row(self, slot: int) -> int:
+        return self._prefix(slot + 1) - 1
+
+    def _slot(self, row: int) -> int:
+        """Return the slot of a row, the kept slot numbered ``row``."""
+        tree = self._tree
+        size = len(tree) - 1
+        position = 0
+        remaining = row + 1
+        step = 1 << size.bit_length()
+        while step:
+            following = position + step
+            if following <= size and tree[following] < remaining:
+                position = following
+                remaining -= tree[following]
+            step >>= 1
+        return position
+
+    def _append(self, text: str) -> None:
+        slot = len(self._texts)
+        self._texts.append(text)
+        position = slot + 1
+        self._tree.append(
+            1 + self._prefix(position - 1)
+            - self._prefix(position - (position & -position))
+        )
+        self._slots.setdefault(text, []).append(slot)
+        self._count += 1
+
+    def _drop(self, slot: int) -> None:
+        """Forget the text of a slot, which stays counted in the tree."""
+        text = self._texts[slot]
+        slots = self._slots[text]
+        del slots[bisect_left(slots, slot)]
+        if not slots:
+            del self._slots[text]
+
+    def _on_rows_inserted(self, _parent: QModelIndex, first: int, last: int):
+        if self._stale:
+            return
+        texts = self._read(first, last)
+        if first == self._count:
+            for text in texts:
+                self._append(text)
+            return
+        kept = self._kept_texts()
+        kept[first:first] = texts
+        self._reindex(kept)
+
+    def _on_rows_removed(self, _parent: QModelIndex, first: int, last: int):
+        if self._stale:
+            return
+        # Last row first, so the earlier rows keep their numbers
+        tree = self._tree
+        size = len(tree) - 1
+        for row in range(last, first - 1, -1):
+            slot = self._slot(row)
+            self._drop(slot)
+            self._texts[slot] = None
+            position = slot + 1
+            while position <= size:
+                tree[position] -= 1
+                position += position & -position
+        self._count -= last - first + 1
+        if self._count < len(self._texts) - self._count:
+            self._reindex(self._kept_texts())
+
+    def _on_rows_moved(
+        self,
+        _parent: QModelIndex,
+        first: int,
+        last: int,
+        _destination_parent: QModelIndex,
+        destination: int,
+    ) -> None:
+        if self._stale:
+            return
+        kept = self._kept_texts()
+        moved = kept[first : last + 1]
+        del kept[first : last + 1]
+        if destination > last:
+            destination -= len(moved)
+        kept[destination:destination] = moved
+        self._reindex(kept)
+
+    def _on_data_changed(
+        self,
+        top_left: QModelIndex,
+        bottom_right: QModelIndex,
+        roles: Optional[List[int]] = None,
+    ) -> None:
+        if self._stale or (roles and Qt.DisplayRole not in roles):
+            return
+        first, last = top_left.row(), bottom_right.row()
+        for row, text in enumerate(self._read(first, last), first):
+            slot = self._slot(row)
+            if text != self._texts[slot]:
+                self._drop(slot)
+                self._texts[slot] = text
+                insort(self._slots.setdefault(text, []), slot)
+
+    def _mark_stale(self, *_args) -> None:
+        self._stale = True
+
+
 def example() -> None:
     """Run an example demonstrating the FXFuzzySearchList widget."""
     import sys
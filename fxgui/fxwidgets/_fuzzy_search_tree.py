@@ -5,10 +5,10 @@ __author__ = "Valentin Beaumont"
 __email__ = "valentin.onze@gmail.com"
 
 # Built-in
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 # Third-party
-from qtpy.QtCore import Qt, Signal, Slot, QModelIndex
+from qtpy.QtCore import Qt, Signal, Slot, QModelIndex, QTimer
 from qtpy.QtGui import QStandardItemModel, QStandardItem
 from qtpy.QtWidgets import (
     QAbstractItemView,
@@ -24,11 +24,18 @@ from qtpy.QtWidgets import (
 
 # Internal
 from fxgui import fxicons, fxstyle
-from fxgui.fxcore import FXSortFilterProxyModel
+from fxgui.fxcore import FXSortFilterProxyModel, _FXChunkFeeder
 from fxgui.fxwidgets._search_bar import FXSearchBar
 from fxgui.fxwidgets._tips import apply_tip
 
 
+# What a children provider yields: a text, which may have children, or a
+# text and whether it has any
+_ChildEntry = Union[str, Tuple[str, bool]]
+ChildrenProvider = Callable[[Optional[str]], Iterable[_ChildEntry]]
+SearchProvider = Callable[[str], Iterable[str]]
+
+
 class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
     """A searchable tree widget with fuzzy matching capabilities.
 
@@ -39,6 +46,11 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
     The tree supports hierarchical data with parent-child relationships.
     When filtering, parent items remain visible if any of their children match.
 
+    Items are looked up by text or by path, their text and the texts above
+    them joined with `path_separator` (`"Characters/Hero"`). Several items
+    may share a text; a text alone then finds the first one added, and a
+    path tells them apart.
+
     Args:
         parent: Parent widget.
         placeholder: Placeholder text for the search input.
@@ -56,6 +68,13 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
             Passes a list of selected item texts.
         item_expanded: Emitted when an item is expanded. Passes the item text.
         item_collapsed: Emitted when an item is collapsed. Passes the item text.
+        loading_progress: Emitted as `add_items()` inserts a chunk.
+            Passes the number of items inserted so far.
+        loading_finished: Emitted once `add_items()` has inserted every
+            item. Passes the number of items inserted.
+        filter_stats: Emitted after each filter pass. Passes an
+            `FXFilterStats` with the rows scored and accepted, and the
+            time spent scoring and sorting them.
 
     Examples:
         Basic usage with hierarchical data:
@@ -73,6 +92,13 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
         ...     "Props": ["sword", "shield", "chair"],
         ...     "Vehicles": ["car", "truck", "motorcycle"],
         ... })
+
+        Loading children only when their parent is expanded:
+
+        >>> fuzzy_tree.set_provider(
+        ...     lambda path: database.children(path),
+        ...     search_provider=lambda text: database.find(text),
+        ... )
     """
 
     item_selected = Signal(str)
@@ -81,6 +107,11 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
     selection_changed = Signal(list)
     item_expanded = Signal(str)
     item_collapsed = Signal(str)
+    loading_progress = Signal(int)
+    loading_finished = Signal(int)
+    filter_stats = Signal(object)
+
+    path_separator = "/"
 
     def __init__(
         self,
@@ -94,7 +125,11 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
 
         self._ratio = ratio
         self._color_match = color_match
-        self._item_map: Dict[str, QStandardItem] = {}
+        # Every item by text and by path, in the order they were added
+        self._item_map: Dict[str, List[QStandardItem]] = {}
+        self._path_map: Dict[str, List[QStandardItem]] = {}
+        self._provider: Optional[ChildrenProvider] = None
+        self._search_provider: Optional[SearchProvider] = None
 
         # Main layout
         layout = QVBoxLayout(self)
@@ -147,13 +182,17 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
         layout.addWidget(self._slider_container)
 
         # Model setup
-        self._source_model = QStandardItemModel(self)
+        self._source_model = _FXLazyTreeModel(self)
+        self._source_model.fetch_children = self._fetch_children
         self._proxy_model = _FXTreeSortFilterProxyModel(
             ratio=ratio,
             color_match=color_match,
             parent=self,
         )
         self._proxy_model.setSourceModel(self._source_model)
+        self._feeder = _FXChunkFeeder(self._insert_chunk, parent=self)
+        self._feeder.progress.connect(self.loading_progress)
+        self._feeder.finished.connect(self.loading_finished)
 
         # Tree view
         self._tree_view = QTreeView()
@@ -178,6 +217,9 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
 
         # Slider -> proxy model
         self._ratio_slider.valueChanged.connect(self._on_ratio_changed)
+        # A time-sliced filter shows its rows after the search text changed
+        self._proxy_model.filtering_finished.connect(self._on_filtering_finished)
+        self._proxy_model.filter_stats.connect(self.filter_stats)
 
         # Tree view signals
         self._tree_view.clicked.connect(self._on_item_clicked)
@@ -192,10 +234,20 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
     @Slot(str)
     def _on_search_changed(self, text: str) -> None:
         """Handle search text changes."""
+        if text and self._search_provider is not None:
+            # Load the branches down to matches not fetched yet
+            for path in self._search_provider(text):
+                self._load_path(path)
         self._proxy_model.set_filter_text(text)
         # Auto-expand all items when searching to show matches
         if text:
-            self._tree_view.expandAll()
+            self.expand_all()
+
+    @Slot()
+    def _on_filtering_finished(self) -> None:
+        """Expand the rows a time-sliced filter pass has just shown."""
+        if self._search_bar.text:
+            self.expand_all()
 
     @Slot(int)
     def _on_ratio_changed(self, value: int) -> None:
@@ -284,7 +336,8 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
 
         Args:
             text: The item text to add.
-            parent: The parent item text. If None, adds as top-level item.
+            parent: The parent item text or path. If None, adds as
+                top-level item.
             data: Optional dictionary of user data to store on the item.
 
         Returns:
@@ -295,54 +348,267 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
             for key, value in data.items():
                 item.setData(value, Qt.UserRole + hash(key) % 1000)
 
-        if parent and parent in self._item_map:
-            parent_item = self._item_map[parent]
+        parent_item = self._find_item(parent) if parent else None
+        if parent_item is not None:
             parent_item.appendRow(item)
+            path = self._item_path(parent_item) + self.path_separator + text
         else:
             self._source_model.appendRow(item)
+            path = text
 
-        self._item_map[text] = item
+        self._item_map.setdefault(text, []).append(item)
+        self._path_map.setdefault(path, []).append(item)
         return item
 
+    def add_items(
+        self,
+        items: Iterable[Union[str, Tuple[str, Optional[str]]]],
+        chunk_size: int = 1000,
+    ) -> None:
+        """Add items from an iterable, a chunk at a time.
+
+        The iterable is read from the event loop, `chunk_size` items per
+        turn, so a slow generator (a database query, a directory walk)
+        does not freeze the widget. The items of a chunk sharing a parent
+        are inserted as one block of rows, and filtered as they arrive
+        with the current search text. Items added while a previous
+        iterable is still being read follow it. `set_items()` and
+        `clear()` drop the items not read yet.
+
+        Args:
+            items: Top-level item texts, or `(text, parent)` tuples where
+                the parent is an item text or path, or None. A parent may
+                come earlier in the same iterable.
+            chunk_size: How many items to read per turn.
+        """
+        self._feeder.feed(items, chunk_size)
+
+    def is_loading(self) -> bool:
+        """Return whether `add_items()` still has items to read.
+
+        Returns:
+            True while an iterable passed to `add_items()` has not run out.
+        """
+        return self._feeder.is_running()
+
+    def _insert_chunk(
+        self, entries: List[Union[str, Tuple[str, Optional[str]]]]
+    ) -> None:
+        """Insert entries, one block of rows per run sharing a parent."""
+        run: List[QStandardItem] = []
+        run_parent = None
+
+        def insert_run():
+            if not run:
+                return
+            parent_item = self._find_item(run_parent) if run_parent else None
+            if parent_item is None:
+                parent_item = self._source_model.invisibleRootItem()
+                prefix = ""
+            else:
+                prefix = self._item_path(parent_item) + self.path_separator
+            for item in run:
+                text = item.text()
+                self._item_map.setdefault(text, []).append(item)
+                self._path_map.setdefault(prefix + text, []).append(item)
+            parent_item.appendRows(run)
+
+        for entry in entries:
+            text, parent = (entry, None) if isinstance(entry, str) else entry
+            if parent != run_parent:
+                insert_run()
+                run = []
+                run_parent = parent
+            run.append(QStandardItem(text))
+        insert_run()
+
+    def set_provider(
+        self,
+        provider: ChildrenProvider,
+        search_provider: Optional[SearchProvider] = None,
+    ) -> None:
+        """Load the tree from callbacks, one branch at a time.
+
+        The top-level items are loaded now, and the children of an item
+        the first time it is expanded, so a hierarchy too large to build
+        up front shows at once and holds only the branches opened.
+
+        Searching filters the items loaded. To match items in branches
+        not opened yet, give a `search_provider`: the branches down to the
+        paths it returns are loaded before the tree is filtered.
+
+        `set_items()` and `clear()` go back to items added up front.
+
+        Args:
+            provider: Called with the path of an item (`None` for the top
+                level), returns its children. A child is either a text,
+                whose own children are asked for on expand, or a
+                `(text, has_children)` tuple; leaves should say so, so
+                they show no expand arrow.
+            search_provider: Called with the search text, returns the
+                paths of the items matching it.
+        """
+        self.clear()
+        self._provider = provider
+        self._search_provider = search_provider
+        self._fetch_children(None)
+
+    def _fetch_children(self, parent_item: Optional[QStandardItem]) -> None:
+        """Ask the provider for the children of an item, and add them."""
+        if self._provider is None:
+            return
+        if parent_item is None:
+            parent_path = None
+            prefix = ""
+            parent_item = self._source_model.invisibleRootItem()
+        else:
+            parent_path = self._item_path(parent_item)
+            prefix = parent_path + self.path_separator
+
+        children = []
+        for entry in self._provider(parent_path):
+            text, has_children = (
+                (entry, True) if isinstance(entry, str) else entry
+            )
+            item = QStandardItem(text)
+            if has_children:
+                item.setData(True, _CHILDREN_PENDING_ROLE)
+            children.append(item)
+            self._item_map.setdefault(text, []).append(item)
+            self._path_map.setdefault(prefix + text, []).append(item)
+        if children:
+            # One insertion for the whole branch
+            parent_item.appendRows(children)
+
+    def _load_path(self, path: str) -> None:
+        """Load the branches down to an item, if the provider has it."""
+        parts = path.split(self.path_separator)
+        for depth in range(1, len(parts)):
+            items = self._path_map.get(
+                self.path_separator.join(parts[:depth])
+            )
+            if not items:
+                return
+            index = self._source_model.indexFromItem(items[0])
+            if self._source_model.canFetchMore(index):
+                self._source_model.fetchMore(index)
+
     def remove_item(self, text: str) -> bool:
         """Remove an item from the tree by its text.
 
         Args:
-            text: The item text to remove.
+            text: The item text or path to remove.
 
         Returns:
             True if the item was found and removed, False otherwise.
         """
-        if text not in self._item_map:
+        item = self._find_item(text)
+        if item is None:
             return False
 
-        item = self._item_map[text]
+        # Remove from map, including any children
+        self._remove_from_map(item)
         parent = item.parent()
-
         if parent:
             parent.removeRow(item.row())
         else:
             self._source_model.removeRow(item.row())
-
-        # Remove from map, including any children
-        self._remove_from_map(item)
         return True
 
-    def _remove_from_map(self, item: QStandardItem) -> None:
-        """Recursively remove item and its children from the item map."""
-        text = item.text()
-        if text in self._item_map:
-            del self._item_map[text]
+    def remove_items(self, texts: Iterable[str]) -> int:
+        """Remove every item whose text or path is one of `texts`.
 
-        for row in range(item.rowCount()):
-            child = item.child(row)
-            if child:
-                self._remove_from_map(child)
+        Adjacent rows under the same parent are removed together, in one
+        model call per run.
+
+        Args:
+            texts: The item texts or paths to remove.
+
+        Returns:
+            The number of items removed, not counting their children.
+        """
+        found = {}
+        for text in set(texts):
+            for item in self._path_map.get(text, []) + self._item_map.get(
+                text, []
+            ):
+                found[id(item)] = item
+
+        # Items below another removed item go with it
+        rows_by_parent: Dict[int, Tuple[Optional[QStandardItem], List[int]]] = {}
+        for item in found.values():
+            parent = item.parent()
+            ancestor = parent
+            while ancestor is not None and id(ancestor) not in found:
+                ancestor = ancestor.parent()
+            if ancestor is not None:
+                continue
+            self._remove_from_map(item)
+            rows_by_parent.setdefault(id(parent), (parent, []))[1].append(
+                item.row()
+            )
+
+        removed = 0
+        for parent, rows in rows_by_parent.values():
+            runs = []
+            for row in sorted(rows):
+                if runs and runs[-1][1] == row - 1:
+                    runs[-1][1] = row
+                else:
+                    runs.append([row, row])
+            # Last run first, so the earlier rows keep their numbers
+            for first, last in reversed(runs):
+                if parent is not None:
+                    parent.removeRows(first, last - first + 1)
+                else:
+                    self._source_model.removeRows(first, last - first + 1)
+                removed += last - first + 1
+        return removed
+
+    def _find_item(self, text: str) -> Optional[QStandardItem]:
+        """Return the first item added with a path, or else a text."""
+        items = self._path_map.get(text) or self._item_map.get(text)
+        return items[0] if items else None
+
+    def _item_path(self, item: QStandardItem) -> str:
+        """Return the texts from the top-level item down to `item`."""
+        texts = []
+        while item is not None:
+            texts.append(item.text())
+            item = item.parent()
+        return self.path_separator.join(reversed(texts))
+
+    def _remove_from_map(self, item: QStandardItem) -> None:
+        """Remove an item and its descendants from the item maps."""
+        stack = [(item, self._item_path(item))]
+        while stack:
+            item, path = stack.pop()
+            for key, item_map in (
+                (item.text(), self._item_map),
+                (path, self._path_map),
+            ):
+                items = item_map.get(key, [])
+                for position, mapped in enumerate(items):
+                    if mapped is item:
+                        del items[position]
+                        break
+                if not items:
+                    item_map.pop(key, None)
+            for row in range(item.rowCount()):
+                child = item.child(row)
+                if child:
+                    stack.append(
+                        (child, path + self.path_separator + child.text())
+                    )
 
     def clear(self) -> None:
         """Clear all items from the tree."""
+        self._feeder.stop()
         self._source_model.clear()
         self._item_map.clear()
+        self._path_map.clear()
+        self._provider = None
+        self._search_provider = None
 
     def clear_search(self) -> None:
         """Clear the search input."""
@@ -352,19 +618,31 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
         """Get an item by its text.
 
         Args:
-            text: The item text to find.
+            text: The item text or path to find.
 
         Returns:
             The QStandardItem if found, None otherwise.
         """
-        return self._item_map.get(text)
+        return self._find_item(text)
+
+    def get_items(self, text: str) -> List[QStandardItem]:
+        """Get every item with a text or path.
+
+        Args:
+            text: The item text or path to find.
+
+        Returns:
+            The items, in the order they were added.
+        """
+        return list(self._path_map.get(text) or self._item_map.get(text, []))
 
     @property
     def items(self) -> List[str]:
         """Return all item texts in the source model.
 
         Returns:
-            List of all item texts (including nested items).
+            List of all item texts (including nested items), each text
+            once however many items show it.
         """
         return list(self._item_map.keys())
 
@@ -478,15 +756,15 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
         """Select an item by its text.
 
         Args:
-            text: The item text to select.
+            text: The item text or path to select.
 
         Returns:
             True if the item was found and selected, False otherwise.
         """
-        if text not in self._item_map:
+        item = self._find_item(text)
+        if item is None:
             return False
 
-        item = self._item_map[text]
         source_index = self._source_model.indexFromItem(item)
         proxy_index = self._proxy_model.mapFromSource(source_index)
 
@@ -499,19 +777,22 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
         """Expand an item by its text.
 
         Args:
-            text: The item text to expand.
+            text: The item text or path to expand.
 
         Returns:
             True if the item was found and expanded, False otherwise.
         """
-        if text not in self._item_map:
+        item = self._find_item(text)
+        if item is None:
             return False
 
-        item = self._item_map[text]
         source_index = self._source_model.indexFromItem(item)
         proxy_index = self._proxy_model.mapFromSource(source_index)
 
         if proxy_index.isValid():
+            # A hidden view would only load the children once shown
+            if self._source_model.canFetchMore(source_index):
+                self._source_model.fetchMore(source_index)
             self._tree_view.expand(proxy_index)
             return True
         return False
@@ -520,15 +801,15 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
         """Collapse an item by its text.
 
         Args:
-            text: The item text to collapse.
+            text: The item text or path to collapse.
 
         Returns:
             True if the item was found and collapsed, False otherwise.
         """
-        if text not in self._item_map:
+        item = self._find_item(text)
+        if item is None:
             return False
 
-        item = self._item_map[text]
         source_index = self._source_model.indexFromItem(item)
         proxy_index = self._proxy_model.mapFromSource(source_index)
 
@@ -538,8 +819,25 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
         return False
 
     def expand_all(self) -> None:
-        """Expand all items in the tree."""
-        self._tree_view.expandAll()
+        """Expand all items in the tree.
+
+        With a provider, only the items whose children are loaded are
+        expanded; expanding the others would load the whole hierarchy.
+        """
+        if self._provider is None:
+            self._tree_view.expandAll()
+            return
+
+        proxy = self._proxy_model
+        parents = [QModelIndex()]
+        while parents:
+            parent = parents.pop()
+            for row in range(proxy.rowCount(parent)):
+                index = proxy.index(row, 0, parent)
+                if proxy.canFetchMore(index) or not proxy.hasChildren(index):
+                    continue
+                self._tree_view.expand(index)
+                parents.append(index)
 
     def collapse_all(self) -> None:
         """Collapse all items in the tree."""
@@ -577,8 +875,76 @@ class FXFuzzySearchTree(fxstyle.FXThemeAware, QWidget):
         return self._tree_view
 
 
+# Marks an item whose children have not been asked for yet, past the roles
+# `add_item()` stores user data under and `FXSortFilterProxyModel`'s
+# `MATCH_SPANS_ROLE`
+_CHILDREN_PENDING_ROLE = Qt.UserRole + 1001
+
+
+class _FXLazyTreeModel(QStandardItemModel):
+    """Item model loading the children of an item when it is expanded.
+
+    Items marked with `_CHILDREN_PENDING_ROLE` report children before they
+    have any, and `fetchMore()` hands them to `fetch_children`, once.
+    Without such items, the model is a plain `QStandardItemModel`.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.fetch_children: Optional[
+            Callable[[QStandardItem], None]
+        ] = None
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() and parent.data(_CHILDREN_PENDING_ROLE):
+            return True
+        return super().hasChildren(parent)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return bool(parent.isValid() and parent.data(_CHILDREN_PENDING_ROLE))
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not self.canFetchMore(parent):
+            return
+        item = self.itemFromIndex(parent)
+        # Cleared first, so a view asking again while loading does not
+        item.setData(None, _CHILDREN_PENDING_ROLE)
+        if self.fetch_children is not None:
+            self.fetch_children(item)
+
+
 class _FXTreeSortFilterProxyModel(FXSortFilterProxyModel):
-    """Extended proxy model for tree views that keeps parents visible when children match."""
+    """Extended proxy model for tree views that keeps parents visible when children match.
+
+    Whether a row or any of its descendants matches is computed bottom-up
+    once per filter text, the first time Qt asks about the row's subtree,
+    and kept per source row: every later question about the subtree is a
+    lookup. Qt only filters the rows a source change touched, so when rows
+    are inserted, removed or edited the memo forgets their ancestors and
+    the rows are filtered again, from the memo, once the event loop is
+    back. Qt's recursive filtering would do the same per change, but asks
+    about every row of each hidden subtree again.
+    """
+
+    # A parent is shown when any descendant matches, so a block of rows
+    # cannot be shown on its own outcomes
+    _APPLIES_BLOCKS = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Keyed by a source row's row and internal id, which identify it
+        # until the source's structure changes
+        self._subtree_matches: Dict[Tuple[int, int], bool] = {}
+        self._ancestors_timer = QTimer(self)
+        self._ancestors_timer.setSingleShot(True)
+        self._ancestors_timer.timeout.connect(self.invalidateFilter)
+
+    def invalidate(self) -> None:
+        """Forget the subtree matches and filter every row again."""
+
+        self._ancestors_timer.stop()
+        self._subtree_matches.clear()
+        super().invalidate()
 
     def filterAcceptsRow(
         self, source_row: int, source_parent: QModelIndex
@@ -594,17 +960,180 @@ class _FXTreeSortFilterProxyModel(FXSortFilterProxyModel):
         Returns:
             bool: True if the row is accepted, False otherwise.
         """
-        # Check if the item itself matches
-        if super().filterAcceptsRow(source_row, source_parent):
+
+        if self._show_all or not self._filter_text or self._ratio <= 0.0:
+            self._pass_accepted += 1
             return True
 
-        # Check if any child matches (recursively)
-        source_index = self.sourceModel().index(source_row, 0, source_parent)
-        for row in range(self.sourceModel().rowCount(source_index)):
-            if self.filterAcceptsRow(row, source_index):
-                return True
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        found = self._subtree_matches.get((source_row, index.internalId()))
+        if found is None:
+            found = self._match_subtree(index)
+        if found:
+            self._pass_accepted += 1
+        return found
 
-        return False
+    def _match_subtree(self, index: QModelIndex) -> bool:
+        """Record whether each row of a subtree or its descendants match.
+
+        Rows already recorded are not visited again, so each row is tested
+        once per filter text however deep the tree is.
+
+        Args:
+            index: The source index at the root of the subtree.
+
+        Returns:
+            Whether the root row or any of its descendants match.
+        """
+
+        model = self.sourceModel()
+        matches = self._subtree_matches
+        passes = self._text_passes
+
+        # Post-order without recursion: [index, next row, rows, found]
+        stack = [
+            [
+                index,
+                0,
+                model.rowCount(index),
+                passes((index.data() or "").lower()),
+            ]
+        ]
+        while True:
+            top = stack[-1]
+            parent, row, rows, found = top
+            if row < rows:
+                top[1] += 1
+                child = model.index(row, 0, parent)
+                child_found = matches.get((row, child.internalId()))
+                if child_found is None:
+                    stack.append(
+                        [
+                            child,
+                            0,
+                            model.rowCount(child),
+                            passes((child.data() or "").lower()),
+                        ]
+                    )
+                elif child_found:
+                    top[3] = True
+                continue
+
+            stack.pop()
+            matches[(parent.row(), parent.internalId())] = found
+            if not stack:
+                return found
+            if found:
+                stack[-1][3] = True
+
+    def _source_signals(self, source_model) -> List:
+        """Return the source signals the proxy follows, with their handlers.
+
+        Args:
+            source_model: The new source model.
+
+        Returns:
+            `(signal, handler)` pairs.
+        """
+
+        return super()._source_signals(source_model) + [
+            (source_model.dataChanged, self._forget_changed),
+            (source_model.rowsInserted, self._forget_inserted),
+            (source_model.rowsAboutToBeRemoved, self._forget_removed),
+            (source_model.rowsRemoved, self._forget_moved_rows),
+            (source_model.rowsAboutToBeMoved, self._forget_all),
+            (source_model.layoutAboutToBeChanged, self._forget_all),
+        ]
+
+    def _reindex_source(self) -> None:
+        self._subtree_matches.clear()
+        super()._reindex_source()
+
+    def _forget_all(self, *_args) -> None:
+        self._subtree_matches.clear()
+        if self._filter_text and not self._show_all:
+            self._ancestors_timer.start()
+
+    def _forget_ancestors(self, index: QModelIndex) -> None:
+        """Forget a source row and every row above it, and filter again."""
+
+        if not index.isValid():
+            return
+        while index.isValid():
+            self._subtree_matches.pop((index.row(), index.internalId()), None)
+            index = index.parent()
+        if self._filter_text and not self._show_all:
+            self._ancestors_timer.start()
+
+    def _forget_rows(self, parent: QModelIndex, first: int) -> None:
+        """Forget the rows of a parent from `first` on, which change row."""
+
+        model = self.sourceModel()
+        for row in range(first, model.rowCount(parent)):
+            index = model.index(row, 0, parent)
+            self._subtree_matches.pop((row, index.internalId()), None)
+
+    def _forget_changed(
+        self,
+        top_left: QModelIndex,
+        bottom_right: QModelIndex,
+        roles: Optional[List[int]] = None,
+    ) -> None:
+        if roles and Qt.DisplayRole not in roles:
+            return
+        model = self.sourceModel()
+        parent = top_left.parent()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            index = model.index(row, 0, parent)
+            self._subtree_matches.pop((row, index.internalId()), None)
+        self._forget_ancestors(parent)
+
+    def _forget_moved_rows(
+        self, parent: QModelIndex, first: int, _last: int
+    ) -> None:
+        # The rows from `first` on are new or have moved
+        self._forget_rows(parent, first)
+        self._forget_ancestors(parent)
+
+    def _forget_inserted(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        self._forget_rows(parent, first)
+        if not parent.isValid():
+            return
+        if self._show_all or not self._filter_text or self._ratio <= 0.0:
+            self._forget_ancestors(parent)
+            return
+
+        # New rows can only show hidden ancestors: without a match among
+        # them, or with every ancestor already shown, nothing changes
+        model = self.sourceModel()
+        found = False
+        for row in range(first, last + 1):
+            found = self._match_subtree(model.index(row, 0, parent)) or found
+        if not found:
+            return
+        index = parent
+        while index.isValid():
+            if not self._subtree_matches.get((index.row(), index.internalId())):
+                self._forget_ancestors(parent)
+                return
+            index = index.parent()
+
+    def _forget_removed(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        # With their descendants, whose keys could be reused afterwards
+        model = self.sourceModel()
+        ranges = [(parent, first, last)]
+        while ranges:
+            range_parent, range_first, range_last = ranges.pop()
+            for row in range(range_first, range_last + 1):
+                index = model.index(row, 0, range_parent)
+                self._subtree_matches.pop((row, index.internalId()), None)
+                children = model.rowCount(index)
+                if children:
+                    ranges.append((index, 0, children - 1))
 
 
 def example() -> None:
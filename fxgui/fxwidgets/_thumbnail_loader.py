@@ -0,0 +1,548 @@
+"""Background thumbnail loading for `FXThumbnailDelegate`."""
+
+# Metadata
+__author__ = "Valentin Beaumont"
+__email__ = "valentin.onze@gmail.com"
+
+# Built-in
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Third-party
+from qtpy.QtCore import (
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    Qt,
+    Signal,
+    Slot,
+)
+from qtpy.QtGui import QImage, QImageReader, QPixmap
+from qtpy.QtWidgets import QAbstractItemView, QWidget
+
+# Internal
+from fxgui import fxconfig
+from fxgui._compat import is_valid
+
+
+# (path, logical width, logical height, device pixel ratio)
+_ThumbnailKey = Tuple[str, int, int, float]
+
+
+def _decode_thumbnail(path: str, width: int, height: int, dpr: float) -> QImage:
+    """Decode an image file straight to thumbnail size.
+
+    `QImageReader.setScaledSize` lets the formats that can (JPEG above all)
+    decode at reduced resolution instead of inflating a full plate and
+    shrinking it afterwards. Whatever the reader could not shrink is scaled
+    down smoothly here, so the result never exceeds the box it is drawn in.
+
+    Only `QImage` is touched, which is safe off the GUI thread; the caller
+    turns it into a `QPixmap` on the GUI thread.
+
+    Args:
+        path: The image file.
+        width: The logical width of the box the image must fit in.
+        height: The logical height of the box the image must fit in.
+        dpr: The device pixel ratio the image will be drawn at.
+
+    Returns:
+        The image, tagged with `dpr`, or a null `QImage` when the file
+        cannot be read.
+    """
+
+    box = QSize(
+        max(1, int(round(width * dpr))), max(1, int(round(height * dpr)))
+    )
+
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid() and (
+        source_size.width() > box.width() or source_size.height() > box.height()
+    ):
+        reader.setScaledSize(source_size.scaled(box, Qt.KeepAspectRatio))
+
+    image = reader.read()
+    if image.isNull():
+        return image
+
+    if image.width() > box.width() or image.height() > box.height():
+        image = image.scaled(box, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class _FXThumbnailDiskCache:
+    """Downscaled thumbnails kept on disk across sessions.
+
+    Each thumbnail is a PNG named after a hash of the source path, the
+    source's modification time and the target size, so a source that
+    changes on disk is simply never found again and its stale entry ages
+    out. The directory is bounded by bytes: the least recently used files
+    are deleted first, a hit marking its file as used by touching it.
+
+    Workers read and write concurrently, so the index and the counters are
+    guarded by a lock. The files themselves are written under a temporary
+    name and renamed into place, so a reader never sees half of one.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: "Optional[OrderedDict[str, int]]" = None
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """The most disk space the cached thumbnails may take."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = max(0, int(value))
+            self._ensure_index()
+            self._evict()
+
+    @staticmethod
+    def entry_name(key: _ThumbnailKey) -> Optional[str]:
+        """Return the file name a thumbnail is cached under.
+
+        Args:
+            key: The (path, width, height, dpr) of the thumbnail.
+
+        Returns:
+            The file name, or None when the source cannot be stat'ed, in
+            which case there is nothing worth caching.
+        """
+
+        path, width, height, dpr = key
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        token = f"{os.path.abspath(path)}|{mtime}|{width}x{height}@{dpr:g}"
+        return hashlib.sha1(token.encode("utf-8")).hexdigest() + ".png"
+
+    def get(self, key: _ThumbnailKey) -> Optional[QImage]:
+        """Return a cached thumbnail, counting the hit or the miss.
+
+        Args:
+            key: The (path, width, height, dpr) of the thumbnail.
+
+        Returns:
+            The image, tagged with the key's DPR, or None on a miss.
+        """
+
+        name = self.entry_name(key)
+        image = QImage()
+        if name is not None:
+            file_path = self.directory / name
+            if image.load(str(file_path)):
+                image.setDevicePixelRatio(key[3])
+                try:
+                    os.utime(file_path)
+                except OSError:
+                    pass
+
+        with self._lock:
+            self._ensure_index()
+            if image.isNull():
+                self.misses += 1
+                return None
+            self.hits += 1
+            if name in self._index:
+                self._index.move_to_end(name)
+        return image
+
+    def put(self, key: _ThumbnailKey, image: QImage) -> None:
+        """Write a thumbnail to the cache.
+
+        Args:
+            key: The (path, width, height, dpr) of the thumbnail.
+            image: The downscaled image to keep.
+        """
+
+        name = self.entry_name(key)
+        if name is None or image.isNull():
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            file_path = self.directory / name
+            temporary = file_path.with_name(
+                f"{name}.{threading.get_ident()}.tmp"
+            )
+            if not image.save(str(temporary), "PNG"):
+                return
+            os.replace(temporary, file_path)
+            size = file_path.stat().st_size
+        except OSError:
+            return
+
+        with self._lock:
+            self._ensure_index()
+            previous = self._index.pop(name, 0)
+            self._index[name] = size
+            self._bytes += size - previous
+            self._evict()
+
+    def purge(self) -> int:
+        """Delete every cached thumbnail.
+
+        Returns:
+            The number of bytes freed.
+        """
+
+        with self._lock:
+            self._ensure_index()
+            freed = self._bytes
+            for name in list(self._index):
+                self._remove(name)
+            self._index.clear()
+            self._bytes = 0
+        return freed
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache's counters and footprint.
+
+        Returns:
+            A dictionary with the `hits` and `misses` counted since the
+            cache was created, the number of `files` and `bytes` on disk,
+            and `max_bytes`.
+        """
+
+        with self._lock:
+            self._ensure_index()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "files": len(self._index),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _ensure_index(self) -> None:
+        """Read the directory once, oldest used first. Call under the lock."""
+
+        if self._index is not None:
+            return
+
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(".png"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+        except OSError:
+            pass
+
+        entries.sort()
+        self._index = OrderedDict((name, size) for _, name, size in entries)
+        self._bytes = sum(self._index.values())
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used files. Call under the lock."""
+
+        while self._bytes > self._max_bytes and self._index:
+            name, size = self._index.popitem(last=False)
+            self._bytes -= size
+            self._remove(name)
+
+    def _remove(self, name: str) -> None:
+        try:
+            os.remove(self.directory / name)
+        except OSError:
+            pass
+
+
+_disk_cache: Optional[_FXThumbnailDiskCache] = None
+
+
+def _get_disk_cache() -> _FXThumbnailDiskCache:
+    """Return the shared on-disk thumbnail cache.
+
+    It lives under `fxconfig.get_config_dir()`, and follows it: scoping the
+    settings to another application with `fxconfig.set_application_name`
+    moves the cache along with them.
+
+    Returns:
+        The cache for the current configuration directory.
+    """
+
+    global _disk_cache
+
+    directory = fxconfig.get_config_dir() / "thumbnails"
+    if _disk_cache is None or _disk_cache.directory != directory:
+        max_bytes = (
+            _disk_cache.max_bytes
+            if _disk_cache is not None
+            else _FXThumbnailDiskCache.DEFAULT_MAX_BYTES
+        )
+        _disk_cache = _FXThumbnailDiskCache(directory, max_bytes)
+    return _disk_cache
+
+
+def _load_thumbnail(
+    key: _ThumbnailKey, disk_cache: Optional[_FXThumbnailDiskCache]
+) -> QImage:
+    """Return a thumbnail from the disk cache, or decode and cache it.
+
+    Args:
+        key: The (path, width, height, dpr) of the thumbnail.
+        disk_cache: The on-disk cache to go through, or None to decode
+            directly.
+
+    Returns:
+        The image, or a null `QImage` when the source cannot be read.
+    """
+
+    if disk_cache is None:
+        return _decode_thumbnail(*key)
+
+    image = disk_cache.get(key)
+    if image is None:
+        image = _decode_thumbnail(*key)
+        disk_cache.put(key, image)
+    return image
+
+
+class _FXThumbnailSignals(QObject):
+    """Carries a decoded thumbnail from a worker back to the GUI thread.
+
+    Deliberately parentless: the running tasks hold it, so a worker that
+    finishes after its loader is gone still has a live object to emit on.
+    """
+
+    loaded = Signal(object, QImage)
+
+
+class _FXThumbnailTask(QRunnable):
+    """Decode one thumbnail on a pool thread."""
+
+    def __init__(
+        self,
+        key: _ThumbnailKey,
+        signals: _FXThumbnailSignals,
+        disk_cache: Optional[_FXThumbnailDiskCache] = None,
+    ):
+        super().__init__()
+        self._key = key
+        self._signals = signals
+        self._disk_cache = disk_cache
+
+    def run(self) -> None:
+        image = _load_thumbnail(self._key, self._disk_cache)
+        try:
+            self._signals.loaded.emit(self._key, image)
+        except RuntimeError:
+            # The application is tearing down under the worker
+            pass
+
+
+class _FXThumbnailLoader(QObject):
+    """Decode thumbnails off the GUI thread and keep the ready ones.
+
+    Ready pixmaps live in an LRU bounded by their pixel bytes rather than by
+    a count, since a count says nothing about memory once the DPR varies.
+    Rows asking for a thumbnail that is still decoding are remembered, and
+    only those rows are repainted when it arrives.
+
+    A file that cannot be read is cached as a null pixmap, so a broken path
+    is tried once rather than on every repaint.
+
+    With `use_disk_cache` on, a thumbnail missing from memory is looked up
+    in the shared on-disk cache before its source is opened at all, and a
+    decoded one is written there for the next session.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    DEFAULT_MAX_THREADS = 4
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_threads: int = DEFAULT_MAX_THREADS,
+    ):
+        super().__init__(parent)
+        self._max_bytes = max_bytes
+        self.use_disk_cache = True
+        self._cache: "OrderedDict[_ThumbnailKey, QPixmap]" = OrderedDict()
+        self._cache_bytes = 0
+        self._pending: Dict[
+            _ThumbnailKey, List[Tuple[QWidget, QPersistentModelIndex]]
+        ] = {}
+
+        # A pool of our own: thumbnails on a network share spend most of
+        # their time waiting on I/O, and should not starve the global pool
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+
+        self._signals = _FXThumbnailSignals()
+        self._signals.loaded.connect(self._on_loaded)
+
+    @property
+    def max_bytes(self) -> int:
+        """The most pixel memory the ready thumbnails may take."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._max_bytes = max(0, int(value))
+        self._evict()
+
+    @property
+    def cache_bytes(self) -> int:
+        """The pixel memory the ready thumbnails currently take."""
+        return self._cache_bytes
+
+    def is_pending(self, key: _ThumbnailKey) -> bool:
+        """Return whether the thumbnail is being decoded."""
+        return key in self._pending
+
+    def cached(self, key: _ThumbnailKey) -> Optional[QPixmap]:
+        """Return a ready thumbnail, or None when there is none yet.
+
+        Args:
+            key: The (path, width, height, dpr) to look up.
+
+        Returns:
+            The pixmap, which is null when the file could not be read, or
+            None when it has not been decoded.
+        """
+
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self._cache.move_to_end(key)
+        return pixmap
+
+    def load(self, key: _ThumbnailKey) -> QPixmap:
+        """Return a thumbnail, decoding it on the calling thread if needed.
+
+        Args:
+            key: The (path, width, height, dpr) to load.
+
+        Returns:
+            The pixmap, null when the file could not be read.
+        """
+
+        pixmap = self.cached(key)
+        if pixmap is None:
+            image = _load_thumbnail(key, self._disk_cache())
+            pixmap = QPixmap.fromImage(image)
+            self._insert(key, pixmap)
+        return pixmap
+
+    def request(
+        self,
+        key: _ThumbnailKey,
+        view: Optional[QWidget] = None,
+        index: Optional[QModelIndex] = None,
+    ) -> Optional[QPixmap]:
+        """Return a ready thumbnail, or start decoding it in the background.
+
+        Args:
+            key: The (path, width, height, dpr) to load.
+            view: The view to repaint when the thumbnail arrives.
+            index: The index in `view` to repaint. Without one the whole
+                view is repainted.
+
+        Returns:
+            The pixmap when it is ready, or None while it is decoding.
+        """
+
+        pixmap = self.cached(key)
+        if pixmap is not None:
+            return pixmap
+
+        requesters = self._pending.get(key)
+        if requesters is None:
+            requesters = self._pending[key] = []
+            self._pool.start(
+                _FXThumbnailTask(key, self._signals, self._disk_cache())
+            )
+        if view is not None:
+            persistent = QPersistentModelIndex(index or QModelIndex())
+            if (view, persistent) not in requesters:
+                requesters.append((view, persistent))
+        return None
+
+    def clear(self) -> None:
+        """Drop every ready thumbnail.
+
+        Decodes already running still land, since a row may be waiting on
+        them.
+        """
+
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Block until every queued decode has finished.
+
+        Args:
+            msecs: How long to wait, or -1 to wait for as long as it takes.
+
+        Returns:
+            True when the pool drained in time.
+        """
+
+        return self._pool.waitForDone(msecs)
+
+    def _disk_cache(self) -> Optional[_FXThumbnailDiskCache]:
+        return _get_disk_cache() if self.use_disk_cache else None
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+
+    def _insert(self, key: _ThumbnailKey, pixmap: QPixmap) -> None:
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= self._pixmap_bytes(previous)
+        self._cache[key] = pixmap
+        self._cache_bytes += self._pixmap_bytes(pixmap)
+        self._evict()
+
+    def _evict(self) -> None:
+        # The newest entry always stays, even alone over budget: evicting it
+        # would only make the row that asked for it decode it again
+        while self._cache_bytes > self._max_bytes and len(self._cache) > 1:
+            _, pixmap = self._cache.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(pixmap)
+
+    @Slot(object, QImage)
+    def _on_loaded(self, key: _ThumbnailKey, image: QImage) -> None:
+        """Keep an arrived thumbnail and repaint the rows that wanted it."""
+
+        self._insert(key, QPixmap.fromImage(image))
+
+        for view, persistent in self._pending.pop(key, []):
+            if not is_valid(view):
+                continue
+            if isinstance(view, QAbstractItemView) and persistent.isValid():
+                view.update(QModelIndex(persistent))
+            elif isinstance(view, QAbstractItemView):
+                view.viewport().update()
+            else:
+                view.update()
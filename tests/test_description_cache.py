@@ -0,0 +1,100 @@
+"""Tests for the memoized Markdown conversion of delegate descriptions.
+
+Regression: `FXThumbnailDelegate.markdown_to_plain_text` is called from
+`paint()` and `sizeHint()`, and each call imported `markdown`, defined a new
+`HTMLParser` subclass, rendered HTML and stripped it -- for every visible
+described row on every hover repaint.
+
+What these tests pin: the output is unchanged, a repeated description is
+converted once, and `precompute_descriptions` converts a model's
+descriptions when they are set rather than on the first paint.
+"""
+
+# Third-party
+import pytest
+from qtpy.QtGui import QStandardItem, QStandardItemModel
+
+# Internal
+from fxgui.fxwidgets import FXThumbnailDelegate
+from fxgui.fxwidgets import _delegates
+from fxgui.fxwidgets._delegates import _markdown_to_plain_text
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    _markdown_to_plain_text.cache_clear()
+    yield
+    _markdown_to_plain_text.cache_clear()
+
+
+def test_markdown_is_reduced_to_collapsed_plain_text():
+    pytest.importorskip("markdown")
+    text = "A **bold** and _italic_ &amp; `code`\n\nsecond paragraph"
+    assert (
+        FXThumbnailDelegate.markdown_to_plain_text(text)
+        == "A bold and italic & code second paragraph"
+    )
+
+
+def test_empty_and_placeholder_descriptions_pass_through():
+    assert FXThumbnailDelegate.markdown_to_plain_text("") == ""
+    assert FXThumbnailDelegate.markdown_to_plain_text("-") == "-"
+    assert _markdown_to_plain_text.cache_info().currsize == 0
+
+
+def test_a_repeated_description_is_converted_once():
+    for _ in range(50):
+        FXThumbnailDelegate.markdown_to_plain_text("A **shot** note")
+
+    info = _markdown_to_plain_text.cache_info()
+    assert info.misses == 1
+    assert info.hits == 49
+
+
+def test_the_converter_is_reused_between_documents():
+    pytest.importorskip("markdown")
+    # A table left in the converter would leak into the next document
+    FXThumbnailDelegate.markdown_to_plain_text("| a |\n|---|\n| b |")
+    assert FXThumbnailDelegate.markdown_to_plain_text("plain") == "plain"
+
+
+def test_precompute_converts_existing_and_new_descriptions(qapp):
+    model = QStandardItemModel()
+    parent = QStandardItem("Sequence")
+    parent.setData("The **opening**", FXThumbnailDelegate.DESCRIPTION_ROLE)
+    child = QStandardItem("Shot 010")
+    child.setData("A **wide** shot", FXThumbnailDelegate.DESCRIPTION_ROLE)
+    parent.appendRow(child)
+    model.appendRow(parent)
+
+    FXThumbnailDelegate.precompute_descriptions(model)
+    assert _markdown_to_plain_text.cache_info().currsize == 2
+
+    # Set after the hook: converted as the role changes, not on paint
+    child.setData("A **close** up", FXThumbnailDelegate.DESCRIPTION_ROLE)
+    late = QStandardItem("Shot 020")
+    late.setData("Added *later*", FXThumbnailDelegate.DESCRIPTION_ROLE)
+    model.appendRow(late)
+
+    misses = _markdown_to_plain_text.cache_info().misses
+    FXThumbnailDelegate.markdown_to_plain_text("A **close** up")
+    FXThumbnailDelegate.markdown_to_plain_text("Added *later*")
+    assert _markdown_to_plain_text.cache_info().misses == misses
+
+
+def test_precompute_twice_does_not_stack_handlers(qapp, monkeypatch):
+    model = QStandardItemModel()
+    FXThumbnailDelegate.precompute_descriptions(model)
+    FXThumbnailDelegate.precompute_descriptions(model)
+
+    calls = []
+    monkeypatch.setattr(
+        _delegates,
+        "_markdown_to_plain_text",
+        lambda text: calls.append(text) or text,
+    )
+    item = QStandardItem("Shot")
+    model.appendRow(item)
+    item.setData("note", FXThumbnailDelegate.DESCRIPTION_ROLE)
+
+    assert calls == ["note"]
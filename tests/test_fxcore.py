@@ -1,12 +1,24 @@
 """Tests for `fxgui.fxcore.FXSortFilterProxyModel` filtering and match color."""
 
+# Built-in
+from difflib import SequenceMatcher
+
 # Third-party
-from qtpy.QtCore import QStringListModel
+import pytest
+from qtpy.QtCore import QStringListModel, Qt
 from qtpy.QtGui import QColor
 
 # Internal
-from fxgui import fxstyle
-from fxgui.fxcore import FXSortFilterProxyModel
+from fxgui import fxcore, fxstyle
+from fxgui.fxcore import (
+    FXFilterStats,
+    FXMatchScorer,
+    FXQuickRatioScorer,
+    FXSortFilterProxyModel,
+    FXStringListModel,
+    FXSubsequenceScorer,
+    FXSubstringScorer,
+)
 
 
 def _proxy_with(items, ratio=0.5):
@@ -62,3 +74,640 @@ def test_match_color_is_theme_aware_not_red_green(qapp):
     assert good == QColor(colors["accent_primary"])
     assert poor != QColor(255, 0, 0)
     assert good != QColor(0, 255, 0)
+
+
+class _CountingMatcher:
+    """Wrap a SequenceMatcher and count its `quick_ratio()` calls."""
+
+    def __init__(self, matcher):
+        self._matcher = matcher
+        self.calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self._matcher, name)
+
+    def quick_ratio(self):
+        self.calls += 1
+        return self._matcher.quick_ratio()
+
+
+def test_each_row_is_scored_once_per_filter_text(qapp):
+    """Filtering, sorting and coloring used to recompute the ratio for the
+    same row: once to filter, twice per comparison, and on every repaint."""
+    items = ["banana", "bandana", "cabana", "ananas", "zzzzzz"]
+    proxy = _proxy_with(items, ratio=0.3)
+    counting = _CountingMatcher(proxy._matcher)
+    proxy._matcher = counting
+
+    proxy.set_filter_text("bnana")
+    for row in range(proxy.rowCount()):
+        proxy.index(row, 0).data(Qt.ForegroundRole)
+
+    assert counting.calls <= len(items)
+
+
+def test_the_scores_follow_the_filter_text(qapp):
+    proxy = _proxy_with(["banana", "cherry"], ratio=0.3)
+    proxy.set_filter_text("banan")
+    assert _visible(proxy)[0] == "banana"
+
+    proxy.set_filter_text("chery")
+    assert _visible(proxy)[0] == "cherry"
+
+
+def test_an_edited_row_is_scored_with_its_new_text(qapp):
+    proxy = _proxy_with(["cherry", "zzzzzz"], ratio=0.6)
+    proxy.set_filter_text("banna")
+    assert _visible(proxy) == []
+
+    source = proxy.sourceModel()
+    source.setData(source.index(1, 0), "banana")
+    assert _visible(proxy) == ["banana"]
+
+
+def test_the_batch_scores_match_quick_ratio(qapp):
+    """The histogram engine is exact, not an approximation."""
+    pytest.importorskip("numpy")
+    texts = ["", "a", "hero_body", "héros", "villain_head", "aaaaab"]
+    index = fxcore._FXCharHistogramIndex()
+    index.add(texts[:2])
+    index.scores("x")
+    index.add(texts[2:])
+
+    for query in ("", "hero", "éa", "zzz", "aab"):
+        scores = index.scores(query)
+        for text in texts:
+            matcher = SequenceMatcher(None, text, query)
+            assert scores[text] == matcher.quick_ratio()
+
+
+def test_filtering_with_numpy_scores_in_one_batch(qapp):
+    pytest.importorskip("numpy")
+    items = [f"asset_{number:04d}" for number in range(500)] + ["banana"]
+    proxy = _proxy_with(items, ratio=0.6)
+    counting = _CountingMatcher(proxy._matcher)
+    proxy._matcher = counting
+
+    proxy.set_filter_text("bnana")
+
+    assert "banana" in _visible(proxy)
+    assert counting.calls == 0
+
+
+def test_rows_added_after_the_batch_are_scored(qapp):
+    pytest.importorskip("numpy")
+    proxy = _proxy_with(["cherry"], ratio=0.6)
+    proxy.set_filter_text("banna")
+    assert _visible(proxy) == []
+
+    source = proxy.sourceModel()
+    source.insertRows(1, 1)
+    source.setData(source.index(1, 0), "banana")
+    assert _visible(proxy) == ["banana"]
+
+
+def test_filtering_without_numpy_gives_the_same_rows(qapp, monkeypatch):
+    items = ["banana", "bandana", "cabana", "ananas", "cherry"]
+    proxy = _proxy_with(items, ratio=0.4)
+    proxy.set_filter_text("bnana")
+    expected = _visible(proxy)
+
+    monkeypatch.setattr(fxcore, "np", None)
+    fallback = _proxy_with(items, ratio=0.4)
+    assert fallback._histograms is None
+    fallback.set_filter_text("bnana")
+    assert _visible(fallback) == expected
+
+
+def test_the_trigram_index_keeps_every_substring_match(qapp):
+    items = [
+        "character_hero_body",
+        "character_villain",
+        "prop_hero_sword",
+        "hero",
+        "he",
+        "environment_tree",
+    ]
+    proxy = _proxy_with(items, ratio=0.95)
+    proxy.set_trigram_index(True)
+    proxy.set_filter_text("hero")
+
+    assert sorted(_visible(proxy)) == [
+        "character_hero_body",
+        "hero",
+        "prop_hero_sword",
+    ]
+
+
+def test_the_trigram_index_keeps_typo_matches(qapp):
+    items = ["banana", "bandana", "cherry", "zzzzzz"]
+    plain = _proxy_with(items, ratio=0.6)
+    plain.set_filter_text("banna")
+    indexed = _proxy_with(items, ratio=0.6)
+    indexed.set_trigram_index(True)
+    indexed.set_filter_text("banna")
+
+    assert sorted(_visible(indexed)) == sorted(_visible(plain))
+
+
+def test_the_trigram_index_keeps_scrambled_matches(qapp):
+    """Rows sharing no run of three characters with the filter text can
+    still reach the ratio, and must not be dropped."""
+    items = ["ots", "tso", "shot", "hots", "apple", "shortcut"]
+    for query in ("sho", "ots", "tohs"):
+        plain = _proxy_with(items, ratio=0.6)
+        plain.set_filter_text(query)
+        indexed = _proxy_with(items, ratio=0.6)
+        indexed.set_trigram_index(True)
+        indexed.set_filter_text(query)
+
+        assert sorted(_visible(indexed)) == sorted(_visible(plain))
+        assert _visible(plain)
+
+
+def test_the_trigram_index_scores_only_candidates(qapp):
+    items = [f"texture_{number:04d}" for number in range(300)]
+    items.append("character_hero")
+    proxy = _proxy_with(items, ratio=0.6)
+    proxy.set_trigram_index(True)
+    proxy.set_filter_text("hero")
+
+    assert _visible(proxy) == ["character_hero"]
+    assert proxy._prefilter() == {"character_hero"}
+
+
+def test_the_length_window_is_exact_for_quick_ratio():
+    """Nothing outside the window can reach the ratio, so pruning by it
+    never drops a row."""
+    query = "hero_body"
+    for ratio in (0.3, 0.5, 0.8):
+        shortest, longest = fxcore._FXTrigramIndex.length_window(query, ratio)
+        for length in range(1, 60):
+            if shortest <= length <= longest:
+                continue
+            text = query * (length // len(query) + 1)
+            text = text[:length]
+            matcher = SequenceMatcher(None, text, query)
+            assert matcher.quick_ratio() < ratio
+
+
+def test_rows_added_with_the_trigram_index_on_are_found(qapp):
+    proxy = _proxy_with(["zzzzzz"], ratio=0.6)
+    proxy.set_trigram_index(True)
+    proxy.set_filter_text("hero")
+    assert _visible(proxy) == []
+
+    source = proxy.sourceModel()
+    source.insertRows(1, 1)
+    source.setData(source.index(1, 0), "character_hero")
+    assert _visible(proxy) == ["character_hero"]
+
+    # And it stays found when the filter runs again
+    proxy.invalidate()
+    assert _visible(proxy) == ["character_hero"]
+
+
+def test_extending_the_filter_text_matches_a_fresh_filter(qapp):
+    items = [
+        "banana",
+        "bandana",
+        "cabana",
+        "bnana",
+        "character_hero",
+        "ban",
+        "environment_tree",
+    ]
+    typed = _proxy_with(items, ratio=0.6)
+    for length in range(1, len("banana") + 1):
+        query = "banana"[:length]
+        typed.set_filter_text(query)
+        fresh = _proxy_with(items, ratio=0.6)
+        fresh.set_filter_text(query)
+        assert sorted(_visible(typed)) == sorted(_visible(fresh))
+
+
+def test_extending_the_filter_text_skips_rows_that_cannot_match(
+    qapp, monkeypatch
+):
+    monkeypatch.setattr(fxcore, "np", None)
+    items = [f"zzzz_{number:04d}" for number in range(200)]
+    items += ["banana", "bandana"]
+    proxy = _proxy_with(items)
+    proxy.set_filter_text("ba")
+    assert sorted(_visible(proxy)) == ["banana", "bandana"]
+
+    counting = _CountingMatcher(proxy._matcher)
+    proxy._matcher = counting
+    proxy.set_filter_text("bana")
+
+    assert sorted(_visible(proxy)) == ["banana", "bandana"]
+    # Only the two rows shown are scored, to sort them: the others were too
+    # far off to catch up with two more characters
+    assert counting.calls == 2
+
+
+def test_deleting_characters_reuses_the_earlier_outcomes(qapp, monkeypatch):
+    monkeypatch.setattr(fxcore, "np", None)
+    items = ["banana", "bandana", "cabana", "cherry", "date"]
+    proxy = _proxy_with(items)
+    proxy.set_filter_text("ba")
+    shorter = _visible(proxy)
+    proxy.set_filter_text("bana")
+
+    counting = _CountingMatcher(proxy._matcher)
+    proxy._matcher = counting
+    proxy.set_filter_text("ba")
+
+    assert _visible(proxy) == shorter
+    assert counting.calls == 0
+
+
+def test_a_row_added_after_a_filter_text_is_kept_is_tested(qapp):
+    proxy = _proxy_with(["banana", "cherry"])
+    proxy.set_filter_text("ba")
+    proxy.set_filter_text("bana")
+
+    source = proxy.sourceModel()
+    source.insertRows(2, 1)
+    source.setData(source.index(2, 0), "bark")
+    proxy.set_filter_text("ba")
+
+    assert sorted(_visible(proxy)) == ["banana", "bark"]
+
+
+def test_a_time_sliced_pass_applies_the_same_rows(qtbot):
+    items = [f"asset_{number:03d}" for number in range(600)]
+    items += ["banana", "bandana", "cabana"]
+    proxy = _proxy_with(items)
+    proxy.set_time_budget(5)
+    # Laid out unfiltered first, as a view would have
+    assert proxy.rowCount() == len(items)
+
+    with qtbot.waitSignal(proxy.filtering_finished, timeout=5000):
+        proxy.set_filter_text("bana")
+        # Nothing is filtered inside the call
+        assert proxy.is_filtering()
+        assert proxy.rowCount() == len(items)
+
+    synchronous = _proxy_with(items)
+    synchronous.set_filter_text("bana")
+    assert not proxy.is_filtering()
+    assert _visible(proxy) == _visible(synchronous)
+
+
+def test_a_time_sliced_pass_shows_rows_as_it_goes(qtbot):
+    items = [f"asset_{number:04d}" for number in range(4000)]
+    # Only the rows containing the filter text pass
+    proxy = _proxy_with(items, ratio=0.99)
+    proxy.set_time_budget(1)
+    assert proxy.rowCount() == len(items)
+    counts = []
+    proxy.filtering_progress.connect(
+        lambda done, total: counts.append(proxy.rowCount())
+    )
+
+    with qtbot.waitSignal(proxy.filtering_finished, timeout=5000):
+        proxy.set_filter_text("asset_1")
+
+    assert proxy.rowCount() == 1000
+    assert any(1000 < count < len(items) for count in counts)
+
+
+def test_a_time_sliced_pass_tests_each_row_once(qtbot):
+    class _Counting(FXSortFilterProxyModel):
+        calls = 0
+
+        def filterAcceptsRow(self, source_row, source_parent):
+            _Counting.calls += 1
+            return super().filterAcceptsRow(source_row, source_parent)
+
+    items = [f"asset_{number:04d}" for number in range(2000)]
+    model = QStringListModel(items)
+    proxy = _Counting(ratio=0.99)
+    proxy.setSourceModel(model)
+    proxy.set_time_budget(1)
+    assert proxy.rowCount() == len(items)
+
+    # No pass over the whole model once every block is shown
+    _Counting.calls = 0
+    with qtbot.waitSignal(proxy.filtering_finished, timeout=5000):
+        proxy.set_filter_text("asset_1")
+    assert _Counting.calls == len(items)
+    assert _visible(proxy)[0] == "asset_1000"
+
+
+def test_rows_moved_under_a_time_sliced_pass_are_filtered(qtbot):
+    items = [f"asset_{number:04d}" for number in range(2000)]
+    proxy = _proxy_with(items, ratio=0.99)
+    proxy.set_time_budget(1)
+    assert proxy.rowCount() == len(items)
+    source = proxy.sourceModel()
+
+    def remove_once(_done, _total):
+        # Every row moves up under the walk, past rows it has yet to test
+        proxy.filtering_progress.disconnect(remove_once)
+        source.removeRows(0, 300)
+
+    proxy.filtering_progress.connect(remove_once)
+    with qtbot.waitSignal(proxy.filtering_finished, timeout=5000):
+        proxy.set_filter_text("asset_1")
+
+    synchronous = _proxy_with(source.stringList(), ratio=0.99)
+    synchronous.set_filter_text("asset_1")
+    assert _visible(proxy) == _visible(synchronous)
+
+
+def test_a_newer_filter_text_cancels_the_running_pass(qtbot):
+    items = [f"asset_{number:03d}" for number in range(600)]
+    items += ["banana", "cherry"]
+    proxy = _proxy_with(items)
+    proxy.set_time_budget(5)
+    finished = []
+    proxy.filtering_finished.connect(lambda: finished.append(proxy._filter_text))
+
+    with qtbot.waitSignal(proxy.filtering_finished, timeout=5000):
+        proxy.set_filter_text("ban")
+        proxy.set_filter_text("cherr")
+
+    assert finished == ["cherr"]
+    assert _visible(proxy) == ["cherry"]
+
+
+def test_a_pass_reports_its_progress(qtbot):
+    proxy = _proxy_with([f"asset_{number:03d}" for number in range(600)])
+    proxy.set_time_budget(5)
+    progress = []
+    proxy.filtering_progress.connect(lambda done, total: progress.append(done))
+
+    with qtbot.waitSignal(proxy.filtering_finished, timeout=5000):
+        proxy.set_filter_text("asset_1")
+
+    assert progress[-1] == 600
+    assert progress == sorted(progress)
+
+
+def test_dropping_the_budget_applies_the_running_pass(qtbot):
+    proxy = _proxy_with(["banana", "cherry"])
+    proxy.set_time_budget(5)
+    proxy.set_filter_text("banana")
+    assert proxy.is_filtering()
+
+    proxy.set_time_budget(0)
+    assert not proxy.is_filtering()
+    assert _visible(proxy) == ["banana"]
+
+
+def test_max_results_keeps_the_best_ranked_rows(qapp):
+    items = [
+        "character_hero_body",
+        "character_hero_head",
+        "hero",
+        "heros",
+        "prop_hero_sword",
+        "environment_tree",
+    ]
+    everything = _proxy_with(items, ratio=0.3)
+    everything.set_filter_text("hero")
+    ranked = _proxy_with(items, ratio=0.3)
+    ranked.set_max_results(2)
+    ranked.set_filter_text("hero")
+
+    assert _visible(ranked) == _visible(everything)[:2] == ["hero", "heros"]
+
+
+def test_max_results_ranks_without_sorting_every_match(qapp, monkeypatch):
+    items = [f"hero_{number:03d}" for number in range(300)]
+    proxy = _proxy_with(items, ratio=0.3)
+    proxy.set_max_results(5)
+
+    compared = []
+    original = FXSortFilterProxyModel.lessThan
+    monkeypatch.setattr(
+        FXSortFilterProxyModel,
+        "lessThan",
+        lambda self, left, right: compared.append(left)
+        or original(self, left, right),
+    )
+    proxy.set_filter_text("hero")
+
+    assert proxy.rowCount() == 5
+    # Only the five kept rows are sorted, never the 300 matches
+    assert len(compared) <= 5 * 5
+
+
+def test_max_results_follows_rows_added_later(qtbot):
+    proxy = _proxy_with(["hero_body", "hero_head"], ratio=0.3)
+    proxy.set_max_results(1)
+    proxy.set_filter_text("hero")
+    assert proxy.rowCount() == 1
+
+    source = proxy.sourceModel()
+    source.insertRows(2, 1)
+    source.setData(source.index(2, 0), "hero")
+    qtbot.waitUntil(lambda: _visible(proxy) == ["hero"])
+
+
+def test_max_results_shows_every_row_without_a_filter_text(qapp):
+    proxy = _proxy_with(["apple", "banana", "cherry"])
+    proxy.set_max_results(1)
+    assert proxy.rowCount() == 3
+
+
+def test_a_scorer_must_implement_match():
+    class _Scoring(FXMatchScorer):
+        def score(self, text, query):
+            return 1.0
+
+    with pytest.raises(TypeError):
+        _Scoring()
+
+
+def test_the_substring_scorer_ranks_tighter_matches_first():
+    scorer = FXSubstringScorer()
+    assert scorer.match("hero", "hero") == (1.0, [(0, 4)])
+    assert scorer.match("the_hero", "hero") == (0.5, [(4, 4)])
+    assert scorer.match("hreo", "hero") == (0.0, [])
+
+
+def test_the_quick_ratio_scorer_matches_sequence_matcher():
+    scorer = FXQuickRatioScorer()
+    for text in ("banana", "bandana", "cherry"):
+        expected = SequenceMatcher(None, text, "bnana").quick_ratio()
+        assert scorer.score(text, "bnana") == expected
+    assert scorer.match("the_hero", "hero")[1] == [(4, 4)]
+    # Without an occurrence, the spans are the matching blocks
+    assert scorer.match("banana", "bnana")[1] == [(0, 1), (2, 4)]
+
+
+def test_the_subsequence_scorer_needs_the_characters_in_order():
+    scorer = FXSubsequenceScorer()
+    assert scorer.match("hero", "oreh") == (0.0, [])
+    assert scorer.match("hero", "hero") == (1.0, [(0, 4)])
+
+    score, spans = scorer.match("character_hero_body", "hbo")
+    assert spans == [(10, 1), (15, 2)]
+    assert 0.0 < score < 1.0
+
+
+def test_the_subsequence_scorer_prefers_word_starts_and_runs():
+    scorer = FXSubsequenceScorer()
+    run_at_a_word_start = scorer.score("prop_sword", "swo")
+    run_inside_a_word = scorer.score("prop_answord", "swo")
+    scattered_inside_words = scorer.score("prop_asxwxo", "swo")
+    assert run_at_a_word_start > run_inside_a_word > scattered_inside_words
+
+
+def test_the_proxy_filters_and_ranks_with_another_scorer(qapp):
+    items = ["character_hero_body", "chair_base", "bachelor", "cherry"]
+    proxy = _proxy_with(items)
+    proxy.set_scorer(FXSubsequenceScorer())
+    proxy.set_filter_text("chb")
+
+    # Every character of "chair_base" starts a word or continues a run
+    assert _visible(proxy) == ["chair_base", "character_hero_body"]
+    assert isinstance(proxy.scorer(), FXSubsequenceScorer)
+
+    proxy.set_scorer(None)
+    assert type(proxy.scorer()) is FXQuickRatioScorer
+
+
+def test_the_proxy_answers_the_matched_spans(qapp):
+    proxy = _proxy_with(["character_hero_body"])
+    role = FXSortFilterProxyModel.MATCH_SPANS_ROLE
+    assert proxy.index(0, 0).data(role) is None
+
+    proxy.set_filter_text("hero")
+    assert proxy.index(0, 0).data(role) == [(10, 4)]
+
+    proxy.set_scorer(FXSubsequenceScorer())
+    proxy.set_filter_text("chb")
+    spans = proxy.index(0, 0).data(role)
+    assert [start for start, _ in spans] == [5, 10, 15]
+
+
+def test_the_string_list_model_loads_with_one_reset(qapp):
+    model = FXStringListModel()
+    signals = []
+    model.modelReset.connect(lambda: signals.append("reset"))
+    model.rowsInserted.connect(lambda *args: signals.append("inserted"))
+
+    model.set_strings(["apple", "banana", "cherry"])
+
+    assert signals == ["reset"]
+    assert model.rowCount() == 3
+    assert model.index(1, 0).data() == "banana"
+    assert model.index(1, 0).data(Qt.EditRole) == "banana"
+    assert model.index(1, 0).data(Qt.ToolTipRole) is None
+
+
+def test_the_string_list_model_batches_appended_strings(qtbot):
+    model = FXStringListModel(["apple"])
+    inserted = []
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+
+    for name in ("banana", "cherry", "date"):
+        model.append_string(name)
+    assert model.rowCount() == 1
+    qtbot.waitUntil(lambda: bool(inserted))
+
+    assert inserted == [(1, 3)]
+    assert model.strings() == ["apple", "banana", "cherry", "date"]
+
+    # Reading the strings inserts the queued ones at once
+    model.append_string("elderberry")
+    assert model.strings()[-1] == "elderberry"
+    assert model.rowCount() == 5
+
+
+def test_the_string_list_model_removes_rows(qapp):
+    model = FXStringListModel(["apple", "banana", "cherry"])
+    assert model.removeRow(1)
+    assert model.strings() == ["apple", "cherry"]
+    assert not model.removeRows(1, 5)
+
+
+def test_the_proxy_filters_a_string_list_model_like_any_model(qapp):
+    items = ["banana", "bandana", "cabana", "apple", "grape"]
+    proxy = FXSortFilterProxyModel()
+    model = FXStringListModel(items)
+    proxy.setSourceModel(model)
+    proxy._test_model = model
+    reference = _proxy_with(items)
+
+    for text in ("bana", "ape", ""):
+        proxy.set_filter_text(text)
+        reference.set_filter_text(text)
+        assert _visible(proxy) == _visible(reference)
+
+
+def test_rows_are_only_sorted_while_there_is_a_filter_text(qapp, monkeypatch):
+    proxy = _proxy_with(["cabana", "banana", "apple"])
+    comparisons = []
+    original = FXSortFilterProxyModel.lessThan
+    monkeypatch.setattr(
+        FXSortFilterProxyModel,
+        "lessThan",
+        lambda self, left, right: comparisons.append(1)
+        or original(self, left, right),
+    )
+
+    proxy._test_model.setStringList(["cabana", "banana", "apple", "bandana"])
+    assert _visible(proxy) == ["cabana", "banana", "apple", "bandana"]
+    assert not comparisons
+
+    proxy.set_filter_text("banana")
+    assert _visible(proxy)[0] == "banana"
+    assert comparisons
+
+    proxy.set_filter_text("")
+    assert _visible(proxy) == ["cabana", "banana", "apple", "bandana"]
+
+
+def test_match_brushes_are_shared_and_follow_the_theme(qapp):
+    """The foreground brush is looked up per paint, not built per paint."""
+    proxy = _proxy_with(["apple", "apricot", "banana"])
+    proxy.set_filter_text("apple")
+    index = proxy.index(0, 0)
+
+    first = proxy.data(index, Qt.ForegroundRole)
+    assert proxy.data(index, Qt.ForegroundRole) is first
+    assert first.color() == FXSortFilterProxyModel._match_color(1.0)
+
+    fxstyle.theme_changed.emit("light")
+    assert proxy.data(index, Qt.ForegroundRole) is not first
+
+
+def test_each_filter_pass_reports_its_stats(qapp):
+    proxy = _proxy_with(["apple", "apricot", "banana", "apple"])
+    reported = []
+    finished = []
+    proxy.filter_stats.connect(reported.append)
+    proxy.filtering_finished.connect(lambda: finished.append(True))
+
+    proxy.set_filter_text("ap")
+    stats = proxy.last_filter_stats()
+    assert reported == [stats]
+    # Only time-sliced passes say they finished
+    assert finished == []
+    assert isinstance(stats, FXFilterStats)
+    assert stats.filter_text == "ap"
+    # "apple" twice is scored once
+    assert stats.rows_scored == 3
+    assert stats.rows_accepted == proxy.rowCount() == 3
+    assert 0.0 <= stats.scoring_time <= stats.total_time
+    assert stats.sort_time >= 0.0
+
+    # Backspacing reuses the outcomes of the earlier text
+    proxy.set_filter_text("a")
+    proxy.set_filter_text("ap")
+    assert proxy.last_filter_stats().rows_scored == 0
+
+
+def test_filter_passes_are_logged_at_debug_level(qapp, caplog):
+    proxy = _proxy_with(["apple", "banana"])
+    with caplog.at_level("DEBUG", logger="fxgui.fxcore"):
+        proxy.set_filter_text("apple")
+    assert "QStringListModel" in caplog.text
+    assert "'apple'" in caplog.text
@@ -0,0 +1,189 @@
+"""Tests for the engine that renders `fxicons` icons on demand.
+
+Regression: `get_icon` baked four pixmaps (Normal, Disabled, Selected,
+Active) at the library's 48px for every icon, although most icons are
+only ever shown Normal at 16 to 24px; Qt then scaled the 48px pixmap
+down, and up on high-DPI screens.
+
+What these tests pin: making an icon renders nothing, each mode is
+rendered at the size and device pixel ratio it is asked for and kept by
+the engine, the modes keep their colors (and buttons their plain Active
+mode), a name the library lacks still raises when the icon is made, and
+a copy of an icon can be given pixmaps of its own, such as the On pixmap
+of a checkable button.
+"""
+
+# Built-in
+import gc
+
+# Third-party
+import pytest
+from qtpy.QtCore import QRect, QSize
+from qtpy.QtGui import QColor, QIcon, QImage, QPainter, QPixmap
+
+# Internal
+from fxgui import fxicons
+
+
+_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8">'
+    '<rect x="1" y="1" width="6" height="6" fill="#000"/></svg>'
+)
+
+
+@pytest.fixture
+def library(tmp_path):
+    folder = tmp_path / "studio" / "solid"
+    folder.mkdir(parents=True)
+    (folder / "square.svg").write_text(_SVG)
+    fxicons.add_library(
+        library="studio",
+        pattern="{root}/{library}/{style}/{icon_name}.{extension}",
+        defaults={
+            "extension": "svg",
+            "style": "solid",
+            "color": "#00ff00",
+            "width": 48,
+            "height": 48,
+        },
+        root=str(tmp_path),
+    )
+    fxicons.clear_icon_cache()
+    yield folder
+    fxicons._libraries_info.pop("studio", None)
+    fxicons._manifests.pop("studio", None)
+    fxicons.clear_icon_cache()
+
+
+def _icon(**kwargs):
+    return fxicons._get_icon_internal(
+        "square",
+        48,
+        48,
+        kwargs.get("color", "#00ff00"),
+        "#808080",
+        "#ffffff",
+        kwargs.get("active_color", "#ff0000"),
+        "studio",
+        None,
+        None,
+    )
+
+
+def _center(pixmap):
+    image = pixmap.toImage()
+    return image.pixelColor(image.width() // 2, image.height() // 2).name()
+
+
+def test_making_an_icon_renders_nothing(qapp, library):
+    icon = _icon()
+    assert fxicons._get_pixmap_cached.cache_info().currsize == 0
+    assert icon.availableSizes() == [QSize(48, 48)]
+
+    icon.pixmap(QSize(16, 16))
+    assert fxicons._get_pixmap_cached.cache_info().currsize == 1
+
+
+def test_pixmaps_are_rendered_at_the_size_and_ratio_asked(qapp, library):
+    icon = _icon()
+
+    pixmap = icon.pixmap(QSize(16, 16))
+    assert pixmap.size() == QSize(16, 16)
+
+    pixmap = icon.pixmap(QSize(16, 16), 2.0)
+    assert pixmap.size() == QSize(32, 32)
+    assert pixmap.devicePixelRatio() == 2.0
+
+    # Larger than the library's size is rendered, not scaled up
+    assert icon.pixmap(QSize(96, 96)).size() == QSize(96, 96)
+
+
+def test_pixmaps_are_kept_by_the_engine(qapp, library):
+    icon = _icon()
+    first = icon.pixmap(QSize(24, 24), QIcon.Disabled)
+    fxicons._get_pixmap_cached.cache_clear()
+    again = icon.pixmap(QSize(24, 24), QIcon.Disabled)
+    assert again.cacheKey() == first.cacheKey()
+    assert fxicons._get_pixmap_cached.cache_info().currsize == 0
+
+
+def test_modes_keep_their_colors(qapp, library):
+    icon = _icon()
+    size = QSize(16, 16)
+    assert _center(icon.pixmap(size, QIcon.Normal)) == "#00ff00"
+    assert _center(icon.pixmap(size, QIcon.Disabled)) == "#808080"
+    assert _center(icon.pixmap(size, QIcon.Selected)) == "#ffffff"
+    assert _center(icon.pixmap(size, QIcon.Active)) == "#ff0000"
+
+    # A button-safe icon shows its Normal pixmap when Active
+    button_icon = _icon(active_color="")
+    assert _center(button_icon.pixmap(size, QIcon.Active)) == "#00ff00"
+
+    # An icon in its own colors is only recolored when disabled
+    plain = _icon(color=None)
+    assert _center(plain.pixmap(size, QIcon.Selected)) == "#000000"
+    assert _center(plain.pixmap(size, QIcon.Disabled)) == "#808080"
+
+
+def test_painting_renders_at_the_device_ratio(qapp, library):
+    image = QImage(64, 64, QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(2.0)
+    image.fill(QColor(0, 0, 0, 0))
+    painter = QPainter(image)
+    _icon().paint(painter, QRect(0, 0, 32, 32))
+    painter.end()
+
+    assert image.pixelColor(32, 32).name() == "#00ff00"
+    info = fxicons._get_pixmap_cached.cache_info()
+    assert info.currsize == 1
+
+
+def test_a_missing_name_still_raises_when_made(qapp, library):
+    with pytest.raises(FileNotFoundError):
+        fxicons._get_icon_internal(
+            "circle",
+            48,
+            48,
+            None,
+            "#808080",
+            "#ffffff",
+            "#ff0000",
+            "studio",
+            None,
+            None,
+        )
+
+
+def test_a_copied_icon_can_be_given_pixmaps(qapp, library):
+    """Qt clones the engine of an icon changed while shared; the clone
+    used to be freed with its Python object while Qt still drew with it."""
+    on = QPixmap(16, 16)
+    on.fill(QColor("#0000ff"))
+    icon = QIcon(fxicons.get_icon("square", library="studio"))
+    icon.addPixmap(on, QIcon.Normal, QIcon.On)
+    gc.collect()
+
+    size = QSize(16, 16)
+    assert _center(icon.pixmap(size, QIcon.Normal, QIcon.Off)) == "#00ff00"
+    assert _center(icon.pixmap(size, QIcon.Normal, QIcon.On)) == "#0000ff"
+    assert _center(icon.pixmap(size, QIcon.Disabled, QIcon.On)) == "#0000ff"
+
+
+def test_a_copied_icon_can_be_given_files(qapp, library, tmp_path):
+    on = QPixmap(16, 16)
+    on.fill(QColor("#0000ff"))
+    path = tmp_path / "on.png"
+    on.save(str(path))
+    icon = QIcon(fxicons.get_icon("square", library="studio"))
+    icon.addFile(str(path), QSize(), QIcon.Normal, QIcon.On)
+    gc.collect()
+
+    copy = QIcon(icon)
+    copy.addPixmap(on, QIcon.Active, QIcon.On)
+    del icon
+    gc.collect()
+
+    pixmap = copy.pixmap(QSize(24, 24), QIcon.Normal, QIcon.On)
+    assert pixmap.size() == QSize(24, 24)
+    assert _center(pixmap) == "#0000ff"
+    assert _center(copy.pixmap(QSize(24, 24))) == "#00ff00"
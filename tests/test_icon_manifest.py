@@ -0,0 +1,125 @@
+"""Tests for the manifest behind icon lookups.
+
+Regression: every uncached `get_icon_path` call probed the filesystem,
+and `get_available_icons_in_library` walked the library's folder on every
+call; on a network mount that dominated tool startup.
+
+What these tests pin: a library is walked once and then looked up in
+memory, the manifest saved on disk is reused by the next session while
+the library's folders are unchanged, icons added since are still found,
+and libraries registered with `add_library` are covered too.
+"""
+
+# Built-in
+import os
+from pathlib import Path
+
+# Third-party
+import pytest
+
+# Internal
+from fxgui import fxicons
+
+
+_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8"/>'
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "icons"
+    for style in ("solid", "line"):
+        for name in ("house", "tree"):
+            path = root / "studio" / style / f"{name}.svg"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(_SVG)
+    fxicons.add_library(
+        library="studio",
+        pattern="{root}/{library}/{style}/{icon_name}.{extension}",
+        defaults={
+            "extension": "svg",
+            "style": "solid",
+            "color": None,
+            "width": 48,
+            "height": 48,
+        },
+        root=str(root),
+    )
+    yield root / "studio"
+    fxicons._libraries_info.pop("studio", None)
+    fxicons._manifests.pop("studio", None)
+
+
+def _count_walks(monkeypatch):
+    walks = []
+    real_walk = os.walk
+
+    def walk(top, *args, **kwargs):
+        walks.append(top)
+        return real_walk(top, *args, **kwargs)
+
+    monkeypatch.setattr(fxicons.os, "walk", walk)
+    return walks
+
+
+def test_lookups_read_the_manifest_not_the_disk(library, monkeypatch):
+    walks = _count_walks(monkeypatch)
+    assert fxicons.get_icon_path("house", library="studio").endswith(
+        "studio/solid/house.svg"
+    )
+
+    def no_probe(self):
+        raise AssertionError("probed the filesystem")
+
+    monkeypatch.setattr(Path, "exists", no_probe)
+    fxicons.get_icon_path("tree", library="studio", style="line")
+    assert fxicons.get_available_icons_in_library("studio") == [
+        "house",
+        "house",
+        "tree",
+        "tree",
+    ]
+    assert len(walks) == 1
+
+
+def test_the_saved_manifest_is_reused_while_unchanged(library, monkeypatch):
+    fxicons.get_icon_path("house", library="studio")
+    fxicons._manifests.clear()
+
+    walks = _count_walks(monkeypatch)
+    fxicons.get_icon_path("tree", library="studio")
+    assert walks == []
+
+
+def test_a_changed_folder_is_walked_again(library, monkeypatch):
+    fxicons.get_icon_path("house", library="studio")
+    fxicons._manifests.clear()
+    (library / "outline").mkdir()
+    (library / "outline" / "house.svg").write_text(_SVG)
+
+    walks = _count_walks(monkeypatch)
+    fxicons.get_icon_path("house", library="studio", style="outline")
+    assert len(walks) == 1
+
+
+def test_an_icon_added_during_the_session_is_found(library):
+    fxicons.get_icon_path("house", library="studio")
+    (library / "solid" / "leaf.svg").write_text(_SVG)
+    assert fxicons.get_icon_path("leaf", library="studio").endswith("leaf.svg")
+    assert "solid/leaf.svg" in fxicons._manifests["studio"].files()
+
+
+def test_a_missing_icon_still_raises(library):
+    with pytest.raises(FileNotFoundError):
+        fxicons.get_icon_path("missing", library="studio")
+
+
+def test_re_registering_a_library_drops_its_manifest(library, tmp_path):
+    fxicons.get_icon_path("house", library="studio")
+    other = tmp_path / "other" / "studio" / "solid"
+    other.mkdir(parents=True)
+    (other / "boat.svg").write_text(_SVG)
+    info = fxicons._libraries_info["studio"]
+    fxicons.add_library(
+        "studio", info["pattern"], info["defaults"], root=str(tmp_path / "other")
+    )
+    assert fxicons.get_available_icons_in_library("studio") == ["boat"]
@@ -0,0 +1,170 @@
+"""Tests for packed icon libraries.
+
+What these tests pin: `pack_library` writes one file holding every icon
+of a folder, a pack next to a library's folder is read instead of the
+folder, however the library names that folder, icons render from the
+mapped bytes, repacking unmaps the old pack, the stylesheets' icon
+folders are never packed, and `python -m fxgui pack-icons` builds the
+same pack.
+"""
+
+# Built-in
+import os
+
+# Third-party
+import pytest
+
+# Internal
+from fxgui import fxicons
+
+
+_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8">'
+    '<rect width="4" height="8" fill="#000"/></svg>'
+)
+
+
+@pytest.fixture
+def library(tmp_path):
+    folder = tmp_path / "studio"
+    for style in ("solid", "line"):
+        for name in ("house", "tree"):
+            path = folder / style / f"{name}.svg"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(_SVG)
+    fxicons.add_library(
+        library="studio",
+        pattern="{root}/{library}/{style}/{icon_name}.{extension}",
+        defaults={
+            "extension": "svg",
+            "style": "solid",
+            "color": None,
+            "width": 16,
+            "height": 16,
+        },
+        root=str(tmp_path),
+    )
+    yield folder
+    fxicons._libraries_info.pop("studio", None)
+    fxicons._drop_manifest("studio")
+    fxicons.clear_icon_cache()
+
+
+def test_the_pack_holds_every_file(library):
+    pack = fxicons.pack_library(library)
+    assert pack == library.with_name("studio.fxpack")
+
+    manifest = fxicons._get_manifest("studio")
+    assert isinstance(manifest, fxicons._FXIconPack)
+    assert manifest.files() == {
+        "line/house.svg",
+        "line/tree.svg",
+        "solid/house.svg",
+        "solid/tree.svg",
+    }
+    assert manifest.data("line/tree.svg") == _SVG.encode("utf-8")
+
+
+def test_icons_resolve_and_render_from_the_pack(qapp, library):
+    fxicons.pack_library(library)
+
+    path = fxicons.get_icon_path("tree", library="studio", style="line")
+    assert path.endswith("studio/line/tree.svg")
+    assert isinstance(fxicons._icon_source("studio", path), bytes)
+    pixmap = fxicons._get_pixmap_internal(
+        "tree", 16, 16, None, "studio", "line", "svg"
+    )
+    assert not pixmap.isNull()
+    assert fxicons.get_available_icons_in_library("studio") == [
+        "house",
+        "house",
+        "tree",
+        "tree",
+    ]
+    with pytest.raises(FileNotFoundError):
+        fxicons.get_icon_path("missing", library="studio")
+
+
+def test_a_new_pack_replaces_the_folder_manifest(library):
+    fxicons.get_icon_path("house", library="studio")
+    assert not isinstance(
+        fxicons._get_manifest("studio"), fxicons._FXIconPack
+    )
+    fxicons.pack_library(library)
+    assert isinstance(fxicons._get_manifest("studio"), fxicons._FXIconPack)
+
+
+def test_repacking_unmaps_the_old_pack(library):
+    fxicons.pack_library(library)
+    old = fxicons._get_manifest("studio")
+    assert old.data("solid/house.svg") == _SVG.encode("utf-8")
+
+    (library / "solid" / "house.svg").write_text(_SVG.replace("4", "6"))
+    fxicons.pack_library(library)
+    assert old._map is None
+    new = fxicons._get_manifest("studio")
+    assert new is not old
+    assert new.data("solid/house.svg") == _SVG.replace("4", "6").encode()
+
+
+def test_a_closed_pack_falls_back_to_the_folder(library):
+    fxicons.pack_library(library)
+    path = fxicons.get_icon_path("tree", library="studio")
+    fxicons._get_manifest("studio").close()
+
+    assert fxicons._icon_source("studio", path) == path
+
+
+def test_a_pack_replaces_the_manifest_of_a_linked_root(tmp_path, library):
+    link = tmp_path / "linked"
+    os.symlink(tmp_path, link, target_is_directory=True)
+    fxicons._libraries_info["studio"]["root"] = str(link)
+    fxicons.get_icon_path("house", library="studio")
+    assert not isinstance(
+        fxicons._get_manifest("studio"), fxicons._FXIconPack
+    )
+
+    fxicons.pack_library(library)
+    assert isinstance(fxicons._get_manifest("studio"), fxicons._FXIconPack)
+
+
+def test_stylesheet_folders_are_not_packed(tmp_path):
+    folder = tmp_path / "stylesheet_dark"
+    folder.mkdir()
+    (folder / "branch_end.svg").write_text(_SVG)
+
+    with pytest.raises(ValueError):
+        fxicons.pack_library(folder)
+    assert not folder.with_name("stylesheet_dark.fxpack").exists()
+
+
+def test_a_pack_beside_a_stylesheet_folder_is_ignored(tmp_path):
+    folder = tmp_path / "stylesheet_dark"
+    folder.mkdir()
+    (folder / "branch_end.svg").write_text(_SVG)
+    (tmp_path / "stylesheet_dark.fxpack").write_bytes(b"")
+    fxicons.add_library(
+        library="stylesheet_dark",
+        pattern="{root}/{library}/{icon_name}.{extension}",
+        defaults={
+            "extension": "svg",
+            "style": None,
+            "color": None,
+            "width": 16,
+            "height": 16,
+        },
+        root=str(tmp_path),
+    )
+    try:
+        manifest = fxicons._get_manifest("stylesheet_dark")
+        assert not isinstance(manifest, fxicons._FXIconPack)
+        assert manifest.files() == {"branch_end.svg"}
+    finally:
+        fxicons._libraries_info.pop("stylesheet_dark", None)
+        fxicons._manifests.pop("stylesheet_dark", None)
+
+
+def test_the_command_line_packs_folders(library, capsys):
+    assert fxicons._main(["pack-icons", str(library)]) == 0
+    assert library.with_name("studio.fxpack").is_file()
+    assert "studio.fxpack" in capsys.readouterr().out
@@ -0,0 +1,170 @@
+"""Tests for rendering icons ahead of time with `fxicons.prewarm`.
+
+Regression: a tool asking for a few hundred icons while its first window
+was built rasterized each of them in turn on the GUI thread, and nothing
+could render them earlier or elsewhere.
+
+What these tests pin: prewarmed icons land in the `get_pixmap` and
+`get_icon` caches and render exactly as a direct call would, `finished`
+is emitted once every icon is in (also when there is nothing to do, and
+never before the caller could connect), names a library does not carry
+are skipped, icons that are not SVGs are seeded too, `None` is the
+library's color as it is for `get_icon`, and icons are rendered at the
+sizes they are drawn at unless told otherwise.
+"""
+
+# Third-party
+import pytest
+from qtpy.QtCore import QBuffer, QByteArray, QIODevice
+from qtpy.QtGui import QColor, QImage
+
+# Internal
+from fxgui import fxicons
+
+
+_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8">'
+    '<circle cx="4" cy="4" r="3" fill="#000" opacity="0.6"/></svg>'
+)
+
+
+@pytest.fixture
+def library(tmp_path):
+    folder = tmp_path / "studio" / "solid"
+    folder.mkdir(parents=True)
+    for name in ("house", "tree", "lamp"):
+        (folder / f"{name}.svg").write_text(_SVG)
+
+    image = QImage(8, 8, QImage.Format_ARGB32)
+    image.fill(QColor(0, 0, 0, 0))
+    image.setPixelColor(4, 4, QColor("black"))
+    image.save(str(folder / "photo.png"))
+
+    fxicons.add_library(
+        library="studio",
+        pattern="{root}/{library}/{style}/{icon_name}.{extension}",
+        defaults={
+            "extension": "svg",
+            "style": "solid",
+            "color": "#b4b4b4",
+            "width": 16,
+            "height": 16,
+        },
+        root=str(tmp_path),
+    )
+    fxicons.clear_icon_cache()
+    yield folder
+    fxicons._libraries_info.pop("studio", None)
+    fxicons._manifests.pop("studio", None)
+    fxicons.clear_icon_cache()
+
+
+def _png(pixmap):
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    pixmap.toImage().save(buffer, "PNG")
+    return bytes(data)
+
+
+def test_prewarmed_icons_are_cached(qapp, library):
+    warm = fxicons.prewarm(
+        ["house", "tree"], sizes=[16, (24, 32)], library="studio"
+    )
+    assert warm.count() == 4
+    assert warm.wait()
+    assert warm.is_finished()
+    assert fxicons._prewarmed == {}
+
+    pixmaps = fxicons._get_pixmap_cached.cache_info()
+    icons = fxicons._get_icon_cached.cache_info()
+    assert pixmaps.currsize == icons.currsize == 4
+
+    dpr = fxicons._screen_dpr()
+    pixmap = fxicons._get_pixmap_cached(
+        "tree", 24, 32, "#b4b4b4", "studio", None, None, dpr
+    )
+    assert fxicons._get_pixmap_cached.cache_info().hits == pixmaps.hits + 1
+
+    # A prewarmed icon renders exactly like one rendered on demand
+    fxicons.clear_icon_cache()
+    direct = fxicons._get_pixmap_cached(
+        "tree", 24, 32, "#b4b4b4", "studio", None, None, dpr
+    )
+    assert _png(pixmap) == _png(direct)
+    assert pixmap.devicePixelRatio() == direct.devicePixelRatio()
+
+
+def test_finished_is_emitted_through_the_event_loop(qtbot, library):
+    warm = fxicons.prewarm(
+        ["house", "tree", "lamp"],
+        sizes=[16],
+        colors=["#b4b4b4", "red"],
+        library="studio",
+    )
+    progress = []
+    warm.progress.connect(progress.append)
+    with qtbot.waitSignal(warm.finished, timeout=5000) as blocker:
+        pass
+    assert blocker.args == [6]
+    assert progress == [1, 2, 3, 4, 5, 6]
+    assert fxicons._get_icon_cached.cache_info().currsize == 6
+
+
+def test_nothing_to_do_still_finishes(qtbot, library):
+    warm = fxicons.prewarm(["missing", "gone"], library="studio")
+    assert warm.count() == 0
+    assert not warm.is_finished()
+    with qtbot.waitSignal(warm.finished, timeout=1000) as blocker:
+        pass
+    assert blocker.args == [0]
+
+
+def test_icons_in_other_formats_are_seeded(qapp, library):
+    warm = fxicons.prewarm(
+        ["photo"], sizes=[16], library="studio", extension="png"
+    )
+    fired = []
+    warm.finished.connect(fired.append)
+    assert fired == []
+    assert warm.wait()
+    assert fired == [1]
+    before = fxicons._get_pixmap_cached.cache_info()
+    pixmap = fxicons._get_pixmap_cached(
+        "photo",
+        16,
+        16,
+        "#b4b4b4",
+        "studio",
+        None,
+        "png",
+        fxicons._screen_dpr(),
+    )
+    assert not pixmap.isNull()
+    assert fxicons._get_pixmap_cached.cache_info().hits == before.hits + 1
+
+
+def test_no_color_is_the_library_color(qapp, library):
+    warm = fxicons.prewarm(
+        ["house"], sizes=[16], colors=[None, "#b4b4b4"], library="studio"
+    )
+    assert warm.count() == 1
+    assert warm.wait()
+
+    before = fxicons._get_pixmap_cached.cache_info()
+    fxicons.get_pixmap("house", width=16, height=16, library="studio")
+    assert fxicons._get_pixmap_cached.cache_info().hits == before.hits + 1
+
+
+def test_icons_are_rendered_at_the_drawn_sizes_by_default(qapp, library):
+    warm = fxicons.prewarm(["house"], library="studio")
+    assert warm.count() == 2
+    assert warm.wait()
+
+    dpr = fxicons._screen_dpr()
+    before = fxicons._get_pixmap_cached.cache_info()
+    for side in (16, 24):
+        fxicons._get_pixmap_cached(
+            "house", side, side, "#b4b4b4", "studio", None, None, dpr
+        )
+    assert fxicons._get_pixmap_cached.cache_info().hits == before.hits + 2
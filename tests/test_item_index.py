@@ -0,0 +1,164 @@
+"""Tests for the item lookups of the fuzzy search list and tree.
+
+Regression: `FXFuzzySearchList.remove_item` and `select_item` scanned
+every row, and `FXFuzzySearchTree` kept one item per text, so an item
+sharing its text with another in a different branch could no longer be
+found, selected or removed.
+
+What these tests pin: lookups follow the rows as they are added, removed,
+moved and edited without walking the model again, duplicates are all
+kept, tree paths tell them apart, and `remove_items()` removes adjacent
+rows in one model call.
+"""
+
+# Third-party
+import pytest
+from qtpy.QtCore import QModelIndex, QStringListModel
+
+# Internal
+from fxgui.fxwidgets import FXFuzzySearchList, FXFuzzySearchTree
+from fxgui.fxwidgets._fuzzy_search_list import _FXTextRows
+
+
+@pytest.fixture(params=[False, True], ids=["standard", "lightweight"])
+def fuzzy_list(qapp, request):
+    widget = FXFuzzySearchList(lightweight_model=request.param)
+    widget.set_items(["alpha", "beta", "gamma", "beta", "delta"])
+    return widget
+
+
+@pytest.fixture
+def fuzzy_tree(qapp):
+    widget = FXFuzzySearchTree()
+    widget.set_items(
+        {
+            "Characters": ["Hero", "Villain"],
+            "Props": ["Hero", "sword", "shield"],
+        }
+    )
+    return widget
+
+
+def test_the_list_removes_the_first_item_with_a_text(fuzzy_list):
+    assert fuzzy_list.remove_item("beta")
+    assert fuzzy_list.items == ["alpha", "gamma", "beta", "delta"]
+    assert not fuzzy_list.remove_item("omega")
+
+
+def test_the_list_follows_rows_added_and_removed(fuzzy_list):
+    fuzzy_list.remove_item("alpha")
+    fuzzy_list.add_item("omega")
+    assert fuzzy_list.remove_item("omega")
+    assert fuzzy_list.remove_item("delta")
+    assert fuzzy_list.items == ["beta", "gamma", "beta"]
+
+
+def test_the_list_selects_an_item_by_text(fuzzy_list):
+    assert fuzzy_list.select_item("gamma")
+    assert fuzzy_list.current_item == "gamma"
+    assert not fuzzy_list.select_item("omega")
+
+
+def test_remove_items_removes_each_run_in_one_model_call(fuzzy_list):
+    calls = []
+    fuzzy_list.source_model.rowsRemoved.connect(
+        lambda _parent, first, last: calls.append((first, last))
+    )
+    assert fuzzy_list.remove_items(["beta", "gamma", "omega"]) == 3
+    assert fuzzy_list.items == ["alpha", "delta"]
+    assert calls == [(1, 3)]
+
+
+def test_removals_update_the_index_in_place(fuzzy_list):
+    index = fuzzy_list._rows
+    fuzzy_list.select_item("alpha")
+    assert index._rebuilds == 1
+
+    for text in ("alpha", "beta", "delta"):
+        assert fuzzy_list.remove_item(text)
+        assert fuzzy_list.select_item("gamma")
+    assert fuzzy_list.remove_items(["beta", "omega"]) == 1
+    assert fuzzy_list.items == ["gamma"]
+    assert index.rows("gamma") == [0]
+    assert index._rebuilds == 1
+
+
+def test_scattered_removals_keep_every_lookup_right(qapp):
+    texts = [f"name{number % 300}" for number in range(1200)]
+    model = QStringListModel(texts)
+    index = _FXTextRows(model)
+    index.rows("name0")
+
+    # A third of the rows, then another third, past the point where the
+    # index compacts its slots
+    for cut in (texts[::3], texts[1::3]):
+        rows = sorted({row for text in set(cut) for row in index.rows(text)})
+        index.remove(rows)
+        texts = model.stringList()
+        for text in set(texts):
+            assert index.rows(text) == [
+                row for row, other in enumerate(texts) if other == text
+            ]
+    assert index.rows("name0") == []
+    assert index._rebuilds == 1
+
+
+def test_the_index_follows_inserts_moves_and_edits(qapp):
+    model = QStringListModel(["alpha", "beta", "gamma", "beta"])
+    index = _FXTextRows(model)
+    index.rows("alpha")
+
+    model.insertRows(1, 1)
+    model.setData(model.index(1), "omega")
+    model.setData(model.index(3), "delta")
+    assert model.moveRows(QModelIndex(), 0, 1, QModelIndex(), 5)
+
+    texts = model.stringList()
+    assert texts == ["omega", "beta", "delta", "beta", "alpha"]
+    for text in set(texts) | {"gamma"}:
+        assert index.rows(text) == [
+            row for row, other in enumerate(texts) if other == text
+        ]
+    assert index._rebuilds == 1
+
+
+def test_the_tree_keeps_items_sharing_a_text(fuzzy_tree):
+    assert len(fuzzy_tree.get_items("Hero")) == 2
+    assert fuzzy_tree.get_item("Hero").parent().text() == "Characters"
+    assert fuzzy_tree.get_item("Props/Hero").parent().text() == "Props"
+
+
+def test_the_tree_adds_under_a_parent_path(fuzzy_tree):
+    fuzzy_tree.add_item("Cape", parent="Props/Hero")
+    assert fuzzy_tree.get_item("Props/Hero/Cape") is not None
+    assert fuzzy_tree.get_item("Characters/Hero").rowCount() == 0
+
+
+def test_the_tree_removes_an_item_by_path(fuzzy_tree):
+    assert fuzzy_tree.remove_item("Props/Hero")
+    assert fuzzy_tree.get_item("Props/Hero") is None
+    assert fuzzy_tree.get_item("Hero").parent().text() == "Characters"
+
+
+def test_the_tree_forgets_the_children_of_a_removed_item(fuzzy_tree):
+    assert fuzzy_tree.remove_item("Props")
+    assert fuzzy_tree.get_item("sword") is None
+    assert fuzzy_tree.get_items("Hero") == [
+        fuzzy_tree.get_item("Characters/Hero")
+    ]
+
+
+def test_the_tree_removes_items_in_runs(fuzzy_tree):
+    calls = []
+    fuzzy_tree.source_model.rowsRemoved.connect(
+        lambda parent, first, last: calls.append((parent.data(), first, last))
+    )
+    assert fuzzy_tree.remove_items(["Hero", "sword", "Characters"]) == 3
+    assert set(calls) == {("Props", 0, 1), (None, 0, 0)}
+    assert fuzzy_tree.items == ["Props", "shield"]
+
+
+@pytest.mark.parametrize("method", ["select_item", "expand_item"])
+def test_the_tree_reaches_an_item_by_path(fuzzy_tree, method):
+    assert getattr(fuzzy_tree, method)("Props/Hero")
+    assert not getattr(fuzzy_tree, method)("Props/Villain")
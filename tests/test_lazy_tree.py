@@ -0,0 +1,96 @@
+"""Tests for loading the fuzzy search tree from a provider.
+
+What these tests pin: only the top level is asked for up front, a
+branch is asked for once, when it is first expanded, leaves show no
+expand arrow, and a search provider loads the branches down to matches
+that were never expanded, without loading the rest of the hierarchy.
+"""
+
+# Third-party
+import pytest
+
+# Internal
+from fxgui.fxcore import FXSortFilterProxyModel
+from fxgui.fxwidgets import FXFuzzySearchTree
+from fxgui.fxwidgets._fuzzy_search_tree import _CHILDREN_PENDING_ROLE
+
+
+def _provider(calls):
+    """A three-level hierarchy of three children per item."""
+
+    def children(path):
+        calls.append(path)
+        depth = 0 if path is None else path.count("/") + 1
+        if depth == 2:
+            return [(f"leaf{number}", False) for number in range(3)]
+        return [f"level{depth}_{number}" for number in range(3)]
+
+    return children
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def fuzzy_tree(qapp, calls):
+    widget = FXFuzzySearchTree()
+    widget.set_provider(
+        _provider(calls),
+        search_provider=lambda text: (
+            ["level0_2/level1_1/leaf2"] if text == "leaf2" else []
+        ),
+    )
+    return widget
+
+
+def test_only_the_top_level_is_loaded_up_front(fuzzy_tree, calls):
+    assert calls == [None]
+    assert fuzzy_tree.items == ["level0_0", "level0_1", "level0_2"]
+    proxy = fuzzy_tree.proxy_model
+    assert proxy.hasChildren(proxy.index(0, 0))
+
+
+def test_a_branch_is_loaded_once_when_expanded(fuzzy_tree, calls):
+    assert fuzzy_tree.expand_item("level0_1")
+    fuzzy_tree.collapse_item("level0_1")
+    fuzzy_tree.expand_item("level0_1")
+    assert calls == [None, "level0_1"]
+    assert fuzzy_tree.get_item("level0_1/level1_2") is not None
+
+
+def test_leaves_have_no_children(fuzzy_tree):
+    fuzzy_tree.expand_item("level0_0")
+    fuzzy_tree.expand_item("level0_0/level1_0")
+    source = fuzzy_tree.source_model
+    leaf = source.indexFromItem(fuzzy_tree.get_item("level0_0/level1_0/leaf0"))
+    assert not source.hasChildren(leaf)
+    assert not source.canFetchMore(leaf)
+
+
+def test_expand_all_expands_loaded_branches_only(fuzzy_tree, calls):
+    fuzzy_tree.expand_item("level0_0")
+    fuzzy_tree.expand_all()
+    assert calls == [None, "level0_0"]
+
+
+def test_the_search_provider_loads_the_branches_to_a_match(fuzzy_tree, calls):
+    fuzzy_tree.search_text = "leaf2"
+    fuzzy_tree._on_search_changed("leaf2")
+    assert calls == [None, "level0_2", "level0_2/level1_1"]
+    assert fuzzy_tree.select_item("level0_2/level1_1/leaf2")
+    assert fuzzy_tree.current_item == "leaf2"
+
+
+def test_set_items_leaves_provider_mode(fuzzy_tree, calls):
+    fuzzy_tree.set_items({"Props": ["sword"]})
+    fuzzy_tree.expand_all()
+    assert calls == [None]
+    assert fuzzy_tree.items == ["Props", "sword"]
+
+
+def test_the_pending_flag_is_not_the_match_spans_role(qapp):
+    """The proxy answers `MATCH_SPANS_ROLE` itself, so sharing it would
+    hide the pending flag from anything reading through the proxy."""
+    assert _CHILDREN_PENDING_ROLE != FXSortFilterProxyModel.MATCH_SPANS_ROLE
@@ -0,0 +1,83 @@
+"""Tests for FXThumbnailDelegate's highlight of the matched characters.
+
+`FXSortFilterProxyModel.MATCH_SPANS_ROLE` gives the characters of a row the
+filter text matched. What these tests pin: the delegate draws those runs
+bold and the rest at regular weight, even when the title font is bold,
+and draws the title unchanged when no filter is set.
+"""
+
+# Third-party
+from qtpy.QtCore import QRect, QStringListModel, Qt
+from qtpy.QtGui import QFont, QImage, QPainter
+
+# Internal
+from fxgui.fxcore import FXSortFilterProxyModel, FXSubsequenceScorer
+from fxgui.fxwidgets import FXThumbnailDelegate
+
+
+class _RecordingPainter(QPainter):
+    """A painter that records each text it draws and whether it was bold."""
+
+    def __init__(self, device):
+        super().__init__(device)
+        self.runs = []
+
+    def drawText(self, rect, flags, text):
+        self.runs.append((text, self.font().bold()))
+        super().drawText(rect, flags, text)
+
+
+def _draw(proxy, bold_title: bool = True):
+    image = QImage(400, 40, QImage.Format_ARGB32)
+    image.fill(0)
+    painter = _RecordingPainter(image)
+    font = QFont()
+    font.setBold(bold_title)
+    try:
+        FXThumbnailDelegate()._draw_title(
+            painter,
+            QRect(0, 0, 400, 40),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            proxy.index(0, 0).data(),
+            font,
+            proxy.index(0, 0),
+        )
+    finally:
+        painter.end()
+    return painter.runs
+
+
+def _proxy(text: str) -> FXSortFilterProxyModel:
+    model = QStringListModel([text])
+    proxy = FXSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy._test_model = model
+    return proxy
+
+
+def test_the_matched_characters_are_drawn_bold(qapp):
+    proxy = _proxy("Character_Hero")
+    proxy.set_filter_text("hero")
+
+    assert _draw(proxy) == [("Character_", False), ("Hero", True)]
+
+
+def test_scattered_matches_are_drawn_run_by_run(qapp):
+    proxy = _proxy("character_hero_body")
+    proxy.set_scorer(FXSubsequenceScorer())
+    proxy.set_ratio(0.1)
+    proxy.set_filter_text("hbo")
+
+    assert _draw(proxy, bold_title=False) == [
+        ("character_", False),
+        ("h", True),
+        ("ero_", False),
+        ("bo", True),
+        ("dy", False),
+    ]
+
+
+def test_without_a_filter_the_title_is_drawn_as_is(qapp):
+    proxy = _proxy("Character_Hero")
+
+    assert _draw(proxy) == [("Character_Hero", True)]
@@ -0,0 +1,142 @@
+"""Tests for the incremental floor behind `apply_minimum_thumbnail_width`.
+
+Regression: every resize that could breach column 0's floor walked every
+expanded row of the model and measured each one, which is O(n) in Python
+per header drag on a production-sized tree.
+
+What these tests pin: the tracked floor always equals a full walk of the
+laid-out rows as rows are inserted, removed, edited, expanded and
+collapsed, and a resize reads the tracked floor without walking the tree.
+"""
+
+# Third-party
+import pytest
+from qtpy.QtGui import QColor
+from qtpy.QtWidgets import QTreeWidget, QTreeWidgetItem
+
+# Internal
+from fxgui.fxwidgets import FXThumbnailDelegate
+
+
+PILL_COLOR = QColor("#ff00ff")
+
+
+def _item(parent, name: str, label: str = None) -> QTreeWidgetItem:
+    item = QTreeWidgetItem(parent, [name])
+    item.setData(0, FXThumbnailDelegate.THUMBNAIL_VISIBLE_ROLE, True)
+    if label:
+        item.setData(0, FXThumbnailDelegate.STATUS_LABEL_COLOR_ROLE, PILL_COLOR)
+        item.setData(0, FXThumbnailDelegate.STATUS_LABEL_TEXT_ROLE, label)
+    return item
+
+
+@pytest.fixture
+def tree(qtbot):
+    tree = QTreeWidget()
+    tree.setHeaderLabels(["Name"])
+    tree.header().setStretchLastSection(False)
+    tree.header().setMinimumSectionSize(10)
+    tree.setItemDelegate(FXThumbnailDelegate())
+    qtbot.addWidget(tree)
+
+    sequence = _item(tree, "Sequence", "Ready")
+    for number in range(3):
+        _item(sequence, f"Shot {number}", "wip")
+    _item(tree, "Asset", "Done")
+
+    FXThumbnailDelegate.apply_minimum_thumbnail_width(tree)
+    return tree
+
+
+def _tracked(tree) -> int:
+    return tree._fxgui_minimum_width_trackers[0].floor()
+
+
+def _walked(tree) -> int:
+    return FXThumbnailDelegate._measure_minimum_width(tree, 0)
+
+
+def test_the_tracked_floor_matches_a_full_walk(tree):
+    assert _tracked(tree) == _walked(tree) > 0
+
+
+def test_expanding_adds_the_rows_it_lays_out(tree):
+    before = _tracked(tree)
+    sequence = tree.topLevelItem(0)
+    _item(sequence, "Shot 9", "Waiting for approval, second pass")
+    # Collapsed, so the wide child does not count yet
+    assert _tracked(tree) == _walked(tree) == before
+
+    tree.expandItem(sequence)
+    assert _tracked(tree) == _walked(tree) > before
+
+    tree.collapseItem(sequence)
+    assert _tracked(tree) == _walked(tree) == before
+
+
+def test_inserting_and_removing_rows_keeps_the_floor(tree):
+    before = _tracked(tree)
+    wide = _item(tree, "Asset wide", "Waiting for approval, second pass")
+    assert _tracked(tree) == _walked(tree) > before
+
+    tree.takeTopLevelItem(tree.indexOfTopLevelItem(wide))
+    assert _tracked(tree) == _walked(tree) == before
+
+
+def test_removing_an_expanded_branch_drops_its_rows(tree):
+    sequence = tree.topLevelItem(0)
+    _item(sequence, "Shot 9", "Waiting for approval, second pass")
+    tree.expandItem(sequence)
+    assert _tracked(tree) == _walked(tree)
+
+    tree.takeTopLevelItem(0)
+    assert _tracked(tree) == _walked(tree)
+
+
+def test_edited_data_is_measured_again(tree):
+    before = _tracked(tree)
+    tree.topLevelItem(1).setData(
+        0,
+        FXThumbnailDelegate.STATUS_LABEL_TEXT_ROLE,
+        "Waiting for approval, second pass",
+    )
+    assert _tracked(tree) == _walked(tree) > before
+
+    tree.topLevelItem(1).setData(
+        0, FXThumbnailDelegate.STATUS_LABEL_TEXT_ROLE, "Done"
+    )
+    assert _tracked(tree) == _walked(tree) == before
+
+
+def test_a_delegate_setting_is_picked_up(tree):
+    before = _tracked(tree)
+    tree.itemDelegate().show_status_label = False
+    assert _tracked(tree) == _walked(tree) < before
+
+
+def test_a_resize_does_not_walk_the_tree(tree, monkeypatch):
+    floor = _tracked(tree)
+
+    walks = []
+    original = FXThumbnailDelegate._laid_out_indexes
+    monkeypatch.setattr(
+        FXThumbnailDelegate,
+        "_laid_out_indexes",
+        staticmethod(lambda *args: walks.append(args) or original(*args)),
+    )
+    for attempt in (floor - 1, floor - 40, 20):
+        tree.header().resizeSection(0, attempt)
+        assert tree.columnWidth(0) == floor
+
+    assert not walks
+
+
+def test_applying_again_measures_afresh(tree):
+    # expandAll() emits no expanded signal, so the opt-in is run again
+    sequence = tree.topLevelItem(0)
+    _item(sequence, "Shot 9", "Waiting for approval, second pass")
+    tree.expandAll()
+
+    FXThumbnailDelegate.apply_minimum_thumbnail_width(tree)
+    assert _tracked(tree) == _walked(tree)
+    assert len(tree._fxgui_minimum_width_trackers) == 1
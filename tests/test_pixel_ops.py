@@ -0,0 +1,130 @@
+"""Tests for the raw-buffer pixel operations behind icon recoloring.
+
+Regression: `has_transparency` called `QImage.pixelIndex` once per pixel
+from Python, and `change_pixmap_color` ran it for every colored icon, so
+an opaque 96x96 icon at a device pixel ratio of 2 cost tens of thousands
+of calls before anything was drawn.
+
+What these tests pin: transparency is found from the buffer with the
+same answers as before, recoloring matches a `QPainter` SourceIn fill
+byte for byte with and without NumPy, and the recolored pixmaps keep
+the source's device pixel ratio.
+"""
+
+# Third-party
+import pytest
+from qtpy.QtCore import QPointF, Qt
+from qtpy.QtGui import QColor, QImage, QPainter, QPixmap
+
+# Internal
+from fxgui import _pixel_ops, fxicons
+
+
+def _shape(size=24):
+    """A soft, half-transparent disc on a clear background."""
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(40, 60, 80, 180))
+    painter.drawEllipse(QPointF(size / 2, size / 2), size / 3, size / 3)
+    painter.end()
+    return image
+
+
+def _painted(image, color):
+    result = image.copy()
+    painter = QPainter(result)
+    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+    painter.fillRect(result.rect(), QColor(color))
+    painter.end()
+    return result
+
+
+def _bytes(image):
+    image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    return _pixel_ops._pixels(image, 4)
+
+
+@pytest.fixture(params=["numpy", "painter"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(_pixel_ops, "np", None)
+    return request.param
+
+
+def test_clear_pixels_match_the_mask_answer(qapp):
+    for fill in (QColor(255, 0, 0), QColor(0, 0, 0, 0), QColor(0, 0, 0, 1)):
+        pixmap = QPixmap(5, 3)
+        pixmap.fill(fill)
+        mask = pixmap.createMaskFromColor(Qt.transparent)
+        expected = fill.alpha() == 0
+        assert fxicons.has_transparency(mask) is expected
+        assert _pixel_ops.has_clear_pixels(pixmap.toImage()) is expected
+
+
+def test_a_single_clear_pixel_is_found(qapp):
+    # An odd width pads the rows of the 1-bit mask
+    image = QImage(13, 7, QImage.Format_ARGB32_Premultiplied)
+    image.fill(QColor("white"))
+    assert not _pixel_ops.has_clear_pixels(image)
+    image.setPixelColor(12, 6, QColor(0, 0, 0, 0))
+    assert _pixel_ops.has_clear_pixels(image)
+
+    mask = QPixmap.fromImage(image).createMaskFromColor(Qt.transparent)
+    assert fxicons.has_transparency(mask)
+
+
+@pytest.mark.parametrize(
+    "color", ["#ff8000", "#80ff0080", "#c4a80daf", "white"]
+)
+def test_tinting_matches_a_painter_fill(qapp, backend, color):
+    image = _shape()
+    tinted = _pixel_ops.tint(image, color)
+    assert tinted.format() == QImage.Format_ARGB32_Premultiplied
+    assert _bytes(tinted) == _bytes(_painted(image, color))
+
+
+def test_translucent_tints_round_like_a_painter_fill(qapp, backend):
+    # One pixel per alpha, tinted with translucent colors whose
+    # premultiplied channels round differently from a plain division
+    image = QImage(256, 1, QImage.Format_ARGB32_Premultiplied)
+    for alpha in range(256):
+        image.setPixel(alpha, 0, alpha << 24)
+    colors = ["#c4a80daf", "#7f3c9de1", "#01ffffff", "#fe102030"]
+    variants = _pixel_ops.tint_variants(image, colors)
+    assert [_bytes(variant) for variant in variants] == [
+        _bytes(_painted(image, color)) for color in colors
+    ]
+
+
+def test_variants_are_tinted_in_order(qapp, backend):
+    image = _shape()
+    colors = ["red", "#00ff00", "#336699"]
+    variants = _pixel_ops.tint_variants(image, colors)
+    assert [_bytes(variant) for variant in variants] == [
+        _bytes(_painted(image, color)) for color in colors
+    ]
+
+
+def test_recolored_pixmaps_keep_their_ratio(qapp, backend):
+    pixmap = QPixmap.fromImage(_shape(48))
+    pixmap.setDevicePixelRatio(2.0)
+
+    colored = fxicons.change_pixmap_color(pixmap, "#ff8000")
+    assert colored.devicePixelRatio() == 2.0
+    assert _bytes(colored.toImage()) == _bytes(
+        _painted(pixmap.toImage(), "#ff8000")
+    )
+
+    disabled, selected = fxicons._colored_copies(pixmap, ["#555", "#fff"])
+    assert disabled.devicePixelRatio() == selected.devicePixelRatio() == 2.0
+
+
+def test_opaque_pixmaps_are_left_alone(qapp):
+    pixmap = QPixmap(16, 16)
+    pixmap.fill(QColor("red"))
+    assert fxicons.change_pixmap_color(pixmap, "blue") is pixmap
@@ -0,0 +1,137 @@
+"""Tests for FXThumbnailDelegate's cached size hints and uniform rows.
+
+Regression: `sizeHint` built fresh font metrics, measured the indicators
+and computed the row's minimum width for every index the view asked
+about, which dominated layout time on views of 100k rows.
+
+What these tests pin: a repeated question is answered from the cache,
+the cache follows `dataChanged` per row and drops everything on a
+structural change or a theme change, and `uniform_row_height` reports one
+height for every row so `setUniformRowHeights(True)` is safe.
+"""
+
+# Third-party
+import pytest
+from qtpy.QtGui import QStandardItem, QStandardItemModel
+from qtpy.QtWidgets import QStyleOptionViewItem
+
+# Internal
+from fxgui import fxstyle
+from fxgui.fxwidgets import FXThumbnailDelegate
+
+
+@pytest.fixture
+def model():
+    model = QStandardItemModel()
+    for name in ("Shot 010", "Shot 020"):
+        item = QStandardItem(name)
+        item.setData(False, FXThumbnailDelegate.THUMBNAIL_VISIBLE_ROLE)
+        model.appendRow(item)
+    return model
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    """A delegate that counts how often it actually measures a row."""
+
+    delegate = FXThumbnailDelegate()
+    calls = []
+    original = delegate._measure_size_hint
+    monkeypatch.setattr(
+        delegate,
+        "_measure_size_hint",
+        lambda option, index: calls.append(index.row())
+        or original(option, index),
+    )
+    return delegate, calls
+
+
+def test_a_repeated_size_hint_is_measured_once(qapp, model, counted):
+    delegate, calls = counted
+    option = QStyleOptionViewItem()
+    first = delegate.sizeHint(option, model.index(0, 0))
+    second = delegate.sizeHint(option, model.index(0, 0))
+
+    assert first == second
+    assert calls == [0]
+
+
+def test_changed_data_remeasures_only_that_row(qapp, model, counted):
+    delegate, calls = counted
+    option = QStyleOptionViewItem()
+    delegate.sizeHint(option, model.index(0, 0))
+    delegate.sizeHint(option, model.index(1, 0))
+    assert (
+        delegate.sizeHint(option, model.index(0, 0)).height()
+        == FXThumbnailDelegate.ROW_HEIGHT_SIMPLE
+    )
+
+    model.item(0).setData("A note", FXThumbnailDelegate.DESCRIPTION_ROLE)
+    del calls[:]
+
+    assert (
+        delegate.sizeHint(option, model.index(0, 0)).height()
+        == FXThumbnailDelegate.ROW_HEIGHT_DESCRIPTION
+    )
+    delegate.sizeHint(option, model.index(1, 0))
+    assert calls == [0]
+
+
+def test_a_structural_change_remeasures_everything(qapp, model, counted):
+    delegate, calls = counted
+    option = QStyleOptionViewItem()
+    delegate.sizeHint(option, model.index(1, 0))
+
+    model.insertRow(0, QStandardItem("Shot 005"))
+    del calls[:]
+    delegate.sizeHint(option, model.index(1, 0))
+
+    assert calls == [1]
+
+
+def test_a_theme_change_remeasures_everything(qapp, model, counted):
+    delegate, calls = counted
+    option = QStyleOptionViewItem()
+    delegate.sizeHint(option, model.index(0, 0))
+
+    current = fxstyle.get_theme()
+    try:
+        fxstyle.apply_theme(theme="light" if current != "light" else "dark")
+        del calls[:]
+        delegate.sizeHint(option, model.index(0, 0))
+        assert calls == [0]
+    finally:
+        fxstyle.apply_theme(theme=current)
+
+
+def test_a_display_setter_remeasures_everything(qapp, model, counted):
+    delegate, calls = counted
+    option = QStyleOptionViewItem()
+    delegate.sizeHint(option, model.index(0, 0))
+
+    delegate.show_status_label = False
+    del calls[:]
+    delegate.sizeHint(option, model.index(0, 0))
+
+    assert calls == [0]
+
+
+def test_uniform_rows_report_one_height(qapp, model):
+    model.item(1).setData("A note", FXThumbnailDelegate.DESCRIPTION_ROLE)
+    delegate = FXThumbnailDelegate()
+    delegate.uniform_row_height = FXThumbnailDelegate.ROW_HEIGHT_THUMBNAIL
+    option = QStyleOptionViewItem()
+
+    heights = {
+        delegate.sizeHint(option, model.index(row, 0)).height()
+        for row in range(model.rowCount())
+    }
+    assert heights == {FXThumbnailDelegate.ROW_HEIGHT_THUMBNAIL}
+
+
+def test_uniform_row_height_only_takes_a_row_height(qapp):
+    delegate = FXThumbnailDelegate()
+    with pytest.raises(ValueError):
+        delegate.uniform_row_height = 35
+    delegate.uniform_row_height = None
+    assert delegate.uniform_row_height is None
@@ -0,0 +1,107 @@
+"""Tests for streaming items into the fuzzy search list and tree.
+
+What these tests pin: `add_items()` reads its iterable from the event
+loop a chunk at a time, inserts each chunk as one block of rows, reports
+progress, and filters new rows with the current search text without
+re-filtering the rows already shown.
+"""
+
+# Third-party
+import pytest
+
+# Internal
+from fxgui.fxwidgets import FXFuzzySearchList, FXFuzzySearchTree
+
+
+def _names(count):
+    for number in range(count):
+        yield f"shot_{number:03d}" if number % 2 else f"asset_{number:03d}"
+
+
+def _inserts(model):
+    blocks = []
+    model.rowsInserted.connect(
+        lambda parent, first, last: blocks.append(
+            (parent.data(), last - first + 1)
+        )
+    )
+    return blocks
+
+
+@pytest.fixture(params=[False, True], ids=["standard", "lightweight"])
+def fuzzy_list(qapp, request):
+    return FXFuzzySearchList(lightweight_model=request.param)
+
+
+def test_the_list_reads_a_generator_in_chunks(fuzzy_list, qtbot):
+    blocks = _inserts(fuzzy_list.source_model)
+    progress = []
+    fuzzy_list.loading_progress.connect(progress.append)
+    with qtbot.waitSignal(fuzzy_list.loading_finished) as finished:
+        fuzzy_list.add_items(_names(250), chunk_size=100)
+        assert fuzzy_list.items == []
+        assert fuzzy_list.is_loading()
+
+    assert finished.args == [250]
+    assert not fuzzy_list.is_loading()
+    assert progress == [100, 200, 250]
+    assert blocks == [(None, 100), (None, 100), (None, 50)]
+    assert fuzzy_list.items == list(_names(250))
+
+
+def test_new_list_rows_are_filtered_as_they_arrive(fuzzy_list, qtbot):
+    fuzzy_list.set_items(["shot_999", "asset_999"])
+    fuzzy_list.proxy_model.set_filter_text("shot")
+    invalidated = []
+    fuzzy_list.proxy_model.layoutChanged.connect(lambda: invalidated.append(1))
+    with qtbot.waitSignal(fuzzy_list.loading_finished):
+        fuzzy_list.add_items(_names(40), chunk_size=10)
+
+    assert set(fuzzy_list.visible_items) == {
+        name for name in _names(40) if name.startswith("shot")
+    } | {"shot_999"}
+    assert not invalidated
+
+
+def test_set_items_drops_the_items_not_read_yet(fuzzy_list, qtbot):
+    fuzzy_list.add_items(_names(100), chunk_size=10)
+    fuzzy_list.set_items(["alpha"])
+    qtbot.wait(20)
+    assert not fuzzy_list.is_loading()
+    assert fuzzy_list.items == ["alpha"]
+
+
+def test_the_tree_inserts_a_block_per_parent(qapp, qtbot):
+    fuzzy_tree = FXFuzzySearchTree()
+    blocks = _inserts(fuzzy_tree.source_model)
+    entries = [
+        "Props",
+        "Vehicles",
+        ("sword", "Props"),
+        ("shield", "Props"),
+        ("Hero", "Props"),
+        ("car", "Vehicles"),
+        ("Cape", "Props/Hero"),
+    ]
+    with qtbot.waitSignal(fuzzy_tree.loading_finished):
+        fuzzy_tree.add_items(iter(entries), chunk_size=100)
+
+    assert blocks == [
+        (None, 2),
+        ("Props", 3),
+        ("Vehicles", 1),
+        ("Hero", 1),
+    ]
+    assert fuzzy_tree.get_item("Props/Hero/Cape") is not None
+
+
+def test_new_tree_rows_show_their_hidden_parents(qapp, qtbot):
+    fuzzy_tree = FXFuzzySearchTree()
+    fuzzy_tree.set_items({"Props": ["sword"], "Vehicles": ["car"]})
+    fuzzy_tree.proxy_model.set_filter_text("xylophone")
+    assert fuzzy_tree.proxy_model.rowCount() == 0
+
+    with qtbot.waitSignal(fuzzy_tree.loading_finished):
+        fuzzy_tree.add_items([("xylophone", "Props")], chunk_size=10)
+    qtbot.waitUntil(lambda: fuzzy_tree.proxy_model.rowCount() == 1)
+    assert fuzzy_tree.proxy_model.index(0, 0).data() == "Props"
@@ -0,0 +1,315 @@
+"""Tests for FXThumbnailDelegate's background thumbnail loading.
+
+Regression: `_draw_thumbnail_content` decoded and rescaled the full image
+inside `paint()` for every visible row on every repaint, which stalls a view
+of thousands of rows whose thumbnails sit on a network share.
+
+What these tests pin: decoding happens on the loader's pool, the row paints
+an empty frame until its image arrives and is repainted when it does, the
+decoded images are kept in an LRU bounded by bytes, and the synchronous
+mode still paints the image on the first pass. Downscaled thumbnails also
+persist on disk, keyed by the source's modification time, so a relaunched
+tool reads them back without opening the source at all. The finished
+bordered tile is cached too, so a repaint is one `drawPixmap` per row, and
+those tiles are dropped when the theme changes.
+"""
+
+# Built-in
+import os
+
+# Third-party
+import pytest
+from qtpy.QtCore import QRect
+from qtpy.QtGui import QColor, QImage
+from qtpy.QtWidgets import QTreeWidget, QTreeWidgetItem
+
+# Internal
+from fxgui import fxstyle
+from fxgui.fxwidgets import FXThumbnailDelegate, _thumbnail_loader
+from fxgui.fxwidgets._thumbnail_loader import (
+    _decode_thumbnail,
+    _FXThumbnailDiskCache,
+    _FXThumbnailLoader,
+    _get_disk_cache,
+)
+
+
+# A color no theme uses, so one pixel of it is unambiguous
+IMAGE_COLOR = QColor("#ff00ff")
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    """A 16:9 plate far larger than the thumbnail box, in one flat color."""
+
+    image = QImage(1920, 1080, QImage.Format_RGB32)
+    image.fill(IMAGE_COLOR)
+    path = tmp_path / "plate.png"
+    image.save(str(path))
+    return str(path)
+
+
+def _tree(qtbot, path: str, load_async: bool = True):
+    tree = QTreeWidget()
+    tree.setHeaderLabels(["Name"])
+    tree.setRootIsDecorated(False)
+    tree.resize(420, 160)
+
+    delegate = FXThumbnailDelegate()
+    delegate.load_thumbnails_async = load_async
+    tree.setItemDelegate(delegate)
+
+    item = QTreeWidgetItem(tree, ["Shot 010"])
+    item.setData(0, FXThumbnailDelegate.THUMBNAIL_PATH_ROLE, path)
+
+    qtbot.addWidget(tree)
+    tree.show()
+    qtbot.waitExposed(tree)
+    return tree, delegate
+
+
+def _image_pixels(tree) -> int:
+    """How many pixels of the image color column 0's thumbnail box shows."""
+
+    row = tree.visualRect(tree.model().index(0, 0))
+    box = QRect(row.left() + 6, row.top() + 6, 68, row.height() - 12)
+    image = tree.viewport().grab(box).toImage()
+    target = IMAGE_COLOR.rgb() & 0x00FFFFFF
+    return sum(
+        1
+        for y in range(image.height())
+        for x in range(image.width())
+        if (image.pixel(x, y) & 0x00FFFFFF) == target
+    )
+
+
+def test_the_decoded_image_fits_the_thumbnail_box(qapp, image_path):
+    image = _decode_thumbnail(image_path, 68, 38, 1.0)
+    assert image.width() <= 68 and image.height() <= 38
+    # Aspect is kept, so the 16:9 plate fills one of the two edges
+    assert image.width() == 68 or image.height() == 38
+
+
+def test_the_decoded_image_is_sized_for_the_pixel_ratio(qapp, image_path):
+    image = _decode_thumbnail(image_path, 68, 38, 2.0)
+    assert image.devicePixelRatio() == 2.0
+    assert image.width() <= 136 and image.height() <= 76
+    assert image.width() > 68
+
+
+def test_an_unreadable_file_decodes_to_a_null_image(qapp, tmp_path):
+    assert _decode_thumbnail(str(tmp_path / "nope.png"), 68, 38, 1.0).isNull()
+
+
+def test_a_row_paints_its_frame_first_and_its_image_once_loaded(
+    qtbot, image_path
+):
+    tree, delegate = _tree(qtbot, image_path)
+    key = (image_path, 68, 38, tree.viewport().devicePixelRatioF())
+
+    # The first paint queued the decode rather than doing it
+    qtbot.waitUntil(lambda: delegate._thumbnail_loader.cached(key) is not None)
+    assert not delegate._thumbnail_loader.is_pending(key)
+
+    qtbot.waitUntil(lambda: _image_pixels(tree) > 0)
+
+
+def test_the_synchronous_mode_paints_the_image_on_the_first_pass(
+    qtbot, image_path
+):
+    tree, _ = _tree(qtbot, image_path, load_async=False)
+    assert _image_pixels(tree) > 0
+
+
+def test_a_request_answers_none_until_the_image_is_ready(qapp, image_path):
+    loader = _FXThumbnailLoader()
+    key = (image_path, 68, 38, 1.0)
+
+    assert loader.request(key) is None
+    assert loader.is_pending(key)
+    # A second request joins the first rather than queueing another decode
+    assert loader.request(key) is None
+
+    assert loader.wait_for_done(5000)
+    qapp.processEvents()
+    pixmap = loader.request(key)
+    assert pixmap is not None and not pixmap.isNull()
+
+
+def test_an_unreadable_file_is_tried_once(qapp, tmp_path):
+    loader = _FXThumbnailLoader()
+    key = (str(tmp_path / "nope.png"), 68, 38, 1.0)
+
+    pixmap = loader.load(key)
+    assert pixmap.isNull()
+    # Cached as null, so a repaint does not decode it again
+    assert loader.cached(key) is not None
+
+
+def test_the_cache_is_bounded_by_bytes(qapp, tmp_path):
+    paths = []
+    for number in range(4):
+        image = QImage(68, 38, QImage.Format_ARGB32)
+        image.fill(IMAGE_COLOR)
+        path = tmp_path / f"frame_{number}.png"
+        image.save(str(path))
+        paths.append(str(path))
+
+    one = 68 * 38 * 4
+    loader = _FXThumbnailLoader(max_bytes=one * 2)
+    for path in paths:
+        loader.load((path, 68, 38, 1.0))
+
+    assert loader.cache_bytes <= one * 2
+    # The least recently used went first
+    assert loader.cached((paths[0], 68, 38, 1.0)) is None
+    assert loader.cached((paths[-1], 68, 38, 1.0)) is not None
+
+
+def test_touching_an_entry_keeps_it_over_newer_ones(qapp, tmp_path):
+    paths = []
+    for number in range(3):
+        image = QImage(68, 38, QImage.Format_ARGB32)
+        image.fill(IMAGE_COLOR)
+        path = tmp_path / f"frame_{number}.png"
+        image.save(str(path))
+        paths.append(str(path))
+
+    one = 68 * 38 * 4
+    loader = _FXThumbnailLoader(max_bytes=one * 2)
+    loader.load((paths[0], 68, 38, 1.0))
+    loader.load((paths[1], 68, 38, 1.0))
+    loader.cached((paths[0], 68, 38, 1.0))
+    loader.load((paths[2], 68, 38, 1.0))
+
+    assert loader.cached((paths[0], 68, 38, 1.0)) is not None
+    assert loader.cached((paths[1], 68, 38, 1.0)) is None
+
+
+def test_the_delegate_exposes_the_cache_bound(qapp):
+    delegate = FXThumbnailDelegate()
+    delegate.thumbnail_cache_bytes = 1024
+    assert delegate.thumbnail_cache_bytes == 1024
+
+
+def test_a_decoded_thumbnail_is_written_to_the_disk_cache(
+    qapp, image_path
+):
+    key = (image_path, 68, 38, 1.0)
+    FXThumbnailDelegate.purge_thumbnail_disk_cache()
+
+    _FXThumbnailLoader().load(key)
+
+    stats = FXThumbnailDelegate.thumbnail_disk_cache_stats()
+    assert stats["files"] == 1
+    assert stats["misses"] >= 1
+
+
+def test_a_fresh_session_reads_the_disk_cache_not_the_source(
+    qapp, image_path, monkeypatch
+):
+    key = (image_path, 68, 38, 1.0)
+    _FXThumbnailLoader().load(key)
+    hits = FXThumbnailDelegate.thumbnail_disk_cache_stats()["hits"]
+
+    # A second loader has an empty memory cache, like a relaunched tool
+    decoded = []
+    monkeypatch.setattr(
+        _thumbnail_loader,
+        "_decode_thumbnail",
+        lambda *args: decoded.append(args) or QImage(),
+    )
+    pixmap = _FXThumbnailLoader().load(key)
+
+    assert not decoded
+    assert not pixmap.isNull() and pixmap.width() <= 68
+    assert FXThumbnailDelegate.thumbnail_disk_cache_stats()["hits"] == hits + 1
+
+
+def test_a_changed_source_misses_the_disk_cache(qapp, image_path):
+    key = (image_path, 68, 38, 1.0)
+    cache = _get_disk_cache()
+    before = cache.entry_name(key)
+
+    stat = os.stat(image_path)
+    os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert cache.entry_name(key) != before
+
+
+def test_the_disk_cache_is_bounded_and_evicts_the_oldest(qapp, tmp_path):
+    cache = _FXThumbnailDiskCache(tmp_path / "thumbnails")
+    paths = []
+    for number in range(3):
+        image = QImage(68, 38, QImage.Format_RGB32)
+        image.fill(QColor(number * 80, 10, 10))
+        path = tmp_path / f"frame_{number}.png"
+        image.save(str(path))
+        paths.append(str(path))
+        cache.put((str(path), 68, 38, 1.0), image)
+
+    one = cache.stats()["bytes"] // 3
+    cache.max_bytes = one * 2 + one // 2
+
+    assert cache.stats()["files"] == 2
+    assert cache.get((paths[0], 68, 38, 1.0)) is None
+    assert cache.get((paths[2], 68, 38, 1.0)) is not None
+
+
+def test_purging_empties_the_disk_cache(qapp, image_path):
+    _FXThumbnailLoader().load((image_path, 68, 38, 1.0))
+    assert FXThumbnailDelegate.purge_thumbnail_disk_cache() > 0
+
+    stats = FXThumbnailDelegate.thumbnail_disk_cache_stats()
+    assert stats["files"] == 0 and stats["bytes"] == 0
+
+
+def test_the_disk_cache_can_be_turned_off(qapp, image_path):
+    FXThumbnailDelegate.purge_thumbnail_disk_cache()
+    loader = _FXThumbnailLoader()
+    loader.use_disk_cache = False
+    loader.load((image_path, 68, 38, 1.0))
+
+    assert FXThumbnailDelegate.thumbnail_disk_cache_stats()["files"] == 0
+
+
+def test_a_repaint_reuses_the_finished_tile(qtbot, image_path):
+    tree, delegate = _tree(qtbot, image_path, load_async=False)
+    assert _image_pixels(tree) > 0
+    assert delegate._thumbnail_tiles
+
+    composed = []
+    original = delegate._compose_thumbnail_tile
+    delegate._compose_thumbnail_tile = lambda *args: (
+        composed.append(args) or original(*args)
+    )
+    tree.viewport().repaint()
+
+    assert not composed
+    assert _image_pixels(tree) > 0
+
+
+def test_a_pending_row_does_not_cache_its_empty_frame_as_the_tile(
+    qtbot, image_path
+):
+    tree, delegate = _tree(qtbot, image_path)
+    qtbot.waitUntil(lambda: _image_pixels(tree) > 0)
+
+    keys = [key[0] for key in delegate._thumbnail_tiles]
+    # The shared empty frame and the real tile are separate entries
+    assert image_path in keys
+    assert keys.count(image_path) == 1
+
+
+def test_the_tiles_are_dropped_when_the_theme_changes(qtbot, image_path):
+    tree, delegate = _tree(qtbot, image_path, load_async=False)
+    assert _image_pixels(tree) > 0
+    assert delegate._thumbnail_tiles
+
+    current = fxstyle.get_theme()
+    other = "light" if current != "light" else "dark"
+    try:
+        fxstyle.apply_theme(theme=other)
+        assert not delegate._thumbnail_tiles
+    finally:
+        fxstyle.apply_theme(theme=current)
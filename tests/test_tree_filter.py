@@ -0,0 +1,125 @@
+"""Tests for the subtree matches behind the fuzzy search tree's filter.
+
+Regression: `_FXTreeSortFilterProxyModel.filterAcceptsRow` tested every
+descendant of each row Qt asked about, and Qt asks about every row, so a
+deep hierarchy tested its leaves once per ancestor on every keystroke.
+
+What these tests pin: the rows shown are those of a naive recursive
+filter, each row is tested once per filter text, and inserted, edited and
+removed rows show or hide their ancestors once the event loop is back.
+"""
+
+# Third-party
+import pytest
+from qtpy.QtCore import QModelIndex
+from qtpy.QtGui import QStandardItem, QStandardItemModel
+
+# Internal
+from fxgui.fxwidgets._fuzzy_search_tree import _FXTreeSortFilterProxyModel
+
+
+LEVELS = ("show", "seq", "shot", "task", "version")
+
+
+def _build(parent: QStandardItem, depth: int, path: str) -> None:
+    for number in range(2):
+        name = f"{path}{LEVELS[depth]}{number}"
+        item = QStandardItem(f"{LEVELS[depth]}_{name}_{depth}{number}")
+        parent.appendRow(item)
+        if depth + 1 < len(LEVELS):
+            _build(item, depth + 1, name)
+
+
+@pytest.fixture
+def proxy(qapp):
+    model = QStandardItemModel()
+    _build(model.invisibleRootItem(), 0, "")
+    proxy = _FXTreeSortFilterProxyModel(ratio=0.6)
+    proxy.setSourceModel(model)
+    proxy._test_model = model
+    return proxy
+
+
+def _shown(proxy, parent=QModelIndex()) -> set:
+    names = set()
+    for row in range(proxy.rowCount(parent)):
+        index = proxy.index(row, 0, parent)
+        names.add(index.data())
+        names |= _shown(proxy, index)
+    return names
+
+
+def _naive(proxy, parent=QModelIndex()) -> set:
+    """The rows a filter testing every descendant of every row shows."""
+
+    model = proxy.sourceModel()
+
+    def matches(index) -> bool:
+        text = (index.data() or "").lower()
+        return proxy._text_passes(text) or any(
+            matches(model.index(row, 0, index))
+            for row in range(model.rowCount(index))
+        )
+
+    names = set()
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        if matches(index):
+            names.add(index.data())
+            names |= _naive(proxy, index)
+    return names
+
+
+@pytest.mark.parametrize("query", ["show1seq0shot1", "task1", "version", "zz"])
+def test_the_rows_shown_match_a_naive_recursive_filter(proxy, query):
+    proxy.set_filter_text(query)
+    assert _shown(proxy) == _naive(proxy)
+
+
+def test_each_row_is_tested_once_per_filter_text(proxy, monkeypatch):
+    tested = []
+    original = proxy._text_passes
+    monkeypatch.setattr(
+        proxy, "_text_passes", lambda text: tested.append(text) or original(text)
+    )
+    proxy.set_filter_text("show1seq0shot1task0")
+    _shown(proxy)
+
+    assert tested
+    assert len(tested) == len(set(tested)) == 2 ** (len(LEVELS) + 1) - 2
+
+
+def test_an_edited_row_shows_and_hides_its_ancestors(proxy, qtbot):
+    model = proxy._test_model
+    proxy.set_filter_text("dragon")
+    assert _shown(proxy) == set()
+
+    version = model.item(1).child(0).child(1).child(0).child(0)
+    version.setText("dragon_final")
+    qtbot.waitUntil(lambda: "dragon_final" in _shown(proxy))
+    assert _shown(proxy) == _naive(proxy)
+    assert model.item(1).text() in _shown(proxy)
+
+    version.setText("version_plain")
+    qtbot.waitUntil(lambda: not _shown(proxy))
+    assert _naive(proxy) == set()
+
+
+def test_inserted_and_removed_rows_update_their_ancestors(proxy, qtbot):
+    model = proxy._test_model
+    proxy.set_filter_text("dragon")
+    task = model.item(0).child(1).child(0).child(0)
+
+    # A list, which hands the item over to the model
+    task.insertRow(0, [QStandardItem("dragon_v001")])
+    qtbot.waitUntil(lambda: "dragon_v001" in _shown(proxy))
+    assert _shown(proxy) == _naive(proxy)
+
+    # The rows after the insertion moved down; they are still told apart
+    model.item(0).child(1).insertRow(0, [QStandardItem("shot_new")])
+    qtbot.wait(10)
+    assert _shown(proxy) == _naive(proxy)
+
+    task.removeRow(0)
+    qtbot.waitUntil(lambda: not _shown(proxy))
+    assert _naive(proxy) == set()